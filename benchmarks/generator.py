@@ -0,0 +1,80 @@
+"""Problèmes de référence pour les benchmarks : générateur aléatoire à graine et exemples du cours."""
+from typing import Any, Dict, List
+
+import numpy as np
+
+KINDS = ('bounded', 'unbounded', 'infeasible', 'degenerate')
+SIZES = (2, 10, 100, 1000, 10000)
+
+
+def generate(kind: str, m: int, seed: int = 0) -> Dict[str, Any]:
+    """Problème aléatoire reproductible à m contraintes ({'c', 'A', 'b', 'operators', 'objective_type'}).
+
+    bounded    : contraintes <= à coefficients positifs, région bornée non vide
+    unbounded  : contraintes >= à coefficients positifs, maximisation d'un objectif positif
+    infeasible : région bornée puis une contrainte >= hors d'atteinte
+    degenerate : toutes les droites passent par un même sommet (doublons compris)
+                 et l'objectif est parallèle à l'une d'elles
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Type inconnu: {kind} (choix: {', '.join(KINDS)})")
+    if m < 2:
+        raise ValueError("m doit être >= 2")
+    rng = np.random.default_rng([seed, KINDS.index(kind), m])
+    c = rng.uniform(1, 10, 2).round(3)
+
+    if kind == 'degenerate':
+        point = rng.uniform(1, 10, 2).round(3)
+        A = rng.uniform(0.1, 5, (m, 2)).round(3)
+        A[m // 2:] = A[:m - m // 2]
+        b = A @ point
+        c = A[0] * rng.uniform(1, 3)
+        return {'c': c.tolist(), 'A': A.tolist(), 'b': b.tolist(), 'operators': ['<='] * m,
+                'objective_type': 'max'}
+
+    A = rng.uniform(0.1, 5, (m, 2)).round(3)
+    b = rng.uniform(10, 100, m).round(3)
+    operators = ['<='] * m
+    objective_type = str(rng.choice(['max', 'min']))
+    if kind == 'unbounded':
+        operators = ['>='] * m
+        objective_type = 'max'
+    elif kind == 'infeasible':
+        # Au plus b/a sur chaque axe dans la région : x1 + x2 >= 2 max(b/a) est inatteignable
+        bound = 2 * float(np.max(b[:, None] / A))
+        A[-1] = [1.0, 1.0]
+        b[-1] = round(bound, 3)
+        operators[-1] = '>='
+    return {'c': c.tolist(), 'A': A.tolist(), 'b': b.tolist(), 'operators': operators,
+            'objective_type': objective_type}
+
+
+# Exemples de text.txt, mis en équation (minutes et heures ramenées à la même unité)
+TEXTBOOK = {
+    'exemple1': {  # boîtes en carton : carton, assemblage (200 h), agrafes
+        'c': [3, 5], 'A': [[1, 2], [2, 3], [1, 4]], 'b': [10000, 12000, 15000],
+        'operators': ['<=', '<=', '<='], 'objective_type': 'max'},
+    'exemple2': {  # détecteurs RadarIn : heures d'Amine, Sara et Youssef
+        'c': [2000, 1500], 'A': [[1, 2], [2, 1], [1, 3]], 'b': [20, 30, 15],
+        'operators': ['<=', '<=', '<='], 'objective_type': 'max'},
+    'exemple3': {  # briques : argile, 600 h de travail, cuisson d'au plus 7 000 briques A
+        'c': [2, 4], 'A': [[4, 5], [3, 5], [1, 0]], 'b': [25000, 36000, 7000],
+        'operators': ['<=', '<=', '<='], 'objective_type': 'max'},
+    'exemple4': {  # pièces métalliques : acier, 250 h de façonnage, énergie
+        'c': [20, 32], 'A': [[2, 3], [4, 6], [1, 3]], 'b': [8000, 15000, 10000],
+        'operators': ['<=', '<=', '<='], 'objective_type': 'max'},
+    'exemple5': {  # biscuits : farine, 180 h de four, glaçage
+        'c': [2, 3.5], 'A': [[1.5, 2.5], [2, 3], [1, 3]], 'b': [18000, 10800, 9000],
+        'operators': ['<=', '<=', '<='], 'objective_type': 'max'},
+}
+
+
+def cases(sizes=SIZES, kinds=KINDS, seed: int = 0) -> List[Dict[str, Any]]:
+    """Exemples du cours puis un problème aléatoire par (type, m)."""
+    out = [{'name': name, 'kind': 'textbook', 'm': len(p['b']), 'seed': None, 'problem': p}
+           for name, p in TEXTBOOK.items()]
+    for kind in kinds:
+        for m in sizes:
+            out.append({'name': f'{kind}-{m}', 'kind': kind, 'm': m, 'seed': seed,
+                        'problem': generate(kind, m, seed)})
+    return out
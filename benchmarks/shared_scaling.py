@@ -0,0 +1,101 @@
+"""Passage à l'échelle multi-cœurs : python -m benchmarks.shared_scaling -n 1000000
+
+Compare, pour 1, 2, 4... processus, l'envoi des problèmes en listes sérialisées (pickle)
+à l'exécuteur en mémoire partagée (core.shared.solve_shared) sur le même lot aléatoire.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.batch import solve_many
+from core.shared import solve_shared
+
+# Problèmes par tâche pour la variante sérialisée
+PICKLE_CHUNK = 20_000
+
+
+def random_batch(n: int, m: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return {
+        'c': rng.uniform(-5, 5, (n, 2)),
+        'A': rng.uniform(-5, 5, (n, m, 2)),
+        'b': rng.uniform(-5, 20, (n, m)),
+        'operators': rng.integers(0, 3, (n, m)).astype(np.int8),
+        'objective_type': rng.integers(0, 2, n).astype(np.int8),
+    }
+
+
+def _solve_lists(args):
+    c, A, b, ops, obj = args
+    sol = solve_many({'c': c, 'A': A, 'b': b, 'operators': ops, 'objective_type': obj})
+    return sol['status_code'], sol['x'], sol['z']
+
+
+def solve_pickled(problems, workers: int):
+    """Référence : chaque tâche reçoit ses problèmes en listes Python sérialisées."""
+    n = len(problems['c'])
+
+    def tasks():
+        for s in range(0, n, PICKLE_CHUNK):
+            sl = slice(s, s + PICKLE_CHUNK)
+            yield tuple(problems[key][sl].tolist() for key in ('c', 'A', 'b', 'operators', 'objective_type'))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_solve_lists, tasks()))
+    return {'status_code': np.concatenate([p[0] for p in parts]), 'z': np.concatenate([p[2] for p in parts])}
+
+
+def timed(fn, *args, repeat: int = 1, **kwargs):
+    best, out = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.shared_scaling', description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--problems', type=int, default=1_000_000)
+    parser.add_argument('-m', '--constraints', type=int, default=4)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        help="nombres de processus testés (défaut : 1, 2, 4... jusqu'au nombre de cœurs)")
+    parser.add_argument('--repeat', type=int, default=3, help="meilleur temps sur N répétitions")
+    parser.add_argument('--no-pickle', action='store_true', help="sans la variante sérialisée")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    cores = os.cpu_count() or 1
+    counts = args.workers or sorted({1, cores} | {2 ** k for k in range(1, cores.bit_length()) if 2 ** k <= cores})
+    problems = random_batch(args.problems, args.constraints, args.seed)
+    reference = solve_many(problems)
+
+    rows = []
+    for workers in counts:
+        row = {'workers': workers}
+        seconds, sol = timed(solve_shared, problems, workers=workers, repeat=args.repeat)
+        assert np.array_equal(sol['status_code'], reference['status_code'])
+        row['shared_s'] = round(seconds, 3)
+        row['shared_pps'] = round(args.problems / seconds)
+        if not args.no_pickle:
+            seconds, sol = timed(solve_pickled, problems, workers, repeat=args.repeat)
+            assert np.array_equal(sol['status_code'], reference['status_code'])
+            row['pickle_s'] = round(seconds, 3)
+            row['pickle_pps'] = round(args.problems / seconds)
+        rows.append(row)
+
+    base = rows[0]['shared_s'] * rows[0]['workers']
+    for row in rows:
+        row['speedup'] = round(base / row['shared_s'], 2)
+        row['efficiency'] = round(row['speedup'] / row['workers'], 2)
+    print(json.dumps({'problems': args.problems, 'constraints': args.constraints, 'cores': cores,
+                      'results': rows}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+"""Benchmarks de l'optimiseur, du graphique et de l'export PDF : python -m benchmarks.suite
+
+Chaque cas (exemples de text.txt puis problèmes aléatoires à graine fixe, m = 2 à 10 000) est
+chronométré étape par étape : optimize, find_extreme_points_manual, create_plot, generate_pdf.
+Les résultats sont écrits en JSON et comparés à benchmarks/baseline.json : une étape plus lente
+que la référence au-delà de la tolérance, ou un statut / z différent, fait échouer la commande.
+Les temps ne sont comparés que si la référence vient du même environnement (machine, processeur,
+versions de Python, numpy, scipy, matplotlib) ; sinon seuls les résultats le sont, et la commande
+échoue (code 2) en indiquant comment enregistrer une référence pour cette machine.
+
+    python -m benchmarks.suite                      # mesure et compare
+    python -m benchmarks.suite --quick              # m <= 100, moins de répétitions
+    python -m benchmarks.suite --update-baseline    # enregistre la référence (machine de référence)
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.generator import KINDS, SIZES, cases
+from core.optimizer import LinearProgrammingOptimizer
+
+STAGES = ('optimize', 'extreme_points', 'create_plot', 'generate_pdf')
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# Graphique et PDF jusqu'à cette taille seulement : une droite et une entrée de légende par contrainte,
+# le rendu des légendes de milliers d'entrées prend des minutes (--plot-max-m pour le mesurer)
+PLOT_MAX_M = 100
+# Mesures de generate_pdf par cas, après l'appel de chauffe (rendu à 180 dpi : plusieurs secondes chacune)
+PDF_RUNS = 1
+# Appels non chronométrés avant chaque mesure (imports, polices, caches de matplotlib et fpdf)
+WARMUP = 1
+# Une étape est répétée jusqu'à min_time secondes cumulées (entre min_runs et max_runs fois)
+MIN_TIME = 0.5
+MIN_RUNS = 3
+MAX_RUNS = 50
+# Régression : minimum > référence x TOLERANCE et plus lent d'au moins FLOOR_MS (le minimum est
+# moins sensible que la médiane à la charge de la machine)
+TOLERANCE = 1.5
+FLOOR_MS = 2.0
+# Champs de meta qui doivent être identiques pour comparer des temps absolus
+ENVIRONMENT_KEYS = ('machine', 'cpu', 'python', 'numpy', 'scipy', 'matplotlib')
+
+
+def cpu_model() -> str:
+    """Nom du processeur (/proc/cpuinfo sous Linux, platform.processor() ailleurs)."""
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or 'inconnu'
+
+
+def measure(fn: Callable[[Any], Any], setup: Optional[Callable[[], Any]] = None, min_runs: int = MIN_RUNS,
+            max_runs: int = MAX_RUNS, min_time: float = MIN_TIME, warmup: int = WARMUP) -> Dict[str, Any]:
+    """Médiane et minimum de fn(setup()) en ms, après warmup appels ; setup n'est pas chronométré."""
+    for _ in range(warmup):
+        fn(setup() if setup else None)
+    times = []
+    while len(times) < min_runs or (len(times) < max_runs and sum(times) < min_time):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        fn(state)
+        times.append(time.perf_counter() - start)
+    return {'median_ms': round(statistics.median(times) * 1000, 3),
+            'min_ms': round(min(times) * 1000, 3), 'runs': len(times)}
+
+
+def run_case(case: Dict[str, Any], plot_max_m: int = PLOT_MAX_M, **opts) -> Dict[str, Any]:
+    from core.plotting import create_plot
+    from pdf_export import generate_pdf
+
+    p = case['problem']
+
+    # Un nouvel optimiseur par mesure : les sommets sont mis en cache après le premier appel
+    def optimizer():
+        return LinearProgrammingOptimizer(p['c'], p['A'], p['b'], p['operators'], p['objective_type'])
+
+    result = optimizer().optimize()
+    stages = {'optimize': measure(lambda opt: opt.optimize(), optimizer, **opts),
+              'extreme_points': measure(lambda opt: opt.find_extreme_points_manual(), optimizer, **opts)}
+
+    if case['m'] <= plot_max_m:
+        def plot(_=None):
+            return create_plot(p['A'], p['b'], result.get('x') if result.get('success') else None,
+                               p['c'], p['objective_type'], p['operators'],
+                               optimal_points=result.get('optimal_points', []),
+                               region_bounded=bool(result.get('region_bounded', True)),
+                               status=result.get('status', 'optimal'), solver_result=result)
+
+        def pdf(fig):
+            generate_pdf(result, p['c'], p['A'], p['b'], p['operators'], p['objective_type'], fig)
+
+        # Glyphes absents, tight_layout impossible avec des milliers d'entrées de légende : sans intérêt ici
+        with warnings.catch_warnings(), tempfile.TemporaryDirectory() as tmp:
+            warnings.simplefilter('ignore', UserWarning)
+            stages['create_plot'] = measure(plot, **opts)
+            # generate_pdf écrit dans le répertoire courant ; une mesure dure des secondes
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                stages['generate_pdf'] = measure(pdf, plot, min_runs=PDF_RUNS, max_runs=PDF_RUNS)
+            finally:
+                os.chdir(cwd)
+
+    return {'kind': case['kind'], 'm': case['m'], 'seed': case['seed'], 'status': result['status'],
+            'solution_type': result['solution_type'], 'z': result['z'], 'stages': stages}
+
+
+def run(sizes=SIZES, kinds=KINDS, seed: int = 0, plot_max_m: int = PLOT_MAX_M, only: Optional[str] = None,
+        verbose: bool = True, **opts) -> Dict[str, Any]:
+    results = {}
+    for case in cases(sizes, kinds, seed):
+        if only and not fnmatch(case['name'], only):
+            continue
+        results[case['name']] = entry = run_case(case, plot_max_m, **opts)
+        if verbose:
+            timings = '  '.join(f"{stage} {entry['stages'][stage]['min_ms']:.1f}"
+                                for stage in STAGES if stage in entry['stages'])
+            print(f"{case['name']:<18} {entry['status']:<11} {timings} ms", file=sys.stderr)
+    import matplotlib
+    import scipy
+    return {
+        'meta': {'date': datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(),
+                 'numpy': np.__version__, 'scipy': scipy.__version__, 'matplotlib': matplotlib.__version__,
+                 'machine': f"{platform.system()} {platform.machine()} ({os.cpu_count()} cœurs)",
+                 'cpu': cpu_model(),
+                 'seed': seed, 'sizes': list(sizes), 'plot_max_m': plot_max_m},
+        'cases': results,
+    }
+
+
+def _same_z(a, b) -> bool:
+    if a is None or b is None:
+        return a is b
+    return math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-9)
+
+
+def environment_mismatch(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Champs ENVIRONMENT_KEYS de meta qui diffèrent entre current et baseline (absents compris)."""
+    cur, ref = current.get('meta', {}), baseline.get('meta', {})
+    return [f"{key}: {ref.get(key, '?')} -> {cur.get(key, '?')}"
+            for key in ENVIRONMENT_KEYS if cur.get(key) != ref.get(key)]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = TOLERANCE,
+            floor_ms: float = FLOOR_MS, timings: bool = True) -> List[str]:
+    """Régressions de current par rapport à baseline (cas présents des deux côtés, même graine).
+
+    timings=False : seuls les résultats (statut, z) sont comparés.
+    """
+    problems = []
+    for name, cur in current['cases'].items():
+        ref = baseline['cases'].get(name)
+        if ref is None or ref.get('seed') != cur.get('seed'):
+            continue
+        if cur['status'] != ref['status'] or not _same_z(cur['z'], ref['z']):
+            problems.append(f"{name}: résultat changé ({ref['status']}, z={ref['z']} -> "
+                            f"{cur['status']}, z={cur['z']})")
+        if not timings:
+            continue
+        for stage, timing in cur['stages'].items():
+            ref_timing = ref['stages'].get(stage)
+            if ref_timing is None:
+                continue
+            now, before = timing['min_ms'], ref_timing['min_ms']
+            if now > before * tolerance and now - before > floor_ms:
+                problems.append(f"{name} / {stage}: {before:.1f} -> {now:.1f} ms (x{now / before:.2f})")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite',
+                                     description=__doc__.splitlines()[0],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-o', '--output', help="fichier JSON des résultats (défaut : sortie standard)")
+    parser.add_argument('--baseline', default=BASELINE, help="référence à comparer")
+    parser.add_argument('--update-baseline', action='store_true', help="écrit les résultats comme référence")
+    parser.add_argument('--quick', action='store_true', help="m <= 100 et moins de répétitions")
+    parser.add_argument('--sizes', type=int, nargs='+', help=f"valeurs de m (défaut : {' '.join(map(str, SIZES))})")
+    parser.add_argument('--only', help="seulement les cas dont le nom correspond (motif : 'bounded-*', 'exemple?')")
+    parser.add_argument('--plot-max-m', type=int, default=PLOT_MAX_M,
+                        help="m maximal pour create_plot et generate_pdf")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help="ralentissement toléré (ratio)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or ((2, 10, 100) if args.quick else SIZES)
+    opts = {'min_runs': 1, 'max_runs': 5, 'min_time': 0.1} if args.quick else {}
+    report = run(sizes, seed=args.seed, plot_max_m=args.plot_max_m, only=args.only, **opts)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"Référence enregistrée : {args.baseline}", file=sys.stderr)
+        return 0
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️ Pas de référence ({args.baseline}) : rien à comparer", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    mismatch = environment_mismatch(report, baseline)
+    regressions = compare(report, baseline, args.tolerance, timings=not mismatch)
+    if regressions:
+        print("\n" + "=" * 60, file=sys.stderr)
+        print(f"❌ {len(regressions)} RÉGRESSION(S) par rapport à {args.baseline}", file=sys.stderr)
+        print("=" * 60, file=sys.stderr)
+        for line in regressions:
+            print(f"  - {line}", file=sys.stderr)
+        return 1
+    if mismatch:
+        print("\n" + "=" * 60, file=sys.stderr)
+        print(f"⚠️ TEMPS NON COMPARÉS : {args.baseline} a été mesurée dans un autre environnement", file=sys.stderr)
+        print("=" * 60, file=sys.stderr)
+        for line in mismatch:
+            print(f"  - {line}", file=sys.stderr)
+        print("Résultats (statut, z) identiques. Pour une référence de cette machine :\n"
+              "  python -m benchmarks.suite --update-baseline --baseline <fichier>\n"
+              "puis comparez avec --baseline <fichier> (sans --baseline : remplace la référence du dépôt).",
+              file=sys.stderr)
+        return 2
+    print(f"✅ Aucune régression (tolérance x{args.tolerance:g})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
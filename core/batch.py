@@ -0,0 +1,181 @@
+from typing import Dict, Iterable, Any
+
+import numpy as np
+
+from core.kernels import pairwise_intersections, feasible_mask
+
+# Codes compacts des opérateurs et des types d'objectif pour les tableaux empilés
+OP_CODES = {'<=': 0, '>=': 1, '=': 2}
+OBJ_CODES = {'max': 0, 'min': 1}
+
+# Noms des codes de statut et de type de solution ; 'error' (échec du solveur) n'est produit que
+# par l'optimiseur exact (core.shared, kernel='optimizer'), jamais par solve_many
+STATUS_NAMES = np.array(['optimal', 'infeasible', 'unbounded', 'error'])
+SOLUTION_TYPES = np.array(['unique', 'infinite_edge', 'no_solution', 'unbounded_no_finite', 'error'])
+
+# Nombre de coefficients (problèmes x paires x demi-plans) traités par bloc
+BATCH_BUDGET = 4_000_000
+
+
+def _as_codes(values, table: Dict[str, int], name: str) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype.kind in 'iub':
+        return arr.astype(np.int8)
+    codes = np.full(arr.shape, -1, dtype=np.int8)
+    for key, code in table.items():
+        codes[arr == key] = code
+    if np.any(codes < 0):
+        raise ValueError(f"{name} invalide: {set(arr[codes < 0].ravel().tolist())}")
+    return codes
+
+
+def stack_problems(problems: Iterable[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Empile des problèmes au format de LLMExtractor en tableaux pour solve_many.
+
+    Chaque problème : {'objective_type', 'c': [c1, c2], 'constraints': [{'a', 'b', 'op', 'c'}]}.
+    Les contraintes sont complétées jusqu'au plus grand m et masquées.
+    """
+    problems = list(problems)
+    n = len(problems)
+    m = max((len(p['constraints']) for p in problems), default=0)
+
+    c = np.zeros((n, 2))
+    A = np.zeros((n, m, 2))
+    b = np.zeros((n, m))
+    operators = np.zeros((n, m), dtype=np.int8)
+    mask = np.zeros((n, m), dtype=bool)
+    objective_type = np.zeros(n, dtype=np.int8)
+
+    for k, p in enumerate(problems):
+        c[k] = [float(p['c'][0]), float(p['c'][1])]
+        objective_type[k] = OBJ_CODES[p.get('objective_type', 'max')]
+        for i, cons in enumerate(p['constraints']):
+            A[k, i] = [float(cons['a']), float(cons['b'])]
+            b[k, i] = float(cons['c'])
+            operators[k, i] = OP_CODES[cons['op']]
+            mask[k, i] = True
+
+    return {'c': c, 'A': A, 'b': b, 'operators': operators,
+            'objective_type': objective_type, 'mask': mask}
+
+
+def _build_halfplanes(A, b, ops, mask):
+    """Forme a·x <= b empilée : (N, n, 2), (N, n) et le label de chaque demi-plan."""
+    N, m = b.shape
+    sign = np.where(ops == OP_CODES['>='], -1.0, 1.0) * mask
+    planes = [A * sign[..., None]]
+    rhs = [b * sign]
+    labels = [np.arange(m)]
+
+    eq = (ops == OP_CODES['=']) & mask
+    if np.any(eq):
+        planes.append(np.where(eq[..., None], -A, 0.0))
+        rhs.append(np.where(eq, -b, 0.0))
+        labels.append(np.arange(m))
+
+    planes.append(np.broadcast_to(np.array([[-1.0, 0.0], [0.0, -1.0]]), (N, 2, 2)))
+    rhs.append(np.zeros((N, 2)))
+    labels.append(np.array([-1, -2]))
+
+    return np.concatenate(planes, axis=1), np.concatenate(rhs, axis=1), np.concatenate(labels)
+
+
+def _solve_chunk(c, A_all, b_all, labels, sense, eps_feas, atol, rtol):
+    count = len(c)
+
+    pts, ok, (pi, pj) = pairwise_intersections(A_all, b_all)
+    valid = ok & feasible_mask(pts, A_all, b_all, eps=eps_feas)
+    feasible = valid.any(axis=1)
+
+    # Meilleur sommet : argmax de sense·c·x sur les sommets admissibles
+    z_all = np.einsum('npk,nk->np', pts, c)
+    score = np.where(valid, z_all * sense[:, None], -np.inf)
+    best = np.argmax(score, axis=1)
+    rows = np.arange(count)
+    x = pts[rows, best]
+    z = z_all[rows, best]
+
+    # Cône de récession : les rayons extrêmes sont portés par les droites des contraintes
+    norms = np.hypot(A_all[..., 0], A_all[..., 1])
+    safe = np.where(norms > 0, norms, 1.0)
+    t = np.stack([-A_all[..., 1], A_all[..., 0]], axis=-1) / safe[..., None]
+    dirs = np.concatenate([t, -t], axis=1)
+    dir_ok = np.concatenate([norms > 0, norms > 0], axis=1)
+    slack = dirs @ np.swapaxes(A_all, -1, -2)
+    dir_ok &= np.all(slack <= 1e-9 * norms[:, None, :], axis=-1)
+    bounded = feasible & ~dir_ok.any(axis=1)
+
+    c_norm = np.maximum(1.0, np.hypot(c[:, 0], c[:, 1]))
+    gain = np.einsum('ndk,nk->nd', dirs, c) * sense[:, None]
+    unbounded = feasible & np.any(dir_ok & (gain > 1e-9 * c_norm[:, None]), axis=1)
+    optimal_ray = np.any(dir_ok & (np.abs(gain) <= 1e-9 * c_norm[:, None]), axis=1)
+
+    # Plusieurs sommets optimaux distincts -> arête optimale
+    tol = atol + rtol * np.maximum(1.0, np.abs(z))
+    near = valid & (np.abs(z_all - z[:, None]) <= tol[:, None])
+    dist = np.max(np.where(near, np.abs(pts - x[:, None, :]).max(axis=-1), 0.0), axis=1)
+    multiple = dist > 1e-7
+
+    status = np.where(~feasible, 1, np.where(unbounded, 2, 0)).astype(np.int8)
+    solution_type = np.where(status == 1, 2, np.where(status == 2, 3,
+                             np.where(multiple | optimal_ray, 1, 0))).astype(np.int8)
+
+    solved = status == 0
+    x = np.where(solved[:, None], x, np.nan)
+    z = np.where(solved, z, np.nan)
+    basis = np.stack([labels[pi[best]], labels[pj[best]]], axis=1)
+    basis = np.where(solved[:, None], basis, -3)
+    return status, x, z, solution_type, bounded, basis
+
+
+def solve_many(problems: Dict[str, Any], eps_feas: float = 1e-8,
+               atol: float = 1e-3, rtol: float = 1e-6) -> Dict[str, np.ndarray]:
+    """Résout en une fois un lot de programmes linéaires à deux variables.
+
+    problems : dictionnaire de tableaux empilés
+        c (N, 2), A (N, m, 2), b (N, m), operators (N, m) ('<=', '>=', '=' ou codes),
+        objective_type (N,) ('max'/'min' ou codes), mask (N, m) optionnel.
+    Retourne des tableaux colonnes : status, x (N, 2), z, solution_type, bounded
+    (status_code et solution_type_code : les mêmes en codes int8) et basis (les deux contraintes qui définissent x*, -1/-2 pour x1/x2 >= 0).
+    """
+    c = np.asarray(problems['c'], dtype=float).reshape(-1, 2)
+    N = len(c)
+    A = np.asarray(problems['A'], dtype=float).reshape(N, -1, 2)
+    m = A.shape[1]
+    b = np.asarray(problems['b'], dtype=float).reshape(N, m)
+    ops = _as_codes(problems['operators'], OP_CODES, 'Opérateur').reshape(N, m)
+    obj = _as_codes(problems.get('objective_type', np.zeros(N, dtype=np.int8)), OBJ_CODES,
+                    'objective_type').reshape(-1)
+    obj = np.broadcast_to(obj, (N,))
+    mask = problems.get('mask')
+    mask = np.ones((N, m), dtype=bool) if mask is None else np.asarray(mask, dtype=bool).reshape(N, m)
+
+    sense = np.where(obj == OBJ_CODES['min'], -1.0, 1.0)
+    A_all, b_all, labels = _build_halfplanes(A, b, ops, mask)
+    n = A_all.shape[1]
+    per_problem = max(1, n * (n - 1) // 2 * n)
+    step = max(1, BATCH_BUDGET // per_problem)
+
+    status = np.empty(N, dtype=np.int8)
+    solution_type = np.empty(N, dtype=np.int8)
+    x = np.empty((N, 2))
+    z = np.empty(N)
+    bounded = np.empty(N, dtype=bool)
+    basis = np.empty((N, 2), dtype=np.int64)
+
+    for s in range(0, N, step):
+        sl = slice(s, min(N, s + step))
+        (status[sl], x[sl], z[sl], solution_type[sl],
+         bounded[sl], basis[sl]) = _solve_chunk(c[sl], A_all[sl], b_all[sl], labels, sense[sl],
+                                               eps_feas, atol, rtol)
+
+    return {
+        'status': STATUS_NAMES[status],
+        'status_code': status,
+        'x': x,
+        'z': z,
+        'solution_type': SOLUTION_TYPES[solution_type],
+        'solution_type_code': solution_type,
+        'bounded': bounded,
+        'basis': basis,
+    }
@@ -0,0 +1,358 @@
+import copy
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core import instrument
+from core.optimizer import LinearProgrammingOptimizer, solve_linear_program
+from core.presolve import conflict_message
+
+# Nombre de décimales conservées pour comparer des lignes normalisées
+CANONICAL_DECIMALS = 12
+
+
+class LRUCache:
+    """Dictionnaire borné, évince l'entrée la moins récemment utilisée."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = max(0, int(maxsize))
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        if self.maxsize == 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def items(self):
+        return list(self._data.items())
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+def canonicalize_problem(c, A, b, operators, objective_type: str = 'max'):
+    """Forme canonique d'un problème, indépendante de l'ordre et de l'échelle des lignes.
+
+    Chaque '>=' devient '<=', chaque ligne est divisée par la norme de a (et, pour '=',
+    orientée pour que le premier coefficient non nul soit positif), les lignes
+    nulles toujours vraies sont retirées, puis les lignes sont triées et dédoublonnées.
+
+    Retourne (canonical, row_map, scales) : canonical = (c, A, b, operators, objective_type),
+    row_map[i] = indice canonique de la ligne i (-1 si retirée) et
+    ligne_i = scales[i] * ligne_canonique.
+    """
+    c = np.asarray(c, dtype=float).reshape(2)
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    ops = list(operators)
+    m = len(b)
+
+    sign = np.array([-1.0 if op == '>=' else 1.0 for op in ops]).reshape(-1)
+    is_eq = np.array([op == '=' for op in ops], dtype=bool).reshape(-1)
+    norms = np.hypot(A[:, 0], A[:, 1])
+    zero = norms <= 1e-12
+
+    # Égalités : orienter la normale (premier coefficient non nul positif)
+    lead = np.where(np.abs(A[:, 0]) > 1e-12, A[:, 0], A[:, 1])
+    sign = np.where(is_eq & (lead < 0), -1.0, sign)
+    scales = np.where(zero, 1.0, norms) * sign
+
+    A_c = A / scales[:, None]
+    b_c = b / scales
+
+    # Lignes nulles : 0 <= b (ou 0 = b) toujours vraie -> retirée ; sinon gardée telle quelle
+    trivial = zero & np.where(is_eq, np.abs(b) <= 1e-12, b_c >= 0)
+    keep = np.flatnonzero(~trivial)
+
+    rows = np.column_stack([A_c[keep], b_c[keep], is_eq[keep].astype(float)]) if len(keep) else np.zeros((0, 4))
+    rows = np.round(rows, CANONICAL_DECIMALS) + 0.0
+    uniq, inverse = np.unique(rows, axis=0, return_inverse=True)
+
+    row_map = np.full(m, -1, dtype=int)
+    row_map[keep] = np.asarray(inverse).reshape(-1)
+    canonical = (
+        np.round(c, CANONICAL_DECIMALS) + 0.0,
+        uniq[:, :2],
+        uniq[:, 2],
+        ['=' if e else '<=' for e in uniq[:, 3]],
+        (objective_type or 'max').lower(),
+    )
+    return canonical, row_map, scales
+
+
+def problem_key(canonical, backend: str = 'highs') -> str:
+    c, A, b, ops, objective_type = canonical
+    h = hashlib.blake2b(digest_size=20)
+    for arr in (c, A, b):
+        h.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+        h.update(b'|')
+    h.update(''.join('e' if op == '=' else 'l' for op in ops).encode())
+    h.update(f"|{objective_type}|{backend}".encode())
+    return h.hexdigest()
+
+
+def _raw_key(c, A, b, operators, objective_type, backend) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    for arr in (c, A, b):
+        h.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+        h.update(b'|')
+    h.update(f"{','.join(operators)}|{objective_type}|{backend}".encode())
+    return h.hexdigest()
+
+
+def _remap_geometry(geometry: Dict[str, Any], row_map) -> Dict[str, Any]:
+    """Labels de la géométrie : ligne canonique -> première ligne d'origine qui s'y ramène."""
+    first: Dict[int, int] = {}
+    for i, k in enumerate(np.asarray(row_map).tolist()):
+        if k >= 0:
+            first.setdefault(k, i)
+
+    def tr(lab):
+        return first.get(lab, lab) if lab is not None and lab >= 0 else lab
+    geometry['edge_constraints'] = [tr(lab) for lab in geometry['edge_constraints']]
+    geometry['rays'] = [(o, d, tr(lab)) for o, d, lab in geometry['rays']]
+    return geometry
+
+
+def _remap_presolve(summary: Dict[str, Any], row_map) -> Dict[str, Any]:
+    """Ramène le résumé de présolution des lignes canoniques aux lignes d'origine."""
+    first: Dict[int, int] = {}
+    removed: List[Tuple[int, str]] = []
+    for i, k in enumerate(np.asarray(row_map).tolist()):
+        if k < 0:
+            removed.append((i, 'zero'))
+        elif k in first:
+            removed.append((i, 'duplicate'))
+        else:
+            first[k] = i
+    removed.extend((first[k], reason) for k, reason in summary['removed'])
+    conflict = summary['conflict']
+    if conflict is not None:
+        conflict = tuple(sorted(first.get(k, k) for k in conflict))
+    return {'row_map': [first[k] for k in summary['row_map']], 'removed': sorted(removed),
+            'conflict': conflict}
+
+
+def _encode(value):
+    """Résultat -> valeur JSON : tuples et tableaux NumPy marqués pour être restitués à l'identique."""
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode(v) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return {'__array__': value.tolist(), 'dtype': value.dtype.str}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode(obj):
+    if '__tuple__' in obj:
+        return tuple(obj['__tuple__'])
+    if '__array__' in obj:
+        return np.array(obj['__array__'], dtype=np.dtype(obj['dtype']))
+    return obj
+
+
+class SolveCache:
+    """Cache des résultats de solve_linear_program sur la forme canonique du problème.
+
+    maxsize : nombre d'entrées gardées en mémoire (LRU)
+    path    : fichier de persistance optionnel (chargé à la création, écrit par save()) ; du JSON,
+              jamais exécuté au chargement : un fichier illisible ou d'un autre format est ignoré
+    """
+
+    def __init__(self, maxsize: int = 256, path: Optional[str] = None):
+        self.lru = LRUCache(maxsize)
+        # Entrée brute -> clé canonique : une re-résolution à l'identique évite la canonicalisation
+        self._aliases = LRUCache(4 * max(1, int(maxsize)))
+        # Entrée brute -> résultat déjà ramené à ses lignes, gardé sérialisé (immuable) : une re-résolution
+        # à l'identique est une recherche et une désérialisation, sans reconstruire d'optimiseur
+        self._remapped = LRUCache(maxsize)
+        self.path = path
+        if path and os.path.exists(path):
+            self.load(path)
+
+    @property
+    def hits(self) -> int:
+        return self.lru.hits
+
+    @property
+    def misses(self) -> int:
+        return self.lru.misses
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self.lru), 'maxsize': self.lru.maxsize}
+
+    def solve(self, c, A, b, operators, objective_type: str = 'max', backend: str = 'highs') -> Dict:
+        """Résultat de solve_linear_program, propre à l'appelant (aucun objet partagé avec le cache)."""
+        with instrument.recording() as rec:
+            result = self._solve(c, A, b, operators, objective_type, backend)
+        return instrument.attach(rec, result)
+
+    def _solve(self, c, A, b, operators, objective_type, backend) -> Dict:
+        raw = _raw_key(c, A, b, operators, objective_type, backend)
+        remapped = self._remapped.get(raw)
+        # Valable tant que l'entrée canonique est en cache (clear() ou éviction l'invalident) ;
+        # un seul get sur self.lru par appel : chaque appel compte une fois (succès ou échec)
+        if remapped is not None and remapped[0] in self.lru:
+            self.lru.get(remapped[0])
+            instrument.count('cache_hits')
+            return pickle.loads(remapped[1])
+        canonical = None
+        alias = self._aliases.get(raw)
+        if alias is None:
+            canonical, row_map, _ = canonicalize_problem(c, A, b, operators, objective_type)
+            alias = (problem_key(canonical, backend), row_map)
+            self._aliases.put(raw, alias)
+        key, row_map = alias
+        result = self.lru.get(key)
+        instrument.count('cache_hits' if result is not None else 'cache_misses')
+        if result is None:
+            if canonical is None:
+                canonical, _, _ = canonicalize_problem(c, A, b, operators, objective_type)
+            c_c, A_c, b_c, ops_c, obj_c = canonical
+            # Sans sensibilité : elle dépend de l'échelle des lignes et n'est calculée que sur les lignes d'origine
+            result = solve_linear_program(c_c, A_c, b_c, ops_c, obj_c, backend=backend, sensitivity=False)
+            self.lru.put(key, result)
+        result = copy.deepcopy(result)
+        if 'active_constraints' in result:
+            # Ligne canonique -> toutes les lignes d'origine qui s'y ramènent
+            canon = np.asarray(row_map)
+            rows = np.flatnonzero(np.isin(canon, [k for k in result['active_constraints'] if k >= 0]))
+            result['active_constraints'] = rows.tolist() + [k for k in result['active_constraints'] if k < 0]
+        if 'geometry' in result:
+            result['geometry'] = _remap_geometry(result['geometry'], row_map)
+        if 'active_constraints' in result:
+            # Duals et intervalles dépendent de l'échelle des lignes : calculés sur les lignes d'origine en x*
+            with instrument.phase('sensitivity'):
+                result['sensitivity'] = LinearProgrammingOptimizer(c, A, b, operators,
+                                                                   objective_type).sensitivity(result['x'])
+        if 'presolve' in result:
+            result['presolve'] = _remap_presolve(result['presolve'], row_map)
+            if result['presolve']['conflict'] is not None:
+                result['message'] = conflict_message(result['presolve']['conflict'])
+        self._remapped.put(raw, (key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)))
+        return result
+
+    def clear(self):
+        self.lru.clear()
+        self._remapped.clear()
+
+    def load(self, path: Optional[str] = None):
+        path = path or self.path
+        try:
+            with open(path, encoding='utf-8') as f:
+                entries: List[Tuple[str, Any]] = json.load(f, object_hook=_decode)
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, list):
+            return
+        for entry in entries[-self.lru.maxsize:] if self.lru.maxsize else []:
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str) and isinstance(entry[1], dict):
+                self.lru.put(entry[0], entry[1])
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        if not path:
+            return
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump([[key, _encode(value)] for key, value in self.lru.items()], f)
+        os.replace(tmp, path)
+
+
+def region_key(A, b, operators) -> str:
+    """Clé de la région admissible : les lignes telles quelles (les labels de la région sont leurs indices)."""
+    h = hashlib.blake2b(digest_size=20)
+    for arr in (A, b):
+        h.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+        h.update(b'|')
+    h.update(','.join(operators).encode())
+    return h.hexdigest()
+
+
+class RegionCache:
+    """Régions admissibles par (A, b, operators), pour les changements d'objectif seul.
+
+    Chaque entrée garde un optimiseur 'region' : polygone, sommets triés et cône de
+    récession sont calculés une fois ; un nouvel objectif ne coûte qu'un argmax en O(k).
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.lru = LRUCache(maxsize)
+
+    def optimizer(self, A, b, operators) -> LinearProgrammingOptimizer:
+        A = np.asarray(A, dtype=float).reshape(-1, 2)
+        b = np.asarray(b, dtype=float).reshape(-1)
+        key = region_key(A, b, operators)
+        optimizer = self.lru.get(key)
+        if optimizer is None:
+            optimizer = LinearProgrammingOptimizer(np.zeros(2), A, b, operators, backend='region')
+            optimizer.compute_feasible_region()
+            self.lru.put(key, optimizer)
+        return optimizer
+
+    def optimize(self, c, A, b, operators, objective_type: str = 'max') -> Dict:
+        optimizer = self.optimizer(A, b, operators)
+        optimizer.set_objective(c, objective_type)
+        return optimizer.optimize()
+
+    def clear(self):
+        self.lru.clear()
+
+
+_default_cache = SolveCache()
+_default_regions = RegionCache()
+
+
+def configure_cache(maxsize: int = 256, path: Optional[str] = None) -> SolveCache:
+    """Remplace le cache par défaut (taille et fichier de persistance)."""
+    global _default_cache
+    _default_cache = SolveCache(maxsize=maxsize, path=path)
+    return _default_cache
+
+
+def get_cache() -> SolveCache:
+    return _default_cache
+
+
+def solve_linear_program_cached(c: List[float], A: List[List[float]], b: List[float],
+                                operators: List[str], objective_type: str = 'max',
+                                backend: str = 'highs') -> Dict:
+    """solve_linear_program mémoïsé : un problème déjà vu (à l'ordre/échelle des lignes près) est servi depuis le cache."""
+    return _default_cache.solve(c, A, b, operators, objective_type, backend=backend)
+
+
+def optimize_objective(c: List[float], A: List[List[float]], b: List[float],
+                       operators: List[str], objective_type: str = 'max') -> Dict:
+    """Résout en réutilisant la région déjà construite pour (A, b, operators) : pour les balayages d'objectif."""
+    return _default_regions.optimize(c, A, b, operators, objective_type)
@@ -0,0 +1,253 @@
+"""Format colonne sur disque pour de grands lots de problèmes à deux variables.
+
+Un lot est un répertoire de fichiers .npy (lisibles par np.load, projetables avec mmap_mode='r')
+et d'un meta.json :
+
+    c.npy               (N, 2)     float64
+    A.npy               (N, m, 2)  float64  contraintes complétées par des zéros jusqu'à m
+    b.npy               (N, m)     float64
+    operators.npy       (N, m)     int8     0 '<=', 1 '>=', 2 '=' (OP_CODES)
+    objective_type.npy  (N,)       int8     0 'max', 1 'min' (OBJ_CODES)
+    rows.npy            (N,)       int32    nombre de contraintes réelles de chaque problème
+
+Les résultats s'écrivent de la même façon (status, solution_type, x, z).
+"""
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from core.batch import OBJ_CODES, OP_CODES, _as_codes, solve_many, stack_problems
+from utils.validators import validate_problem
+
+FORMAT = 'solveur-pl/columns'
+VERSION = 1
+# Problèmes par bloc lu, converti ou résolu
+CHUNK_SIZE = 100_000
+# Taille fixe de l'en-tête .npy : réécrit en place à la fermeture avec le nombre final de lignes
+HEADER_SIZE = 128
+
+OPERATOR_NAMES = {code: op for op, code in OP_CODES.items()}
+OBJECTIVE_NAMES = {code: obj for obj, code in OBJ_CODES.items()}
+
+
+def problem_columns(max_rows: int) -> Dict[str, Tuple[str, Tuple[int, ...]]]:
+    return {'c': ('<f8', (2,)), 'A': ('<f8', (max_rows, 2)), 'b': ('<f8', (max_rows,)),
+            'operators': ('|i1', (max_rows,)), 'objective_type': ('|i1', ()), 'rows': ('<i4', ())}
+
+
+RESULT_COLUMNS = {'status': ('|i1', ()), 'solution_type': ('|i1', ()), 'x': ('<f8', (2,)), 'z': ('<f8', ())}
+
+
+def _write_header(f, descr: str, shape: Tuple[int, ...]):
+    header = repr({'descr': descr, 'fortran_order': False, 'shape': shape}).encode('latin-1')
+    size = HEADER_SIZE - 10
+    if len(header) >= size:
+        raise ValueError(f"En-tête .npy trop long pour {shape}")
+    f.write(b'\x93NUMPY\x01\x00' + size.to_bytes(2, 'little') + header.ljust(size - 1) + b'\n')
+
+
+class ColumnWriter:
+    """Écrit des colonnes par blocs ajoutés en fin de fichier, sans connaître N à l'avance.
+
+    columns : {nom: (dtype numpy, forme d'une ligne)}. Chaque .npy reçoit un en-tête de taille
+    fixe, réécrit à la fermeture avec le nombre de lignes écrites ; meta.json est écrit en dernier
+    (un répertoire sans meta.json est un lot incomplet).
+    """
+
+    def __init__(self, path: str, columns: Dict[str, Tuple[str, Tuple[int, ...]]], kind: str,
+                 **meta: Any):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.columns = columns
+        self.meta = {'format': FORMAT, 'version': VERSION, 'kind': kind, **meta}
+        self.count = 0
+        meta_path = os.path.join(path, 'meta.json')
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        self.files = {}
+        for name, (descr, shape) in columns.items():
+            f = open(os.path.join(path, f'{name}.npy'), 'wb')
+            _write_header(f, descr, (0,) + shape)
+            self.files[name] = f
+
+    def append(self, **arrays: np.ndarray):
+        n = None
+        for name, (descr, shape) in self.columns.items():
+            arr = np.ascontiguousarray(arrays[name], dtype=np.dtype(descr))
+            if arr.shape[1:] != shape or (n is not None and len(arr) != n):
+                raise ValueError(f"Colonne {name}: forme {arr.shape} incompatible avec (N,) + {shape}")
+            n = len(arr)
+            arr.tofile(self.files[name])
+        self.count += n or 0
+
+    def close(self):
+        for name, (descr, shape) in self.columns.items():
+            f = self.files[name]
+            f.seek(0)
+            _write_header(f, descr, (self.count,) + shape)
+            f.close()
+        with open(os.path.join(self.path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({**self.meta, 'count': self.count,
+                       'columns': {name: {'dtype': descr, 'shape': list(shape)}
+                                   for name, (descr, shape) in self.columns.items()}}, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.close()
+        else:
+            for f in self.files.values():
+                f.close()
+
+
+def open_columns(path: str, kind: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """(meta, {nom: tableau projeté en mémoire, lecture seule}) ; rien n'est chargé."""
+    meta_path = os.path.join(path, 'meta.json')
+    if not os.path.exists(meta_path):
+        raise ValueError(f"{path}: meta.json absent (pas un lot au format colonne, ou écriture interrompue)")
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('format') != FORMAT or meta.get('version') != VERSION:
+        raise ValueError(f"{path}: format non reconnu ({meta.get('format')} v{meta.get('version')})")
+    if kind is not None and meta.get('kind') != kind:
+        raise ValueError(f"{path}: lot de type {meta.get('kind')}, {kind} attendu")
+    arrays = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r') for name in meta['columns']}
+    return meta, arrays
+
+
+# --- Problèmes ---
+
+def write_problems(path: str, problems: Dict[str, Any], max_rows: Optional[int] = None) -> int:
+    """Écrit un lot empilé (format de solve_many/stack_problems) ; renvoie N."""
+    A = np.asarray(problems['A'], dtype=float)
+    N, m = A.shape[:2]
+    mask = problems.get('mask')
+    mask = np.ones((N, m), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+    with ColumnWriter(path, problem_columns(max_rows or m), 'problems', max_rows=max_rows or m) as writer:
+        writer.append(**_padded(problems, mask, max_rows or m))
+    return writer.count
+
+
+def _padded(problems: Dict[str, Any], mask: np.ndarray, max_rows: int) -> Dict[str, np.ndarray]:
+    # Contraintes réelles tassées en tête de ligne, le reste à zéro (rows les compte)
+    A = np.asarray(problems['A'], dtype=float)
+    N, m = mask.shape
+    rows = mask.sum(axis=1)
+    if N and rows.max() > max_rows:
+        raise ValueError(f"Problème à {int(rows.max())} contraintes, max_rows = {max_rows}")
+    order = np.argsort(~mask, axis=1, kind='stable')
+    keep = np.arange(m) < rows[:, None]
+    width = min(m, max_rows)
+
+    def pick(arr):
+        return np.take_along_axis(arr, order.reshape(order.shape + (1,) * (arr.ndim - 2)), axis=1)
+
+    out_A = np.zeros((N, max_rows, 2))
+    out_b = np.zeros((N, max_rows))
+    out_ops = np.zeros((N, max_rows), dtype=np.int8)
+    out_A[:, :width] = np.where(keep[..., None], pick(A), 0.0)[:, :width]
+    out_b[:, :width] = np.where(keep, pick(np.asarray(problems['b'], dtype=float)), 0.0)[:, :width]
+    ops = _as_codes(problems['operators'], OP_CODES, 'Opérateur').reshape(N, m)
+    out_ops[:, :width] = np.where(keep, pick(ops), 0)[:, :width]
+    obj = _as_codes(problems.get('objective_type', np.zeros(N, dtype=np.int8)), OBJ_CODES, 'objective_type')
+    return {'c': problems['c'], 'A': out_A, 'b': out_b, 'operators': out_ops,
+            'objective_type': np.broadcast_to(obj.reshape(-1), (N,)), 'rows': rows}
+
+
+def iter_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[int, Dict[str, np.ndarray]]]:
+    """(début, lot empilé pour solve_many) par bloc ; seul le bloc courant est lu du disque."""
+    meta, arrays = open_columns(path, 'problems')
+    m = meta['max_rows']
+    for start in range(0, meta['count'], chunk_size):
+        sl = slice(start, start + chunk_size)
+        rows = np.asarray(arrays['rows'][sl])
+        yield start, {'c': np.asarray(arrays['c'][sl]), 'A': np.asarray(arrays['A'][sl]),
+                      'b': np.asarray(arrays['b'][sl]), 'operators': np.asarray(arrays['operators'][sl]),
+                      'objective_type': np.asarray(arrays['objective_type'][sl]),
+                      'mask': np.arange(m) < rows[:, None]}
+
+
+def solve_columns(src: str, dst: str, chunk_size: int = CHUNK_SIZE, workers: Optional[int] = None) -> int:
+    """Résout un lot au format colonne bloc par bloc et écrit les résultats au même format.
+
+    workers > 1 : chaque bloc passe par l'exécuteur en mémoire partagée (core.shared).
+    """
+    from core.shared import solve_shared
+
+    open_columns(src, 'problems')
+    with ColumnWriter(dst, RESULT_COLUMNS, 'results', source=os.path.abspath(src)) as writer:
+        for _, chunk in iter_chunks(src, chunk_size):
+            sol = solve_shared(chunk, workers=workers) if workers and workers > 1 else solve_many(chunk)
+            writer.append(status=sol['status_code'], solution_type=sol['solution_type_code'],
+                          x=sol['x'], z=sol['z'])
+    return writer.count
+
+
+def read_results(path: str) -> Dict[str, np.ndarray]:
+    """Résultats projetés en mémoire ; STATUS_NAMES[status] et SOLUTION_TYPES[solution_type] les décodent."""
+    return open_columns(path, 'results')[1]
+
+
+# --- Conversion depuis/vers le format JSON de LLMExtractor ---
+
+def _read_jsonl(src: str) -> Iterator[Dict[str, Any]]:
+    with open(src, encoding='utf-8') as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            problem = json.loads(line)
+            error = validate_problem(problem)
+            if error:
+                raise ValueError(f"{src}:{lineno}: {error}")
+            yield problem
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def from_jsonl(src: str, dst: str, max_rows: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Convertit un fichier JSONL (un problème de LLMExtractor par ligne) au format colonne.
+
+    Sans max_rows, une première lecture du fichier détermine le plus grand nombre de contraintes.
+    """
+    if max_rows is None:
+        max_rows = max((len(p['constraints']) for p in _read_jsonl(src)), default=0)
+    with ColumnWriter(dst, problem_columns(max_rows), 'problems', max_rows=max_rows) as writer:
+        for chunk in _chunks(_read_jsonl(src), chunk_size):
+            stacked = stack_problems(chunk)
+            writer.append(**_padded(stacked, stacked['mask'], max_rows))
+    return writer.count
+
+
+def iter_problems(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Problèmes au format de LLMExtractor ({'objective_type', 'c', 'constraints'})."""
+    for _, chunk in iter_chunks(path, chunk_size):
+        rows = chunk['mask'].sum(axis=1)
+        c, A, b = chunk['c'].tolist(), chunk['A'].tolist(), chunk['b'].tolist()
+        ops, obj = chunk['operators'].tolist(), chunk['objective_type'].tolist()
+        for k in range(len(rows)):
+            yield {'objective_type': OBJECTIVE_NAMES[obj[k]], 'c': c[k],
+                   'constraints': [{'a': A[k][i][0], 'b': A[k][i][1], 'op': OPERATOR_NAMES[ops[k][i]],
+                                    'c': b[k][i]} for i in range(rows[k])]}
+
+
+def to_jsonl(src: str, dst: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """Réécrit un lot au format colonne en JSONL (un problème par ligne) ; renvoie N."""
+    count = 0
+    with open(dst, 'w', encoding='utf-8') as f:
+        for problem in iter_problems(src, chunk_size):
+            f.write(json.dumps(problem) + '\n')
+            count += 1
+    return count
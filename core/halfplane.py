@@ -0,0 +1,502 @@
+import math
+from collections import deque
+from typing import List, Tuple, Optional, Any
+
+import numpy as np
+
+# Taille de la boîte englobante (relative à l'échelle du problème) utilisée pour
+# fermer les régions non bornées pendant le balayage. Les sommets situés sur la
+# boîte ne sont jamais renvoyés : ils sont remplacés par des rayons.
+BOX_FACTOR = 1e6
+
+
+def _to_tuple_float(pt) -> Tuple[float, float]:
+    return (float(pt[0]) + 0.0, float(pt[1]) + 0.0)
+
+
+class FeasibleRegion:
+    """Région admissible 2D issue de l'intersection de demi-plans a·x <= b.
+
+    - vertices          : sommets finis, ordonnés dans le sens trigonométrique
+    - edges             : arêtes finies (p, q)
+    - edge_constraints  : contrainte active (label) de chaque arête finie
+    - rays              : arêtes infinies (origine, direction unitaire, label)
+    - directions        : rayons extrêmes du cône de récession (vide si bornée)
+    """
+
+    def __init__(self, vertices=None, edges=None, edge_constraints=None, rays=None,
+                 empty=False, polygon=None, polygon_labels=None, cycle=None, tol=0.0):
+        self.vertices: List[Tuple[float, float]] = list(vertices or [])
+        self.edges: List[Tuple[Tuple[float, float], Tuple[float, float]]] = list(edges or [])
+        self.edge_constraints: List[Any] = list(edge_constraints or [])
+        self.rays: List[Tuple[Tuple[float, float], Tuple[float, float], Any]] = list(rays or [])
+        self.empty = bool(empty)
+        # Polygone fermé par la boîte englobante (sommets + label de l'arête
+        # qui part de chaque sommet, None pour un côté de la boîte)
+        self.polygon = np.zeros((0, 2)) if polygon is None else np.asarray(polygon, dtype=float)
+        self.polygon_labels: List[Any] = list(polygon_labels or [])
+        # Demi-plans du bord dans l'ordre (N, h, labels, is_box) : polygon[i] est
+        # l'intersection des demi-plans i et i+1. None pour une région vide ou
+        # réduite à une droite (pas de mise à jour incrémentale possible).
+        self.cycle = cycle
+        self.tol = tol
+        self._directions = None
+        self._vertex_array = None
+
+    @property
+    def bounded(self) -> bool:
+        return not self.empty and not self.rays
+
+    @property
+    def vertex_array(self) -> np.ndarray:
+        """Sommets en tableau (k, 2), construit une fois."""
+        if self._vertex_array is None:
+            self._vertex_array = np.array(self.vertices, dtype=float).reshape(-1, 2)
+        return self._vertex_array
+
+    @property
+    def directions(self) -> List[Tuple[float, float]]:
+        # Calculé une fois : la région ne change pas, seul l'objectif varie entre deux appels
+        if self._directions is None:
+            dirs: List[Tuple[float, float]] = []
+            for _, d, _ in self.rays:
+                if not any(abs(d[0] - e[0]) <= 1e-9 and abs(d[1] - e[1]) <= 1e-9 for e in dirs):
+                    dirs.append(d)
+            self._directions = dirs
+        return list(self._directions)
+
+    @property
+    def active_constraints(self) -> List[Any]:
+        labels: List[Any] = []
+        for lab in list(self.edge_constraints) + [r[2] for r in self.rays]:
+            if lab not in labels:
+                labels.append(lab)
+        return labels
+
+    def relabel(self, mapping) -> 'FeasibleRegion':
+        """Copie avec les labels des contraintes traduits par mapping (les labels absents sont gardés)."""
+        def tr(lab):
+            return mapping.get(lab, lab) if lab is not None else None
+        cycle = None
+        if self.cycle is not None:
+            N, h, labels, is_box = self.cycle
+            cycle = (N, h, [tr(lab) for lab in labels], is_box)
+        return FeasibleRegion(
+            self.vertices, self.edges, [tr(lab) for lab in self.edge_constraints],
+            [(o, d, tr(lab)) for o, d, lab in self.rays], self.empty,
+            self.polygon, [tr(lab) for lab in self.polygon_labels], cycle, self.tol,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            'vertices': list(self.vertices),
+            'edges': list(self.edges),
+            'edge_constraints': list(self.edge_constraints),
+            'rays': list(self.rays),
+            'directions': self.directions,
+            'bounded': self.bounded,
+            'empty': self.empty,
+            'polygon': [_to_tuple_float(p) for p in self.polygon],
+        }
+
+    def __repr__(self):
+        if self.empty:
+            return "FeasibleRegion(empty)"
+        return (f"FeasibleRegion({len(self.vertices)} sommets, {len(self.edges)} arêtes, "
+                f"{len(self.rays)} rayons, bounded={self.bounded})")
+
+
+def clip_polygon(points, normal, bound, eps=1e-12):
+    """Partie d'un polygone convexe (sommets ordonnés) dans le demi-plan normal·x <= bound.
+
+    Sutherland-Hodgman sur une seule droite : chaque arête garde son origine si elle
+    est dedans et, si elle traverse la droite, son point de sortie ou d'entrée.
+    """
+    P = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(P) == 0:
+        return P
+    d = P @ np.asarray(normal, dtype=float) - bound
+    inside = d <= eps
+    d_next = np.roll(d, -1)
+    cross = inside != np.roll(inside, -1)
+    t = np.divide(d, d - d_next, out=np.zeros_like(d), where=cross)
+    I = P + t[:, None] * (np.roll(P, -1, axis=0) - P)
+    return np.stack([P, I], axis=1)[np.stack([inside, cross], axis=1)]
+
+
+def constraint_halfplanes(A, b, operators):
+    """Demi-plans a·x <= b des contraintes, puis x1 >= 0 et x2 >= 0.
+
+    Une ligne par contrainte ('>=' changée de signe), deux pour une égalité
+    (a·x <= b puis -a·x <= -b). Retourne (N, h, rows, signs) : rows = indice de
+    la contrainte d'origine (-1 / -2 pour x1 / x2 >= 0), signs = signe appliqué.
+    """
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    ops = np.array(list(operators), dtype=object).reshape(-1)
+    is_eq = ops == '='
+    counts = np.where(is_eq, 2, np.where((ops == '<=') | (ops == '>='), 1, 0))
+    idx = np.repeat(np.arange(len(ops)), counts)
+    sign = np.where(ops == '>=', -1.0, 1.0)[idx] if len(idx) else np.zeros(0)
+    second = np.zeros(len(idx), dtype=bool)
+    second[1:] = idx[1:] == idx[:-1]
+    sign[second] = -1.0
+
+    N = np.vstack([A[idx] * sign[:, None], [[-1.0, 0.0], [0.0, -1.0]]])
+    h = np.concatenate([b[idx] * sign, [0.0, 0.0]])
+    rows = np.concatenate([idx, [-1, -2]]).astype(int)
+    return N, h, rows, np.concatenate([sign, [1.0, 1.0]])
+
+
+def polygon_centroid(points) -> Tuple[float, float]:
+    """Centre de gravité exact d'un polygone (formule du lacet) ; moyenne des points s'il est dégénéré."""
+    P = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(P) == 0:
+        return (math.nan, math.nan)
+    Q = np.roll(P, -1, axis=0)
+    cross = P[:, 0] * Q[:, 1] - Q[:, 0] * P[:, 1]
+    area = cross.sum() / 2.0
+    if abs(area) <= 1e-12 * max(1.0, float(np.abs(P).max()) ** 2):
+        return _to_tuple_float(P.mean(axis=0))
+    cx = ((P[:, 0] + Q[:, 0]) * cross).sum() / (6.0 * area)
+    cy = ((P[:, 1] + Q[:, 1]) * cross).sum() / (6.0 * area)
+    return _to_tuple_float((cx, cy))
+
+
+def _intersection(n1, h1, n2, h2):
+    det = n1[0] * n2[1] - n1[1] * n2[0]
+    return np.array([(h1 * n2[1] - h2 * n1[1]) / det, (n1[0] * h2 - n2[0] * h1) / det])
+
+
+def _normalize(A, b, labels, eps):
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    labels = list(range(len(b))) if labels is None else list(labels)
+
+    norms = np.hypot(A[:, 0], A[:, 1])
+    zero = norms <= eps
+    # Ligne nulle 0 <= b : toujours vraie ou toujours fausse
+    if np.any(b[zero] < -eps):
+        return None
+    keep = np.flatnonzero(~zero)
+    N = A[keep] / norms[keep, None]
+    h = b[keep] / norms[keep]
+    return N, h, [labels[i] for i in keep]
+
+
+def _merge_parallel(N, h, labels, tol):
+    """Trie par angle de la normale et ne garde que le plus serré des demi-plans parallèles."""
+    theta = np.arctan2(N[:, 1], N[:, 0])
+    order = np.lexsort((h, theta))
+    keep: List[int] = []
+    for i in order:
+        if keep:
+            j = keep[-1]
+            if abs(N[i, 0] * N[j, 1] - N[i, 1] * N[j, 0]) <= tol and N[i] @ N[j] > 0:
+                continue  # même direction, h[j] <= h[i]
+        keep.append(int(i))
+    # Raccord entre -pi et pi
+    if len(keep) > 1:
+        i, j = keep[-1], keep[0]
+        if abs(N[i, 0] * N[j, 1] - N[i, 1] * N[j, 0]) <= tol and N[i] @ N[j] > 0:
+            if h[i] < h[j]:
+                keep[0] = i
+            keep.pop()
+    return N[keep], h[keep], [labels[i] for i in keep], theta[keep]
+
+
+def recession_cone(A, eps: float = 1e-9) -> List[Tuple[float, float]]:
+    """Rayons extrêmes du cône de récession {d : A·d <= 0} en 2D, par tri angulaire des normales.
+
+    Les normales sont triées par angle : le cône n'est pas réduit à {0} seulement s'il
+    existe un écart angulaire d'au moins pi entre deux normales consécutives, et ses
+    rayons extrêmes sont alors les perpendiculaires des deux normales qui bordent cet écart.
+    Retourne [] si le cône est {0} ; un demi-plan ajoute sa direction médiane et
+    le plan entier renvoie les quatre directions des axes.
+    """
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    norms = np.hypot(A[:, 0], A[:, 1])
+    N = A[norms > eps] / norms[norms > eps, None]
+    if len(N) == 0:
+        return [(1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0)]
+
+    theta = np.arctan2(N[:, 1], N[:, 0])
+    order = np.argsort(theta, kind='stable')
+    N, theta = N[order], theta[order]
+    gaps = np.diff(np.append(theta, theta[0] + 2 * math.pi))
+
+    rays: List[Tuple[float, float]] = []
+
+    def add(d):
+        t = _to_tuple_float(d)
+        if not any(abs(t[0] - e[0]) <= eps and abs(t[1] - e[1]) <= eps for e in rays):
+            rays.append(t)
+
+    for i in np.flatnonzero(gaps >= math.pi - eps):
+        n_lo, n_hi = N[i], N[(i + 1) % len(N)]
+        add((-n_lo[1], n_lo[0]))    # perpendiculaire de la normale avant l'écart
+        add((n_hi[1], -n_hi[0]))    # perpendiculaire de la normale après l'écart
+        if gaps[i] >= 2 * math.pi - eps:
+            add(-n_lo)              # une seule direction de normale : demi-plan
+    return rays
+
+
+def _find_equality(N, h, theta, eps, tol):
+    """Cherche une paire de demi-plans opposés (a·x <= b et a·x >= b).
+
+    Retourne (-1, -1) si l'intersection est vide, (i, j) pour une égalité implicite,
+    ou None s'il n'y en a pas. O(m log m) par recherche dichotomique.
+    """
+    neg = np.flatnonzero(theta < 0)
+    pos = np.flatnonzero(theta >= 0)
+    if len(neg) == 0 or len(pos) == 0:
+        return None
+    targets = theta[neg] + math.pi
+    idx = np.searchsorted(theta[pos], targets)
+    found = None
+    for k, i in enumerate(neg):
+        for cand in (idx[k] - 1, idx[k]):
+            if 0 <= cand < len(pos):
+                j = pos[cand]
+                if abs(N[i, 0] * N[j, 1] - N[i, 1] * N[j, 0]) <= eps and N[i] @ N[j] < 0:
+                    gap = h[i] + h[j]
+                    if gap < -tol:
+                        return (-1, -1)
+                    if gap <= tol and found is None:
+                        found = (int(i), int(j))
+    return found
+
+
+def _line_region(N, h, labels, i, tol, M) -> FeasibleRegion:
+    """Région réduite à une droite n_i·x = h_i : intervalle 1D en O(m)."""
+    n = N[i]
+    p0 = n * h[i]
+    d = np.array([-n[1], n[0]])
+    slope = N @ d
+    rhs = h - N @ p0
+    flat = np.abs(slope) <= tol
+    if np.any(rhs[flat] < -tol):
+        return FeasibleRegion(empty=True)
+    with np.errstate(divide='ignore'):
+        t = rhs / np.where(flat, 1.0, slope)
+    up = t[(~flat) & (slope > 0)]
+    lo = t[(~flat) & (slope < 0)]
+    t_hi = float(up.min()) if len(up) else math.inf
+    t_lo = float(lo.max()) if len(lo) else -math.inf
+    if t_lo > t_hi + tol:
+        return FeasibleRegion(empty=True)
+    if t_lo > t_hi:
+        t_lo = t_hi = 0.5 * (t_lo + t_hi)
+
+    lab = labels[i]
+    dt = _to_tuple_float(d)
+    if math.isfinite(t_lo) and math.isfinite(t_hi):
+        p, q = _to_tuple_float(p0 + t_lo * d), _to_tuple_float(p0 + t_hi * d)
+        if t_hi - t_lo <= tol:
+            return FeasibleRegion(vertices=[p], polygon=[p])
+        return FeasibleRegion(vertices=[p, q], edges=[(p, q)], edge_constraints=[lab],
+                              polygon=[p, q], polygon_labels=[lab, lab])
+
+    # Segment fermé par la boîte englobante
+    polygon = [_to_tuple_float(p0 + max(t_lo, -M) * d), _to_tuple_float(p0 + min(t_hi, M) * d)]
+    polygon_labels = [lab, lab]
+    rays = []
+    vertices = []
+    if math.isfinite(t_lo):
+        p = _to_tuple_float(p0 + t_lo * d)
+        vertices.append(p)
+        rays.append((p, dt, lab))
+    elif math.isfinite(t_hi):
+        q = _to_tuple_float(p0 + t_hi * d)
+        vertices.append(q)
+        rays.append((q, (-dt[0], -dt[1]), lab))
+    else:
+        foot = _to_tuple_float(p0)
+        rays.extend([(foot, dt, lab), (foot, (-dt[0], -dt[1]), lab)])
+    return FeasibleRegion(vertices=vertices, rays=rays, polygon=polygon, polygon_labels=polygon_labels)
+
+
+def intersect_halfplanes(A, b, labels=None, eps: float = 1e-9, scale: Optional[float] = None) -> FeasibleRegion:
+    """Intersection des demi-plans A[i]·x <= b[i] en O(m log m).
+
+    Tri des demi-plans par angle puis balayage avec une deque. Les régions
+    ouvertes sont fermées par une boîte englobante ; les arêtes qui touchent
+    la boîte deviennent des rayons (directions non bornées).
+    `labels[i]` est renvoyé comme contrainte active des arêtes portées par A[i].
+    `scale` fixe l'échelle (boîte et tolérances) au lieu de max|b|/|a|.
+    """
+    normalized = _normalize(A, b, labels, eps)
+    if normalized is None:
+        return FeasibleRegion(empty=True)
+    N, h, labels = normalized
+
+    if scale is None:
+        scale = max(1.0, float(np.max(np.abs(h)))) if len(h) else 1.0
+    tol = eps * scale
+
+    if len(h):
+        N, h, labels, theta = _merge_parallel(N, h, labels, eps)
+        eq = _find_equality(N, h, theta, eps, tol)
+        if eq == (-1, -1):
+            return FeasibleRegion(empty=True)
+        if eq is not None:
+            return _line_region(N, h, labels, eq[0], tol, BOX_FACTOR * scale)
+
+    # Boîte englobante (label None)
+    M = BOX_FACTOR * scale
+    box_N = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+    N_all = np.vstack([N, box_N]) if len(h) else box_N
+    h_all = np.concatenate([h, np.full(4, M)])
+    labels_all = list(labels) + [None] * 4
+    is_box = [False] * len(h) + [True] * 4
+
+    theta = np.arctan2(N_all[:, 1], N_all[:, 0])
+    order = np.lexsort((h_all, theta))
+
+    def out(k, p):
+        return N_all[k] @ p > h_all[k] + tol
+
+    def inter(i, j):
+        return _intersection(N_all[i], h_all[i], N_all[j], h_all[j])
+
+    dq: deque = deque()
+    for k in order:
+        while len(dq) >= 2 and out(k, inter(dq[-2], dq[-1])):
+            dq.pop()
+        while len(dq) >= 2 and out(k, inter(dq[0], dq[1])):
+            dq.popleft()
+        if dq:
+            j = dq[-1]
+            cross = N_all[k, 0] * N_all[j, 1] - N_all[k, 1] * N_all[j, 0]
+            if abs(cross) <= eps:
+                if N_all[k] @ N_all[j] < 0:
+                    return FeasibleRegion(empty=True)
+                if h_all[k] >= h_all[j]:
+                    continue
+                dq.pop()
+        dq.append(int(k))
+
+    while len(dq) >= 3 and out(dq[0], inter(dq[-2], dq[-1])):
+        dq.pop()
+    while len(dq) >= 3 and out(dq[-1], inter(dq[0], dq[1])):
+        dq.popleft()
+    if len(dq) < 3:
+        return FeasibleRegion(empty=True)
+
+    planes = list(dq)
+    region = _region_from_cycle(N_all[planes], h_all[planes], [labels_all[p] for p in planes],
+                                [is_box[p] for p in planes], tol)
+    # Vérification finale : un sommet hors d'un demi-plan signifie une région vide
+    if not region.empty and np.any(region.polygon @ N_all.T > h_all + 10 * tol):
+        return FeasibleRegion(empty=True)
+    return region
+
+
+def _region_from_cycle(N, h, labels, is_box, tol) -> FeasibleRegion:
+    """Construit la région à partir des demi-plans du bord, dans l'ordre trigonométrique."""
+    k = len(h)
+    # Sommet i = intersection des demi-plans i et i+1 ; l'arête du plan i+1 va de v_i à v_{i+1}
+    pts = [_intersection(N[i], h[i], N[(i + 1) % k], h[(i + 1) % k]) for i in range(k)]
+    for p in pts:
+        if not np.all(np.isfinite(p)):
+            return FeasibleRegion(empty=True)
+    P = np.array(pts)
+
+    polygon = P
+    polygon_labels = [labels[(i + 1) % k] for i in range(k)]
+
+    on_box = [is_box[i] or is_box[(i + 1) % k] for i in range(k)]
+    start = 0
+    if any(on_box) and not all(on_box):
+        # Commencer juste après la partie posée sur la boîte
+        start = next(i for i in range(k) if on_box[i] and not on_box[(i + 1) % k])
+
+    vertices: List[Tuple[float, float]] = []
+    edge_starts: List[int] = []
+    edge_constraints = []
+    ray_specs = []
+
+    def add_vertex(p) -> int:
+        t = _to_tuple_float(p)
+        if not vertices or abs(vertices[-1][0] - t[0]) > tol or abs(vertices[-1][1] - t[1]) > tol:
+            vertices.append(t)
+        return len(vertices) - 1
+
+    for s in range(k):
+        i = (start + s) % k          # arête du plan i+1, de v_i à v_{i+1}
+        j = (i + 1) % k
+        if is_box[j]:
+            continue
+        p, q = pts[i], pts[j]
+        d = _to_tuple_float((-N[j, 1], N[j, 0]))
+        lab = labels[j]
+        if on_box[i] and on_box[j]:
+            foot = _to_tuple_float(N[j] * h[j])
+            ray_specs.append((foot, (-d[0], -d[1]), lab))
+            ray_specs.append((foot, d, lab))
+        elif on_box[i]:
+            ray_specs.append((add_vertex(q), (-d[0], -d[1]), lab))
+        elif on_box[j]:
+            ray_specs.append((add_vertex(p), d, lab))
+        else:
+            vi = add_vertex(p)
+            if abs(p[0] - q[0]) > tol or abs(p[1] - q[1]) > tol:
+                edge_starts.append(vi)
+                edge_constraints.append(lab)
+
+    # Polygone fermé : le dernier sommet peut coïncider avec le premier
+    if len(vertices) > 1 and abs(vertices[0][0] - vertices[-1][0]) <= tol \
+            and abs(vertices[0][1] - vertices[-1][1]) <= tol:
+        vertices.pop()
+        edge_starts = [0 if vi == len(vertices) else vi for vi in edge_starts]
+        ray_specs = [(0 if o == len(vertices) else o, d, lab) for o, d, lab in ray_specs]
+    if not ray_specs and not vertices:
+        vertices = [_to_tuple_float(P.mean(axis=0))]
+
+    nv = len(vertices)
+    edges = [(vertices[vi], vertices[(vi + 1) % nv]) for vi in edge_starts]
+    rays = [(vertices[o] if isinstance(o, int) else o, d, lab) for o, d, lab in ray_specs]
+
+    return FeasibleRegion(vertices=vertices, edges=edges, edge_constraints=edge_constraints,
+                          rays=rays, polygon=polygon, polygon_labels=polygon_labels,
+                          cycle=(np.asarray(N), np.asarray(h), list(labels), list(is_box)), tol=tol)
+
+
+def clip_region(region: FeasibleRegion, n, h: float, label=None) -> Optional[FeasibleRegion]:
+    """Coupe la région par un demi-plan n·x <= h en O(k) (k = taille du bord).
+
+    Retourne la nouvelle région, la même si le demi-plan est redondant, ou None si
+    le résultat n'est plus d'intérieur non vide (région vide, segment, point) :
+    il faut alors recalculer avec intersect_halfplanes.
+    """
+    if region.cycle is None:
+        return None
+    n = np.asarray(n, dtype=float)
+    norm = math.hypot(n[0], n[1])
+    if norm == 0.0:
+        return None
+    n, h = n / norm, h / norm
+    N, H, labels, is_box = region.cycle
+    k = len(H)
+    tol = region.tol
+
+    side = region.polygon @ n - h
+    out = side > tol
+    if not np.any(out):
+        return region
+    if not np.any(side < -tol):
+        return None
+    # Les sommets hors du demi-plan forment une seule plage contiguë (convexité)
+    starts = np.flatnonzero(out & ~np.roll(out, 1))
+    if len(starts) != 1:
+        return None
+    s, L = int(starts[0]), int(np.count_nonzero(out))
+
+    # Rotation : indice 0 = dernier sommet gardé avant la plage, plage = 1..L
+    order = (np.arange(k) + s - 1) % k
+    keep = np.concatenate([order[:2], order[L + 1:]])
+    N_new = np.vstack([N[keep[:2]], n, N[keep[2:]]])
+    H_new = np.concatenate([H[keep[:2]], [h], H[keep[2:]]])
+    labels_new = [labels[i] for i in keep[:2]] + [label] + [labels[i] for i in keep[2:]]
+    is_box_new = [is_box[i] for i in keep[:2]] + [False] + [is_box[i] for i in keep[2:]]
+    return _region_from_cycle(N_new, H_new, labels_new, is_box_new, tol)
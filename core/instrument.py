@@ -0,0 +1,158 @@
+"""Chronométrage par phase et compteurs, désactivé par défaut.
+
+    from core import instrument
+    instrument.enable()                      # ou SOLVEUR_PROFILE=1 pour l'interface
+    instrument.add_hook(lambda timings, result: print(timings))
+    result = solve_linear_program(...)       # result['timings'] = {'total_ms', 'phases', 'counters'}
+
+Le code instrumenté appelle phase(name) et count(name, n) : désactivés, ce sont un test et un
+objet partagé, sans allocation. Les temps sont mesurés avec perf_counter (horloge monotone) ;
+chaque phase reçoit son temps propre, sans celui des phases imbriquées, de sorte que la somme
+des phases ne dépasse pas total_ms. L'enregistrement courant est lié au contexte (ContextVar) :
+deux threads qui résolvent en parallèle ont chacun le leur.
+"""
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+_enabled = False
+# Appelés avec (timings, result) à chaque résultat chronométré, dans le thread de la résolution
+_hooks: List[Callable[[Dict[str, Any], Dict[str, Any]], None]] = []
+_current: ContextVar[Optional['Recorder']] = ContextVar('solveur_recorder', default=None)
+
+
+class _Phase:
+    __slots__ = ('recorder', 'name', 'start', 'child')
+
+    def __init__(self, recorder: 'Recorder', name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.child = 0.0
+        self.recorder._stack.append(self)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = perf_counter() - self.start
+        rec = self.recorder
+        rec._stack.pop()
+        rec.phases[self.name] = rec.phases.get(self.name, 0.0) + elapsed - self.child
+        if rec._stack:
+            rec._stack[-1].child += elapsed
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _NullRecording:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_RECORDING = _NullRecording()
+
+
+class _Recording:
+    __slots__ = ('recorder', 'token')
+
+    def __enter__(self):
+        self.recorder = Recorder()
+        self.token = _current.set(self.recorder)
+        return self.recorder
+
+    def __exit__(self, *exc):
+        _current.reset(self.token)
+        return False
+
+
+class Recorder:
+    """Temps propre de chaque phase (s) et compteurs d'un calcul."""
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._stack: List[_Phase] = []
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'total_ms': round(1000 * (perf_counter() - self.start), 3),
+                'phases': {name: round(1000 * s, 3) for name, s in self.phases.items()},
+                'counters': dict(self.counters)}
+
+
+def enable(flag: bool = True):
+    global _enabled
+    _enabled = bool(flag)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def add_hook(fn: Callable[[Dict[str, Any], Dict[str, Any]], None]):
+    if fn not in _hooks:
+        _hooks.append(fn)
+
+
+def remove_hook(fn: Callable[[Dict[str, Any], Dict[str, Any]], None]):
+    if fn in _hooks:
+        _hooks.remove(fn)
+
+
+def phase(name: str):
+    """Contexte qui chronomètre `name` dans l'enregistrement courant (sans effet s'il n'y en a pas)."""
+    if not _enabled:
+        return _NULL_PHASE
+    rec = _current.get()
+    return _NULL_PHASE if rec is None else _Phase(rec, name)
+
+
+def count(name: str, n: int = 1):
+    """Ajoute n au compteur `name` de l'enregistrement courant."""
+    if _enabled:
+        rec = _current.get()
+        if rec is not None:
+            rec.count(name, n)
+
+
+def recording():
+    """Contexte qui ouvre un enregistrement, ou donne None : instrumentation désactivée, ou un
+    enregistrement englobant déjà ouvert (les phases imbriquées s'y ajoutent et c'est lui qui sera attaché)."""
+    if not _enabled or _current.get() is not None:
+        return _NULL_RECORDING
+    return _Recording()
+
+
+def attach(rec: Optional[Recorder], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Écrit result['timings'] et appelle les hooks ; sans effet si rec est None."""
+    if rec is None or not isinstance(result, dict):
+        return result
+    timings = rec.as_dict()
+    result['timings'] = timings
+    for fn in list(_hooks):
+        fn(timings, result)
+    return result
@@ -0,0 +1,83 @@
+from typing import Tuple
+
+import numpy as np
+
+from core import instrument
+
+# Nombre maximal de couples (paires x contraintes) évalués par bloc pour le
+# test d'admissibilité, afin de borner la mémoire sur les grands problèmes.
+FEASIBILITY_CHUNK = 2_000_000
+
+
+def pairwise_intersections(A, b, eps_det: float = 1e-12) -> Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Intersections de toutes les paires de droites A[i]·x = b[i] (règle de Cramer vectorisée).
+
+    A : (..., n, 2), b : (..., n). Retourne les points (..., n(n-1)/2, 2), le masque
+    des paires non parallèles et les indices (i, j) des paires.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    n = A.shape[-2]
+    i, j = np.triu_indices(n, 1)
+    instrument.count('candidate_pairs', len(i) * int(np.prod(A.shape[:-2], dtype=np.int64)))
+
+    a1, a2 = A[..., i, :], A[..., j, :]
+    b1, b2 = b[..., i], b[..., j]
+    det = a1[..., 0] * a2[..., 1] - a1[..., 1] * a2[..., 0]
+    ok = np.abs(det) > eps_det
+    safe = np.where(ok, det, 1.0)
+
+    x = (b1 * a2[..., 1] - b2 * a1[..., 1]) / safe
+    y = (a1[..., 0] * b2 - a2[..., 0] * b1) / safe
+    return np.stack([x, y], axis=-1), ok, (i, j)
+
+
+def feasible_mask(points, A, b, eps: float = 1e-8) -> np.ndarray:
+    """Masque des points vérifiant toutes les contraintes A·x <= b (un seul produit matriciel par bloc)."""
+    points = np.asarray(points, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    k, n = points.shape[-2], A.shape[-2]
+    if k == 0:
+        return np.zeros(points.shape[:-1], dtype=bool)
+
+    step = max(1, FEASIBILITY_CHUNK // max(1, n))
+    At = np.swapaxes(A, -1, -2)
+    bound = b[..., None, :] + eps
+    masks = [np.all(points[..., s:s + step, :] @ At <= bound, axis=-1) for s in range(0, k, step)]
+    return masks[0] if len(masks) == 1 else np.concatenate(masks, axis=-1)
+
+
+def unique_points(points, decimals: int = 7) -> np.ndarray:
+    """Déduplication par arrondi + np.unique, en conservant l'ordre d'apparition."""
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(points) == 0:
+        return points
+    _, idx = np.unique(np.round(points, decimals) + 0.0, axis=0, return_index=True)
+    return points[np.sort(idx)]
+
+
+def evaluate_points(points, c) -> np.ndarray:
+    """Valeur de l'objectif c·x pour tous les points."""
+    return np.asarray(points, dtype=float) @ np.asarray(c, dtype=float)
+
+
+def farthest_pair(points) -> Tuple[int, int]:
+    """Indices des deux points les plus éloignés (matrice des distances vectorisée)."""
+    pts = np.asarray(points, dtype=float)
+    if len(pts) < 2:
+        return 0, 0
+    diff = pts[:, None, :] - pts[None, :, :]
+    d2 = np.einsum('ijk,ijk->ij', diff, diff)
+    ii, jj = np.unravel_index(np.argmax(d2), d2.shape)
+    return (int(ii), int(jj)) if ii < jj else (int(jj), int(ii))
+
+
+def enumerate_vertices(A, b, eps_feas: float = 1e-8, eps_det: float = 1e-12) -> np.ndarray:
+    """Sommets admissibles de {x : A·x <= b} par énumération vectorisée de toutes les paires."""
+    pts, ok, _ = pairwise_intersections(A, b, eps_det=eps_det)
+    pts = pts[ok]
+    pts = pts[feasible_mask(pts, A, b, eps=eps_feas)]
+    pts = unique_points(pts)
+    instrument.count('vertices', len(pts))
+    return pts
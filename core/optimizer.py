@@ -2,8 +2,25 @@ import math
 from typing import List, Tuple, Dict, Any
 
 import numpy as np
-from itertools import combinations
-from scipy.optimize import linprog
+
+from core import instrument
+from core.halfplane import FeasibleRegion, constraint_halfplanes, intersect_halfplanes, recession_cone
+from core.kernels import enumerate_vertices, evaluate_points, farthest_pair
+from core.presolve import conflict_message, presolve_problem
+from core.seidel import LPResult, seidel_lp
+
+# 'highs' : scipy.optimize.linprog (référence) ; 'seidel' : solveur 2D intégré en NumPy ;
+# 'region' : argmax sur les sommets de la région admissible (déjà construite) ;
+# 'check' : highs et seidel, avec vérification croisée (pour les tests)
+BACKENDS = ('highs', 'seidel', 'region', 'check')
+
+# Paramètres d'une analyse paramétrique : second membre b_i ou coefficient c_j de l'objectif
+PARAMETERS = ('rhs', 'objective')
+# Taille des blocs (points de grille × demi-plans) évalués d'un coup
+PARAMETRIC_CHUNK = 2_000_000
+
+_PARAMETRIC_STATUS = {0: 'optimal', 2: 'infeasible', 3: 'unbounded'}
+
 
 def _to_float(x: Any):
     try:
@@ -17,14 +34,33 @@ def _to_tuple_float(pt) -> Tuple[float, float]:
 
 class LinearProgrammingOptimizer:
     def __init__(self, c: List[float], A: List[List[float]], b: List[float],
-                 operators: List[str], objective_type: str = 'max'): 
+                 operators: List[str], objective_type: str = 'max', backend: str = 'highs',
+                 region: FeasibleRegion = None): 
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend inconnu: {backend} (choix: {', '.join(BACKENDS)})")
+        self.backend = backend
         self.c = np.array(c, dtype=float)
         self.A = np.array(A, dtype=float) if A is not None else np.zeros((0, 2), dtype=float)
         self.b = np.array(b, dtype=float) if b is not None else np.zeros((0,), dtype=float)
         self.operators = list(operators or [])
         self.objective_type = (objective_type or 'max').lower()
+        # Forme canonique et région admissible, construites une seule fois
+        # (la région peut être fournie si elle est déjà connue, labels = indices des lignes)
+        self._scipy_form = None
+        self._halfplanes = None
+        self._region = region
+        self._cone = None
+        self._extreme_points = {}
+
+    def set_objective(self, c: List[float], objective_type: str = 'max'):
+        # Seul l'objectif change : la région, ses sommets et son cône de récession restent valides
+        self.c = np.array(c, dtype=float)
+        self.objective_type = (objective_type or 'max').lower()
+        self._scipy_form = None
 
     def prepare_for_scipy(self):
+        if self._scipy_form is not None:
+            return self._scipy_form
         c_scipy = -self.c if self.objective_type == 'max' else self.c
 
         A_ub = []
@@ -46,188 +82,625 @@ class LinearProgrammingOptimizer:
         b_eq = np.array(b_eq, dtype=float) if len(b_eq) else None
 
         bounds = [(0, None), (0, None)]
-        return c_scipy, A_ub, b_ub, A_eq, b_eq, bounds
+        self._scipy_form = (c_scipy, A_ub, b_ub, A_eq, b_eq, bounds)
+        return self._scipy_form
+
+    def _build_halfplanes(self) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+        # Forme a·x <= b ; label = indice de la contrainte d'origine,
+        # -1 pour x1 >= 0 et -2 pour x2 >= 0
+        if self._halfplanes is not None:
+            return self._halfplanes
+        A_all, b_all, rows, signs = constraint_halfplanes(self.A, self.b, self.operators)
+        # Ligne et signe de chaque demi-plan (pour ramener les duals aux lignes d'origine)
+        self._halfplane_rows = (rows, signs)
+        self._halfplanes = (A_all, b_all, rows.tolist())
+        return self._halfplanes
 
     def _build_all_ineq_with_nonneg(self) -> Tuple[np.ndarray, np.ndarray]: 
-        A_all = []
-        b_all = []
-        for i, op in enumerate(self.operators):
-            if op == '<=':
-                A_all.append(self.A[i]); b_all.append(self.b[i])
-            elif op == '>=':
-                A_all.append(-self.A[i]); b_all.append(-self.b[i])
-            elif op == '=':
-                A_all.append(self.A[i]); b_all.append(self.b[i])
-                A_all.append(-self.A[i]); b_all.append(-self.b[i])
-
-        A_all.extend([[-1.0, 0.0], [0.0, -1.0]])
-        b_all.extend([0.0, 0.0])
-
-        return np.array(A_all, dtype=float), np.array(b_all, dtype=float)
+        A_all, b_all, _ = self._build_halfplanes()
+        return A_all, b_all
+
+    def compute_feasible_region(self) -> FeasibleRegion:
+        if self._region is None:
+            with instrument.phase('region'):
+                A_all, b_all, labels = self._build_halfplanes()
+                self._region = intersect_halfplanes(A_all, b_all, labels)
+            instrument.count('halfplanes', len(b_all))
+        return self._region
         
+    def recession_cone(self) -> List[Tuple[float, float]]:
+        # Rayons extrêmes de {d : A·d <= 0, d >= 0}, calculés une fois (tri angulaire des normales)
+        if self._cone is None:
+            with instrument.phase('recession_cone'):
+                A_all, _, _ = self._build_halfplanes()
+                self._cone = recession_cone(A_all)
+        return list(self._cone)
+
     def find_extreme_points_manual(self, eps_axis=1e-8, eps_feas=1e-8, eps_det=1e-12) -> List[Tuple[float, float]]: 
-        A_all, b_all = self._build_all_ineq_with_nonneg()
-        extreme_points: List[Tuple[float, float]] = []
-        n = len(A_all)
+        # Intersection de demi-plans en O(m log m) au lieu des O(m³) paires testées
+        if eps_axis in self._extreme_points:
+            return list(self._extreme_points[eps_axis])
+        region = self.compute_feasible_region()
+        extreme_points: List[Tuple[float, float]] = [
+            (float(x), float(y)) for (x, y) in region.vertices
+            if x >= -eps_axis and y >= -eps_axis
+        ]
 
-        for i, j in combinations(range(n), 2):
-            A_sys = np.array([A_all[i], A_all[j]], dtype=float)
-            b_sys = np.array([b_all[i], b_all[j]], dtype=float)
+        if extreme_points:
+            ctr = np.mean(np.array(extreme_points), axis=0)
+            extreme_points.sort(key=lambda p: math.atan2(p[1] - ctr[1], p[0] - ctr[0]))
 
-            if abs(np.linalg.det(A_sys)) < eps_det:
+        self._extreme_points[eps_axis] = extreme_points
+        instrument.count('vertices', len(extreme_points))
+        return list(extreme_points)
+
+    def constraint_slacks(self, x) -> np.ndarray:
+        # Écart de chaque ligne en x : b - a·x pour '<=', a·x - b pour '>=', -|a·x - b| pour '='
+        r = self.A @ np.asarray(x, dtype=float) - self.b if len(self.b) else np.zeros(0)
+        ops = np.array(self.operators, dtype=object).reshape(-1)
+        return np.where(ops == '>=', r, np.where(ops == '=', -np.abs(r), -r))
+
+    def active_constraints(self, x, res=None, tol=1e-7) -> List[int]:
+        # Contraintes saturées en x : écart nul, ou multiplicateur non nul renvoyé par HiGHS.
+        # Indices des lignes, puis -1 / -2 pour x1 >= 0 / x2 >= 0.
+        slack = self.constraint_slacks(x)
+        active = slack <= tol * np.maximum(1.0, np.abs(self.b))
+        if len(self.b):
+            active &= np.hypot(self.A[:, 0], self.A[:, 1]) > 1e-12   # une ligne nulle ne porte rien
+        marginals = getattr(getattr(res, 'ineqlin', None), 'marginals', None)
+        if marginals is not None and len(marginals):
+            ub_rows = np.flatnonzero(np.isin(np.array(self.operators, dtype=object), ['<=', '>=']))
+            active[ub_rows[np.abs(np.asarray(marginals)) > tol]] = True
+        rows = np.flatnonzero(active).tolist()
+        rows += [lab for lab, v in ((-1, x[0]), (-2, x[1])) if v <= tol]
+        return rows
+
+    def optimal_face(self, x_star, active, tol=1e-9):
+        # Arête ou rayon optimal issu de x* en O(m) : on ne peut se déplacer à objectif constant
+        # que le long de ±perp(c), et seulement si aucune contrainte active ne l'interdit (normale
+        # active parallèle à c). Le sommet voisin est donné par un test du ratio.
+        # Retourne (optimal_points, recession_direction) ou None si c = 0.
+        c_norm = float(np.linalg.norm(self.c))
+        if c_norm <= tol:
+            return None
+        A_all, b_all, labels = self._build_halfplanes()
+        x = np.asarray(x_star, dtype=float)
+        norms = np.hypot(A_all[:, 0], A_all[:, 1])
+        is_active = np.isin(np.asarray(labels), active)
+        slack = np.maximum(b_all - A_all @ x, 0.0)
+        scale = max(1.0, float(np.abs(x).max()))
+
+        t = np.array([-self.c[1], self.c[0]]) / c_norm
+        ends, ray = [], None
+        for d in (t, -t):
+            ad = A_all @ d
+            if np.any(ad[is_active] > tol * norms[is_active]):
                 continue
-            try:
-                x = np.linalg.solve(A_sys, b_sys)
-            except Exception:
+            moving = (ad > tol * norms) & ~is_active
+            if not np.any(moving):
+                ray = (float(d[0]) + 0.0, float(d[1]) + 0.0)
                 continue
-
-            if x[0] < -eps_axis or x[1] < -eps_axis:
-                continue
-            if np.any(A_all @ x > b_all + eps_feas):
+            step = float(np.min(slack[moving] / ad[moving]))
+            if step > tol * scale:
+                ends.append(_to_tuple_float(x + step * d))
+
+        if ray is not None:
+            return (ends[:1] or [_to_tuple_float(x)]), ray
+        if len(ends) == 1:
+            ends.insert(0, _to_tuple_float(x))
+        return (ends or [_to_tuple_float(x)]), None
+
+    def _optimal_basis(self, N, c_max, tol=1e-9):
+        # Deux normales actives dont le cône contient c (multiplicateurs >= 0) : voisines de c
+        # dans l'ordre angulaire. Retourne (p, q) dans N, ou None.
+        if len(N) < 2:
+            return None
+        theta = np.arctan2(N[:, 1], N[:, 0])
+        c_norm = float(np.linalg.norm(c_max))
+        phi = math.atan2(c_max[1], c_max[0]) if c_norm > tol else float(theta[0])
+        rel = np.mod(theta - phi, 2 * math.pi)
+        rel[rel > 2 * math.pi - tol] = 0.0
+        order = np.argsort(rel, kind='stable')
+        for p, q in ((order[0], order[-1]), (order[0], order[1]), (order[-1], order[-2])):
+            det = N[p, 0] * N[q, 1] - N[p, 1] * N[q, 0]
+            if abs(det) <= tol * np.linalg.norm(N[p]) * np.linalg.norm(N[q]):
                 continue
+            y = np.linalg.solve(np.array([N[p], N[q]]).T, c_max)
+            if np.all(y >= -tol * max(1.0, c_norm)):
+                return int(p), int(q)
+        return None
+
+    def sensitivity(self, x_star, tol=1e-9) -> Dict:
+        # Analyse de sensibilité lue sur la base optimale en x* (aucune résolution supplémentaire) :
+        # prix duaux, écarts, intervalles de second membre et de coefficients de l'objectif.
+        # Listes indexées par ligne d'origine ; ±inf pour une borne ouverte.
+        x = np.asarray(x_star, dtype=float)
+        A_all, b_all, _ = self._build_halfplanes()
+        labels, signs = self._halfplane_rows
+        sense = 1.0 if self.objective_type == 'max' else -1.0
+        c_max = sense * self.c
+        m = len(self.b)
+
+        norms = np.hypot(A_all[:, 0], A_all[:, 1])
+        slack_all = np.maximum(b_all - A_all @ x, 0.0)
+        tight = (slack_all <= 1e-7 * np.maximum(1.0, np.abs(b_all))) & (norms > 1e-12)
+        cand = np.flatnonzero(tight)
+        pair = self._optimal_basis(A_all[cand], c_max, tol)
+        basis = [int(cand[pair[0]]), int(cand[pair[1]])] if pair is not None else []
+
+        ax = self.A @ x if m else np.zeros(0)
+        ops = np.array(self.operators, dtype=object).reshape(-1)
+        le, ge = ops == '<=', ops == '>='
+        duals = np.zeros(m)
+        reduced_costs = [0.0, 0.0]
+        # Ligne non de base : '<=' tient tant que b >= a·x*, '>=' tant que b <= a·x*
+        lo = np.where(le, ax, np.where(ge, -math.inf, self.b))
+        hi = np.where(le, math.inf, np.where(ge, ax, self.b))
+        objective_ranges = [(-math.inf, math.inf), (-math.inf, math.inf)]
+
+        if basis:
+            B = A_all[basis]
+            B_inv = np.linalg.inv(B)
+            y_B = B_inv.T @ c_max
+            for r, k in enumerate(basis):
+                # dz/db de la ligne : multiplicateur du demi-plan, ramené au signe de la ligne et au sens
+                i = int(labels[k])
+                if i < 0:
+                    # x_j >= 0 saturée : variation de z quand on force x_j > 0 (coût réduit)
+                    reduced_costs[-1 - i] -= float(sense * y_B[r])
+                    continue
+                duals[i] += sense * signs[k] * y_B[r]
+
+                # x(δ) = x* + δ·u tant que les autres demi-plans restent satisfaits
+                u = B_inv[:, r]
+                other = labels != i
+                other[basis] = False
+                nu = A_all[other] @ u
+                gap = slack_all[other]
+                up, down = nu > tol * norms[other], nu < -tol * norms[other]
+                d_hi = float(np.min(gap[up] / nu[up])) if np.any(up) else math.inf
+                d_lo = float(np.max(gap[down] / nu[down])) if np.any(down) else -math.inf
+                lo[i], hi[i] = sorted((self.b[i] + signs[k] * d_lo, self.b[i] + signs[k] * d_hi))
+
+            # Coefficients de l'objectif : la base reste optimale tant que ses multiplicateurs restent >= 0
+            for j in range(2):
+                w = B_inv[j]
+                t_lo = max([-y_B[r] / w[r] for r in range(2) if w[r] > tol] or [-math.inf])
+                t_hi = min([-y_B[r] / w[r] for r in range(2) if w[r] < -tol] or [math.inf])
+                objective_ranges[j] = tuple(sorted((float(self.c[j] + sense * t_lo),
+                                                    float(self.c[j] + sense * t_hi))))
 
-            if not any(abs(px - x[0]) <= 1e-7 and abs(py - x[1]) <= 1e-7 for (px, py) in extreme_points):
-                extreme_points.append((float(x[0]), float(x[1])))
+        return {
+            'duals': (duals + 0.0).tolist(),
+            'slacks': np.maximum(self.constraint_slacks(x), 0.0).tolist(),
+            'rhs_ranges': list(zip(lo.astype(float).tolist(), hi.astype(float).tolist())),
+            'objective_ranges': objective_ranges,
+            'reduced_costs': reduced_costs,
+            'basis': [int(labels[k]) for k in basis],
+        }
 
-        if extreme_points:
-            ctr = np.mean(np.array(extreme_points), axis=0)
-            extreme_points.sort(key=lambda p: math.atan2(p[1] - ctr[1], p[0] - ctr[0]))
+    # ------------------------------------------------------------ paramétrique
+
+    def _parametric_context(self, parameter: str, index: int) -> Dict:
+        # Géométrie commune à toutes les valeurs de θ, construite une fois par analyse
+        if parameter not in PARAMETERS:
+            raise ValueError(f"Paramètre inconnu: {parameter} (choix: {', '.join(PARAMETERS)})")
+        size = len(self.b) if parameter == 'rhs' else 2
+        if not 0 <= index < size:
+            raise ValueError(f"Indice hors limites pour {parameter}: {index}")
+        sense = 1.0 if self.objective_type == 'max' else -1.0
+        ctx = {'parameter': parameter, 'index': index, 'sense': sense}
+        # Le cône de récession ne dépend pas de b : non borné pour un θ admissible <=> pour tous
+        cone = np.array(self.recession_cone(), dtype=float).reshape(-1, 2)
+
+        if parameter == 'objective':
+            region = self.compute_feasible_region()
+            ctx.update(region=region, cone=cone)
+            return ctx
+
+        # b_i = θ : région sans la ligne i, coupée par la droite a_i·x = θ
+        A_all, b_all, _ = self._build_halfplanes()
+        labels, _ = self._halfplane_rows
+        keep = labels != index
+        N, h = A_all[keep], b_all[keep]
+        region = intersect_halfplanes(N, h, labels[keep].tolist())
+        a = self.A[index]
+        op = self.operators[index]
+        s = -1.0 if op == '>=' else 1.0
+        c_max = sense * self.c
+        c_tol = 1e-9 * max(1.0, float(np.linalg.norm(c_max)))
+        ctx.update(region=region, N=N, h=h, a=a, op=op, s=s,
+                   unbounded=bool(np.any(cone @ c_max > c_tol)) if len(cone) else False)
+        if region.empty:
+            return ctx
+
+        # Sommet optimal sans la ligne i (n·x minimal) ; pour φ = s·θ >= n·x_u
+        # il reste admissible, en deçà l'optimum est sur la droite a·x = θ
+        V = region.vertex_array
+        D = np.array(recession_cone(N), dtype=float).reshape(-1, 2)
+        n = s * a
+        values = V @ c_max
+        z_u = float(values.max())
+        best = np.flatnonzero(values >= z_u - 1e-9 * max(1.0, abs(z_u)))
+        nv = V[best] @ n
+        x_u = V[best[np.argmin(nv)]]
+        knee = float(nv.min())
+        if len(D) and np.any(D @ c_max > c_tol):
+            knee = math.inf              # sans la ligne i : non borné, la ligne reste toujours active
+        nV = V @ a
+        ctx.update(x_u=x_u, knee=knee, vertex_values=nV,
+                   feasible=(float(nV.min()) if not (len(D) and np.any(D @ a < -1e-12)) else -math.inf,
+                             float(nV.max()) if not (len(D) and np.any(D @ a > 1e-12)) else math.inf))
+        return ctx
+
+    def _parametric_values(self, ctx: Dict, thetas):
+        # z(θ), x*(θ) et statut (0 optimal, 2 vide, 3 non borné) sur une grille, en NumPy
+        thetas = np.asarray(thetas, dtype=float).reshape(-1)
+        G = len(thetas)
+        z = np.full(G, np.nan)
+        X = np.full((G, 2), np.nan)
+        status = np.full(G, 2, dtype=int)
+        region = ctx['region']
+        if region.empty or G == 0:
+            return z, X, status
+        sense = ctx['sense']
+
+        if ctx['parameter'] == 'objective':
+            j = ctx['index']
+            V = region.vertex_array
+            if len(V) == 0:
+                return z, X, status
+            cone = ctx['cone']
+            c_base = self.c.copy()
+            c_base[j] = 0.0
+            base, slope = V @ c_base, V[:, j]
+            rows = max(1, PARAMETRIC_CHUNK // max(1, len(V)))
+            for k in range(0, G, rows):
+                t = thetas[k:k + rows]
+                best = np.argmax(sense * (base[None, :] + t[:, None] * slope[None, :]), axis=1)
+                X[k:k + rows] = V[best]
+            z[:] = X @ c_base + thetas * X[:, j]
+            status[:] = 0
+            if len(cone):
+                c_norm = np.maximum(1.0, np.hypot(np.where(j == 0, thetas, c_base[0]),
+                                                  np.where(j == 1, thetas, c_base[1])))
+                along = sense * ((cone @ c_base)[None, :] + thetas[:, None] * cone[:, j][None, :])
+                unbounded = np.any(along > 1e-9 * c_norm[:, None], axis=1)
+                status[unbounded] = 3
+                z[unbounded] = sense * math.inf
+                X[unbounded] = np.nan
+            return z, X, status
+
+        a, s, op = ctx['a'], ctx['s'], ctx['op']
+        na = float(np.hypot(a[0], a[1]))
+        scale = max(1.0, float(np.max(np.abs(thetas))) / na if na > 1e-12 else 1.0,
+                    float(np.max(np.abs(ctx['h']))) if len(ctx['h']) else 1.0)
+        tol = 1e-9 * scale
+
+        if na <= 1e-12:
+            # Ligne nulle : 0 op θ, l'optimum ne dépend pas de θ
+            ok = thetas >= -tol if op == '<=' else thetas <= tol if op == '>=' else np.abs(thetas) <= tol
+            status[ok] = 3 if ctx['unbounded'] else 0
+            z[ok] = sense * math.inf if ctx['unbounded'] else float(self.c @ ctx['x_u'])
+            if not ctx['unbounded']:
+                X[ok] = ctx['x_u']
+            return z, X, status
+
+        if ctx['unbounded']:
+            lo, hi = ctx['feasible']
+            ok = (thetas >= lo - tol) if op == '<=' else (thetas <= hi + tol) if op == '>=' \
+                else (thetas >= lo - tol) & (thetas <= hi + tol)
+            status[ok] = 3
+            z[ok] = sense * math.inf
+            return z, X, status
+
+        # Au-delà du coude (inégalité), la ligne i n'est plus active : optimum sans elle
+        on_line = np.ones(G, dtype=bool) if op == '=' else s * thetas < ctx['knee']
+        flat = ~on_line
+        X[flat] = ctx['x_u']
+        status[flat] = 0
+
+        # Sur la droite a·x = θ : x = θ·a/|a|² + t·p, intervalle de t par les autres demi-plans
+        N, h = ctx['N'], ctx['h']
+        p = np.array([-a[1], a[0]]) / na
+        q = N @ a / na ** 2
+        sp = N @ p
+        norms = np.hypot(N[:, 0], N[:, 1])
+        pos, neg = sp > 1e-12 * norms, sp < -1e-12 * norms
+        par = ~(pos | neg) & (norms > 1e-12)
+        cp = float(sense * self.c @ p)
+        c_tol = 1e-9 * max(1.0, float(np.linalg.norm(self.c)))
+        idx = np.flatnonzero(on_line)
+        rows = max(1, PARAMETRIC_CHUNK // max(1, len(h)))
+        for k in range(0, len(idx), rows):
+            sel = idx[k:k + rows]
+            t = thetas[sel]
+            rhs = h[None, :] - t[:, None] * q[None, :]
+            t_hi = np.min(rhs[:, pos] / sp[pos], axis=1) if np.any(pos) else np.full(len(sel), math.inf)
+            t_lo = np.max(rhs[:, neg] / sp[neg], axis=1) if np.any(neg) else np.full(len(sel), -math.inf)
+            ok = np.all(rhs[:, par] >= -tol, axis=1) & (t_lo <= t_hi + tol)
+            t_lo, t_hi = np.minimum(t_lo, t_hi), np.maximum(t_lo, t_hi)
+            if cp > c_tol:
+                t_opt = t_hi
+            elif cp < -c_tol:
+                t_opt = t_lo
+            else:
+                t_opt = np.where(np.isfinite(t_lo), t_lo, np.where(np.isfinite(t_hi), t_hi, 0.0))
+            finite = np.isfinite(t_opt)
+            pts = t[:, None] * a[None, :] / na ** 2 + np.where(finite, t_opt, 0.0)[:, None] * p[None, :]
+            X[sel[ok & finite]] = pts[ok & finite]
+            status[sel[ok & finite]] = 0
+            status[sel[ok & ~finite]] = 3
+        done = status == 0
+        z[done] = X[done] @ self.c
+        z[status == 3] = sense * math.inf
+        return z, X, status
+
+    def parametric_grid(self, parameter: str, index: int, thetas) -> Dict:
+        """Évalue z(θ) et x*(θ) sur une grille de θ, sans re-résolution (NumPy, par blocs).
+
+        parameter='rhs' : b[index] = θ ; parameter='objective' : c[index] = θ.
+        z vaut nan si le problème est vide, ±inf s'il est non borné.
+        """
+        ctx = self._parametric_context(parameter, index)
+        thetas = np.asarray(thetas, dtype=float).reshape(-1)
+        z, X, status = self._parametric_values(ctx, thetas)
+        return {
+            'parameter': parameter, 'index': index,
+            'theta': thetas.tolist(), 'z': z.tolist(), 'x': [tuple(p) for p in X.tolist()],
+            'status': [_PARAMETRIC_STATUS[k] for k in status.tolist()],
+        }
 
-        return extreme_points
+    def parametric_analysis(self, parameter: str, index: int, theta_min: float, theta_max: float) -> Dict:
+        """Analyse paramétrique exacte de b[index] = θ ou c[index] = θ sur [theta_min, theta_max].
+
+        Les points où la base optimale peut changer sont connus à l'avance : valeurs a_i·v aux
+        sommets de la région sans la ligne i (second membre), ou θ qui rend c(θ) orthogonal à
+        une arête (objectif). Entre deux tels points z(θ) et x*(θ) sont affines : deux
+        évaluations par intervalle suffisent, puis les morceaux alignés sont fusionnés.
+
+        Le statut est aussi évalué en chaque point de rupture : un θ isolé dont le statut ou la
+        valeur diffère de ses deux voisins donne un segment de longueur nulle.
+
+        Retourne segments [{'theta': (t0, t1), 'closed': (bool, bool), 'status', 'z': (z0, z1),
+        'slope', 'x': (x0, x1)}], qui partitionnent [theta_min, theta_max] (closed indique si
+        chaque extrémité appartient au segment ; en général [t0, t1)), et breakpoints (θ où la
+        pente, la solution ou le statut change).
+        """
+        theta_min, theta_max = float(theta_min), float(theta_max)
+        if not (math.isfinite(theta_min) and math.isfinite(theta_max)) or theta_min > theta_max:
+            raise ValueError(f"Intervalle de θ invalide: [{theta_min}, {theta_max}]")
+        ctx = self._parametric_context(parameter, index)
+        span = max(1.0, abs(theta_min), abs(theta_max))
+
+        candidates = [theta_min, theta_max]
+        region = ctx['region']
+        if not region.empty and parameter == 'rhs':
+            candidates += ctx['vertex_values'].tolist()
+            knee = ctx['knee']
+            if math.isfinite(knee):
+                candidates.append(ctx['s'] * knee)
+        elif not region.empty:
+            j = ctx['index']
+            c_base = self.c.copy()
+            c_base[j] = 0.0
+            dirs = [np.subtract(q, p) for p, q in region.edges] + [np.array(d) for d in region.directions]
+            dirs += list(ctx['cone'])
+            for d in dirs:
+                if abs(d[j]) > 1e-12 * max(1.0, float(np.hypot(d[0], d[1]))):
+                    candidates.append(-float(c_base @ d) / d[j])
+        cuts = np.unique(np.clip(np.array(candidates, dtype=float), theta_min, theta_max))
+        cuts = cuts[np.concatenate([[True], np.diff(cuts) > 1e-12 * span])]
+        if cuts[-1] < theta_max:
+            cuts[-1] = theta_max
+
+        # Statut et valeur aux points de coupure eux-mêmes : un θ isolé peut être réalisable
+        zc, Xc, sc = self._parametric_values(ctx, cuts)
+        tol = 1e-9 * max(span, float(np.max(np.abs(self.c))) if len(self.c) else 1.0)
+        points = [((t, t), int(sc[k]), (zc[k], zc[k]) if sc[k] == 0 else None, 0.0 if sc[k] == 0 else None,
+                   (Xc[k], Xc[k]) if sc[k] == 0 else None, (True, True)) for k, t in enumerate(cuts)]
+        if len(cuts) == 1:
+            pieces = points
+        else:
+            # Deux points intérieurs par intervalle : les extrémités sont extrapolées (pas d'ambiguïté aux coudes)
+            t0, t1 = cuts[:-1], cuts[1:]
+            inner = np.column_stack([t0 + (t1 - t0) / 3.0, t0 + 2.0 * (t1 - t0) / 3.0]).reshape(-1)
+            z, X, status = self._parametric_values(ctx, inner)
+            intervals = []
+            for k in range(len(t0)):
+                u, v = 2 * k, 2 * k + 1
+                w = t1[k] - t0[k]
+                if status[u] != 0:
+                    intervals.append([(t0[k], t1[k]), int(status[u]), None, None, None, [False, False]])
+                    continue
+                slope = (z[v] - z[u]) * 3.0 / w
+                x_slope = (X[v] - X[u]) * 3.0 / w
+                intervals.append([(t0[k], t1[k]), 0,
+                                  (z[u] - slope * w / 3.0, z[v] + slope * w / 3.0), slope,
+                                  (X[u] - x_slope * w / 3.0, X[v] + x_slope * w / 3.0), [False, False]])
+
+            def fits(piece, end, k):
+                # Le point de coupure k prolonge l'intervalle : même statut et z continu
+                if piece[1] != sc[k]:
+                    return False
+                return sc[k] != 0 or abs(piece[2][end] - zc[k]) <= tol * max(1.0, abs(zc[k]))
+
+            # Chaque point de coupure rejoint l'intervalle de droite ([t0, t1)), sinon celui de
+            # gauche, sinon devient un segment de longueur nulle
+            pieces = []
+            for k in range(len(cuts)):
+                if k < len(intervals) and fits(intervals[k], 0, k):
+                    intervals[k][5][0] = True
+                elif k > 0 and fits(intervals[k - 1], 1, k):
+                    intervals[k - 1][5][1] = True
+                else:
+                    pieces.append(points[k])
+                if k < len(intervals):
+                    pieces.append(intervals[k])
+            pieces = [tuple(piece[:5]) + (tuple(piece[5]),) for piece in pieces]
+
+        # Morceaux consécutifs de même statut, même pente et même x*(θ) affine : fusionnés
+        merged = [pieces[0]]
+        for piece in pieces[1:]:
+            prev = merged[-1]
+            (a0, a1), (b0, b1) = prev[0], piece[0]
+            same = piece[1] == prev[1] and a1 > a0 and b1 > b0
+            if same and piece[1] == 0:
+                xs_prev = (prev[4][1] - prev[4][0]) / (a1 - a0)
+                xs_next = (piece[4][1] - piece[4][0]) / (b1 - b0)
+                same = (abs(piece[3] - prev[3]) <= tol * max(1.0, abs(prev[3]))
+                        and np.allclose(prev[4][1], piece[4][0], rtol=1e-9, atol=tol)
+                        and np.allclose(xs_prev, xs_next, rtol=1e-9, atol=tol))
+            if same:
+                merged[-1] = ((a0, b1), prev[1],
+                              None if prev[2] is None else (prev[2][0], piece[2][1]), prev[3],
+                              None if prev[4] is None else (prev[4][0], piece[4][1]),
+                              (prev[5][0], piece[5][1]))
+            else:
+                merged.append(piece)
+
+        segments = [{
+            'theta': (float(th[0]), float(th[1])),
+            'closed': (bool(cl[0]), bool(cl[1])),
+            'status': _PARAMETRIC_STATUS[st],
+            'z': None if zz is None else (float(zz[0]), float(zz[1])),
+            'slope': None if sl is None else float(sl),
+            'x': None if xx is None else (_to_tuple_float(xx[0]), _to_tuple_float(xx[1])),
+        } for th, st, zz, sl, xx, cl in merged]
+        current = float(self.b[index]) if parameter == 'rhs' else float(self.c[index])
+        return {
+            'parameter': parameter, 'index': index, 'current': current,
+            'theta_range': (theta_min, theta_max),
+            'segments': segments,
+            'breakpoints': sorted({seg['theta'][1] for seg in segments[:-1]}),
+        }
 
     def evaluate_objective(self, point: Tuple[float, float]) -> float:
         return float(self.c[0] * point[0] + self.c[1] * point[1])
 
     def check_multiple_solutions(self, x_opt: Tuple[float, float], extreme_points, atol=1e-3, rtol=1e-6):
         z_star = self.evaluate_objective(x_opt)
-        optimal_points = []
-        for p in extreme_points:
-            if abs(self.evaluate_objective(p) - z_star) <= (atol + rtol * max(1.0, abs(z_star))):
-                optimal_points.append(p)
-
-        if len(optimal_points) > 2: 
-            pts = np.array(optimal_points, dtype=float)
-            dmax = -1.0; ii=jj=0
-            for i in range(len(pts)):
-                for j in range(i+1, len(pts)):
-                    d = np.linalg.norm(pts[i]-pts[j])
-                    if d > dmax:
-                        dmax = d; ii, jj = i, j
-            optimal_points = [tuple(pts[ii]), tuple(pts[jj])]
-        return optimal_points
+        if not len(extreme_points):
+            return []
+        pts = np.asarray(extreme_points, dtype=float).reshape(-1, 2)
+        z = evaluate_points(pts, self.c)
+        pts = pts[np.abs(z - z_star) <= (atol + rtol * max(1.0, abs(z_star)))]
+
+        if len(pts) > 2: 
+            ii, jj = farthest_pair(pts)
+            return [tuple(pts[ii]), tuple(pts[jj])]
+        return [tuple(p) for p in pts]
 
     def reconstruct_optimal_edge_points(self, z_star: float, tol_val=1e-3) -> List[Tuple[float, float]]: 
         A_all, b_all = self._build_all_ineq_with_nonneg()
 
-        def feasible(x):
-            return x[0] >= -1e-8 and x[1] >= -1e-8 and np.all(A_all @ x <= b_all + 1e-8)
-
-        cand: List[Tuple[float, float]] = []
-        n = len(A_all)
-        for i in range(n):
-            for j in range(i+1, n):
-                M = np.vstack([A_all[i], A_all[j]])
-                if abs(np.linalg.det(M)) < 1e-12:
-                    continue
-                try:
-                    x = np.linalg.solve(M, np.array([b_all[i], b_all[j]]))
-                except Exception:
-                    continue
-                if feasible(x) and abs(self.evaluate_objective((x[0], x[1])) - z_star) <= tol_val:
-                    cand.append((float(x[0]), float(x[1])))
-
-        uniq: List[Tuple[float, float]] = []
-        for p in cand:
-            if not any(abs(p[0]-q[0])<=1e-7 and abs(p[1]-q[1])<=1e-7 for q in uniq):
-                uniq.append(p)
+        # Toutes les intersections, l'admissibilité et l'objectif en une passe vectorisée
+        pts = enumerate_vertices(A_all, b_all, eps_feas=1e-8, eps_det=1e-12)
+        pts = pts[np.abs(evaluate_points(pts, self.c) - z_star) <= tol_val]
+        uniq = [(float(x), float(y)) for x, y in pts]
 
         if len(uniq) <= 1:
             return uniq
 
-        pts = np.array(uniq, dtype=float)
-        dmax = -1.0; ii=jj=0
-        for i in range(len(pts)):
-            for j in range(i+1, len(pts)):
-                d = np.linalg.norm(pts[i]-pts[j])
-                if d > dmax:
-                    dmax = d; ii, jj = i, j
-        return [tuple(pts[ii]), tuple(pts[jj])]
+        ii, jj = farthest_pair(pts)
+        return [uniq[ii], uniq[jj]]
 
     def detect_region_boundedness_via_aux_lp(self) -> bool: 
-        _, A_ub, b_ub, A_eq, b_eq, bounds = self.prepare_for_scipy()
-        if A_ub is None:
-            A_ub = np.zeros((0, 2)); b_ub = np.zeros((0,))
-        if A_eq is None:
-            A_eq = np.zeros((0, 2)); b_eq = np.zeros((0,))
-
-        res_x1 = linprog(c=np.array([-1.0, 0.0]), A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
-        res_x2 = linprog(c=np.array([0.0, -1.0]), A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
-        if res_x1.status == 3 or res_x2.status == 3:
-            return False
-        return True
+        # Région non vide bornée <=> cône de récession réduit à {0} ; une région vide est considérée bornée
+        return self.compute_feasible_region().empty or not self.recession_cone()
 
-    def detect_recession_direction(self, x_opt=None, tol=1e-6): 
-        _, A_ub, _, A_eq, _, _ = self.prepare_for_scipy()
-        if A_ub is None:
-            A_ub = np.zeros((0, 2))
-        if A_eq is None:
-            A_eq = np.zeros((0, 2))
+    def find_optimal_ray(self, tol=1e-6):
+        # Rayon extrême du cône de récession le long duquel l'objectif reste constant
+        c_norm = max(1.0, float(np.linalg.norm(self.c)))
+        for d in self.recession_cone():
+            if abs(float(self.c @ np.array(d))) <= tol * c_norm:
+                return (float(d[0]), float(d[1]))
+        return None
 
-        
-        b_ub_zero = np.zeros(A_ub.shape[0]) if A_ub.shape[0] > 0 else np.zeros(0)
-        b_eq_zero = np.zeros(A_eq.shape[0]) if A_eq.shape[0] > 0 else np.zeros(0)
-        
-        candidates = [
-            np.array([1.0, 0.0]),  
-            np.array([0.0, 1.0]),   
-            np.array([1.0, 1.0]),  
-            np.array([1.0, 2.0]),   
-            np.array([2.0, 1.0]),   
-        ]
+    def detect_recession_direction(self, x_opt=None, tol=1e-6): 
+        # Rayon extrême exact du cône de récession avec c·d ≈ 0 (x_opt gardé pour compatibilité)
+        c_norm = max(1.0, float(np.linalg.norm(self.c)))
+        for d in self.recession_cone():
+            c_dot_d = float(self.c @ np.array(d))
+            if abs(c_dot_d) <= tol * c_norm:
+                return np.array(d), c_dot_d
+        return None, None
 
-        if x_opt is not None: 
-            c_perp = np.array([-self.c[1], self.c[0]])
-            if np.linalg.norm(c_perp) > 1e-6:
-                candidates.append(c_perp / np.linalg.norm(c_perp))
+    def _solve_highs(self):
+        from scipy.optimize import linprog
 
-        for d_test in candidates: 
-            if np.linalg.norm(d_test) < 1e-10:
-                continue
-            d_test = d_test / np.linalg.norm(d_test)
-            
-            # Vérifier si c'est une direction de récession 
-            if A_ub.shape[0] > 0:
-                violations = A_ub @ d_test
-                if np.any(violations > 1e-6):
-                    continue
-
-            if A_eq.shape[0] > 0:
-                eq_violations = np.abs(A_eq @ d_test)
-                if np.any(eq_violations > 1e-6):
-                    continue
-            
-            if x_opt is not None:
-                test_point = np.array(x_opt) + 10 * d_test 
-                if test_point[0] < -1e-6 or test_point[1] < -1e-6:
-                    continue
-                # Vérifier les contraintes
-                if A_ub.shape[0] > 0:
-                    ub_vals = A_ub @ test_point
-                    b_vals = np.array([self.b[i] for i, op in enumerate(self.operators) if op in ['<=', '>=']])
-                    if len(b_vals) > 0 and np.any(ub_vals > b_vals + 1e-6):
-                        continue
-            
-            c_dot_d = np.dot(self.c, d_test)
-            if abs(c_dot_d) > tol:
-                continue 
-            return d_test, float(c_dot_d) 
-        return None, None 
-    def optimize(self) -> Dict:
         c_scipy, A_ub, b_ub, A_eq, b_eq, bounds = self.prepare_for_scipy()
-        res = linprog(c=c_scipy, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
-
-        extreme_points = self.find_extreme_points_manual()
-        evaluations = [(p, self.evaluate_objective(p)) for p in extreme_points]
+        with instrument.phase('linprog'):
+            res = linprog(c=c_scipy, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
+        instrument.count('linprog_iterations', getattr(res, 'nit', 0) or 0)
+        return res
+
+    def _solve_seidel(self):
+        A_all, b_all, _ = self._build_halfplanes()
+        c_max = self.c if self.objective_type == 'max' else -self.c
+        with instrument.phase('seidel'):
+            return seidel_lp(c_max, A_all, b_all)
+
+    def _solve_region(self, tol=1e-9):
+        # max c·x lu sur la géométrie : rayon améliorant -> non borné, sinon meilleur sommet
+        region = self.compute_feasible_region()
+        if region.empty:
+            return LPResult(2)
+        c_max = self.c if self.objective_type == 'max' else -self.c
+        c_norm = max(1.0, float(np.linalg.norm(c_max)))
+        if any(float(c_max @ np.array(d)) > tol * c_norm for d in self.recession_cone()):
+            return LPResult(3)
+        V = region.vertex_array
+        if len(V) == 0:
+            return LPResult(2)
+        values = V @ c_max
+        z = float(values.max())
+        # Égalités : le sommet optimal le plus proche de l'origine (comme HiGHS)
+        best = np.flatnonzero(values >= z - tol * max(1.0, abs(z)))
+        x = V[best[np.argmin(np.abs(V[best]).sum(axis=1))]]
+        return LPResult(0, x, float(c_max @ x))
+
+    def _solve(self):
+        if self.backend == 'seidel':
+            return self._solve_seidel()
+        if self.backend == 'region':
+            return self._solve_region()
+        res = self._solve_highs()
+        if self.backend == 'check':
+            self._cross_check(res, self._solve_seidel())
+        return res
+
+    def _cross_check(self, res, ref, rtol=1e-6):
+        status = res.status if res.status in (0, 2, 3) else None
+        if status != ref.status:
+            raise AssertionError(f"Backends en désaccord: highs status={res.status}, seidel status={ref.status}")
+        if status == 0:
+            z_h = self.evaluate_objective(res.x)
+            z_s = self.evaluate_objective(ref.x)
+            if abs(z_h - z_s) > rtol * max(1.0, abs(z_h)):
+                raise AssertionError(f"Backends en désaccord: highs z={z_h}, seidel z={z_s}")
+
+    def geometry(self) -> Dict:
+        """Géométrie de la région partagée avec le tracé : sommets, arêtes, rayons, polygone et labels."""
+        return self.compute_feasible_region().to_dict()
+
+    def optimize(self, sensitivity: bool = True) -> Dict:
+        """Résout le programme ; sensitivity=False omet result['sensitivity'] (calculée ailleurs par l'appelant)."""
+        with instrument.recording() as rec:
+            result = self._optimize(sensitivity)
+            # Le tracé relit ces sommets et arêtes au lieu de refaire les intersections
+            with instrument.phase('geometry'):
+                result['geometry'] = self.geometry()
+        return instrument.attach(rec, result)
+
+    def _optimize(self, sensitivity: bool) -> Dict:
+        res = self._solve()
+
+        # Une seule construction géométrique : sommets, bornitude, rayons et arête optimale
+        with instrument.phase('extreme_points'):
+            extreme_points = self.find_extreme_points_manual()
+        values = evaluate_points(extreme_points, self.c) if extreme_points else []
+        evaluations = [(p, float(v)) for p, v in zip(extreme_points, values)]
 
         # infeasible
         if res.status == 2:
@@ -256,31 +729,26 @@ class LinearProgrammingOptimizer:
                 'objective_type': self.objective_type, 'all_evaluations': evaluations
             }
 
-        # Optimal fini trouvé par scipy
+        # Optimal fini trouvé par le backend
         x_star = (float(res.x[0]), float(res.x[1]))
         z_star = self.evaluate_objective(x_star) 
 
-        # Vérifier si région bornée
-        region_bounded = self.detect_region_boundedness_via_aux_lp()
-        
-        # Chercher direction de récession (en passant x_star)
-        d, dir_val = self.detect_recession_direction(x_opt=x_star, tol=1e-5)
-        recession_direction = None
-        if d is not None:
-            recession_direction = (float(d[0]), float(d[1])) 
-
-        optimal_points = self.check_multiple_solutions(x_star, extreme_points, atol=1e-3, rtol=1e-6)
-
-        if len(optimal_points) < 2:
-            rebuilt = self.reconstruct_optimal_edge_points(z_star, tol_val=1e-3)
-            if len(rebuilt) >= 2:
-                optimal_points = rebuilt 
+        region_bounded = not self.recession_cone()
+        with instrument.phase('active'):
+            active = self.active_constraints(x_star, res)
 
+        # Optima alternatifs lus sur l'ensemble actif ; c = 0 : toute la région est optimale
+        with instrument.phase('optimal_face'):
+            face = self.optimal_face(x_star, active)
+            if face is None:
+                recession_direction = self.find_optimal_ray(tol=1e-9)
+                optimal_points = self.check_multiple_solutions(x_star, extreme_points, atol=1e-3, rtol=1e-6)
+            else:
+                optimal_points, recession_direction = face
 
-        
         # CAS 1: Région non bornée + direction de récession
         if not region_bounded and recession_direction is not None: 
-            return {
+            result = {
                 'success': True, 'status': 'optimal', 'x': [x_star[0], x_star[1]], 'z': z_star,
                 'message': '✅ INFINITÉ DE SOLUTIONS (rayon optimal)',
                 'extreme_points': [tuple(map(float, p)) for p in extreme_points],
@@ -290,12 +758,13 @@ class LinearProgrammingOptimizer:
                 'all_evaluations': [(tuple(map(float, p)), float(v)) for p, v in evaluations],
                 'solution_type': 'infinite_edge',
                 'region_bounded': False,
-                'recession_direction': recession_direction
+                'recession_direction': recession_direction,
+                'active_constraints': active
             }
 
         # CAS 2: région bornée, plusieurs points optimaux
-        if len(optimal_points) >= 2:
-            return {
+        elif len(optimal_points) >= 2:
+            result = {
                 'success': True, 'status': 'optimal', 'x': [x_star[0], x_star[1]], 'z': z_star,
                 'message': '✅ INFINITÉ DE SOLUTIONS (arête optimale)',
                 'extreme_points': [tuple(map(float, p)) for p in extreme_points],
@@ -305,25 +774,83 @@ class LinearProgrammingOptimizer:
                 'all_evaluations': [(tuple(map(float, p)), float(v)) for p, v in evaluations],
                 'solution_type': 'infinite_edge',
                 'region_bounded': bool(region_bounded),
-                'recession_direction': recession_direction
+                'recession_direction': recession_direction,
+                'active_constraints': active
             }
 
         # CAS 3: Solution unique
-        return {
-            'success': True, 'status': 'optimal', 'x': [x_star[0], x_star[1]], 'z': z_star,
-            'message': '✅ OPTIMUM UNIQUE',
-            'extreme_points': [tuple(map(float, p)) for p in extreme_points],
-            'optimal_point': x_star, 'optimal_value': z_star,
-            'optimal_points': [x_star],
-            'objective_type': self.objective_type,
-            'all_evaluations': [(tuple(map(float, p)), float(v)) for p, v in evaluations],
-            'solution_type': 'unique',
-            'region_bounded': bool(region_bounded),
-            'recession_direction': recession_direction
-        }
+        else:
+            result = {
+                'success': True, 'status': 'optimal', 'x': [x_star[0], x_star[1]], 'z': z_star,
+                'message': '✅ OPTIMUM UNIQUE',
+                'extreme_points': [tuple(map(float, p)) for p in extreme_points],
+                'optimal_point': x_star, 'optimal_value': z_star,
+                'optimal_points': [x_star],
+                'objective_type': self.objective_type,
+                'all_evaluations': [(tuple(map(float, p)), float(v)) for p, v in evaluations],
+                'solution_type': 'unique',
+                'region_bounded': bool(region_bounded),
+                'recession_direction': recession_direction,
+                'active_constraints': active
+            }
+
+        if sensitivity:
+            with instrument.phase('sensitivity'):
+                result['sensitivity'] = self.sensitivity(x_star)
+        return result
 
 
 def solve_linear_program(c: List[float], A: List[List[float]], b: List[float],
-                        operators: List[str], objective_type: str = 'max') -> Dict:
-    optimizer = LinearProgrammingOptimizer(c, A, b, operators, objective_type)
-    return optimizer.optimize()
+                        operators: List[str], objective_type: str = 'max', backend: str = 'highs',
+                        presolve: bool = True, sensitivity: bool = True) -> Dict:
+    """Résout le programme (présolution comprise) ; sensitivity=False omet result['sensitivity']."""
+    with instrument.recording() as rec:
+        result = _solve_linear_program(c, A, b, operators, objective_type, backend, presolve, sensitivity)
+    return instrument.attach(rec, result)
+
+
+def _solve_linear_program(c, A, b, operators, objective_type, backend, presolve, sensitivity) -> Dict:
+    if not presolve:
+        optimizer = LinearProgrammingOptimizer(c, A, b, operators, objective_type, backend=backend)
+        return optimizer.optimize(sensitivity)
+
+    # Présolution : doublons, lignes parallèles/nulles/redondantes retirées, paires incompatibles détectées
+    with instrument.phase('presolve'):
+        reduced = presolve_problem(A if A is not None else np.zeros((0, 2)),
+                                   b if b is not None else [], operators or [])
+    instrument.count('rows_removed', len(reduced['removed']))
+    summary = {'row_map': reduced['row_map'], 'removed': reduced['removed'],
+               'conflict': reduced['conflict']}
+    if reduced['infeasible']:
+        return {
+            'success': False, 'status': 'infeasible', 'x': [None, None], 'z': None,
+            'message': conflict_message(reduced['conflict']),
+            'extreme_points': [], 'optimal_points': [], 'solution_type': 'no_solution',
+            'region_bounded': False, 'objective_type': (objective_type or 'max').lower(),
+            'all_evaluations': [], 'presolve': summary,
+            'geometry': FeasibleRegion(empty=True).to_dict()
+        }
+
+    # Même région (seules des lignes inutiles ont été retirées) : labels ramenés aux lignes réduites
+    region = reduced['region']
+    if region is not None:
+        region = region.relabel({i: k for k, i in enumerate(reduced['row_map'])})
+    optimizer = LinearProgrammingOptimizer(c, reduced['A'], reduced['b'], reduced['operators'],
+                                           objective_type, backend=backend, region=region)
+    # Sensibilité calculée une seule fois, sur les lignes d'origine (voir plus bas)
+    result = optimizer.optimize(sensitivity=False)
+    result['presolve'] = summary
+    with instrument.phase('remap'):
+        result['geometry'] = optimizer.compute_feasible_region().relabel(dict(enumerate(reduced['row_map']))).to_dict()
+        if 'active_constraints' in result:
+            # Indices des lignes réduites -> lignes d'origine ; les lignes retirées mais saturées en x* le sont aussi
+            full = LinearProgrammingOptimizer(c, A, b, operators, objective_type)
+            removed = [i for i, _ in reduced['removed']]
+            tight = set(full.active_constraints(result['x'])) & set(removed)
+            rows = {reduced['row_map'][k] for k in result['active_constraints'] if k >= 0} | tight
+            result['active_constraints'] = sorted(rows) + [k for k in result['active_constraints'] if k < 0]
+            # Sensibilité sur les lignes d'origine (les lignes retirées ont leur propre écart et intervalle)
+            if sensitivity:
+                with instrument.phase('sensitivity'):
+                    result['sensitivity'] = full.sensitivity(result['x'])
+    return result
@@ -1,234 +1,302 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.patches import Polygon, FancyArrowPatch
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
 
-def create_plot(A, b, solution, c, obj_type, operators=None, optimal_points=None, 
-                region_bounded=True, status='optimal', solver_result=None):
-
-    if operators is None:
-        operators = ['<='] * len(A)
-    
-    A = np.array(A, dtype=float)
-    b = np.array(b, dtype=float)
-    c = np.array(c, dtype=float)
-    
-    # Récupérer la direction de récession depuis solver_result
-    recession_direction = None
-    if solver_result:
-        recession_direction = solver_result.get('recession_direction')
- 
-
-    fig = plt.figure(figsize=(10, 7), dpi=100)
-    ax = fig.add_subplot(111)
-    
-    fig.patch.set_facecolor('#f5f5f5')
-    ax.set_facecolor('#ffffff')
-    
-    # Déterminer les limites du graphique
-    try:
-        x1_vals = [abs(bi / ai) if abs(ai) > 0.001 else 20 for ai, bi in zip([row[0] for row in A], b)]
-        x2_vals = [abs(bi / ai) if abs(ai) > 0.001 else 20 for ai, bi in zip([row[1] for row in A], b)]
-        x1_max = max(x1_vals + [10]) * 1.3
-        x2_max = max(x2_vals + [10]) * 1.3
-    except:
-        x1_max, x2_max = 20, 20
-    
-    x1 = np.linspace(-x1_max*0.1, x1_max, 500)
-    
-    x1_grid = np.linspace(-x1_max*0.2, x1_max, 400)
-    x2_grid = np.linspace(-x2_max*0.2, x2_max, 400)
-    X1, X2 = np.meshgrid(x1_grid, x2_grid)
-    
-    def check_constraint(a1, a2, bi, operator, X1, X2):
-        lhs = a1 * X1 + a2 * X2
-        if operator == '<=':
-            return lhs <= bi + 1e-6
-        elif operator == '>=':
-            return lhs >= bi - 1e-6
-        elif operator == '=':
-            return np.abs(lhs - bi) < 0.1
-        return np.ones_like(X1, dtype=bool)
-    
-    # Calculer la région faisable
-    feasible = np.ones_like(X1, dtype=bool)
-    
-    for i, (row, bi) in enumerate(zip(A, b)):
-        a1, a2 = row
-        operator = operators[i] if i < len(operators) else '<='
-        constraint_satisfied = check_constraint(a1, a2, bi, operator, X1, X2)
-        feasible &= constraint_satisfied
-    
-    feasible &= (X1 >= 0) & (X2 >= 0)
-    
-    has_feasible_region = np.any(feasible)
-    region_annotation_added = False
-    
-    # Tracer la région faisable
-    if has_feasible_region:
-        if status == 'infeasible':
-            pass
-        elif not region_bounded:
-            # Région NON BORNÉE 
-            ax.contourf(X1, X2, feasible.astype(float), levels=[0.5, 1.5], 
-                       colors=['#90EE90'], alpha=0.5, label='_nolegend_')
-            ax.contour(X1, X2, feasible.astype(float), levels=[0.5], 
-                      colors=['#32CD32'], linewidths=2.5, linestyles='--')
-            ax.contourf(X1, X2, feasible.astype(float), levels=[0.5, 1.5],
-                       colors='none', hatches=['///'], alpha=0.3)
-            region_annotation_added = True
-        else:
-            # Région BORNÉE 
-            ax.contourf(X1, X2, feasible.astype(float), levels=[0.5, 1.5], 
-                       colors=['#4A90E2'], alpha=0.4, label='_nolegend_')
-            ax.contour(X1, X2, feasible.astype(float), levels=[0.5], 
-                      colors=['#FF6B35'], linewidths=2.5, linestyles='--')
-            region_annotation_added = True
+from core import instrument
+from core.cache import LRUCache
+from core.halfplane import clip_polygon, constraint_halfplanes, intersect_halfplanes, polygon_centroid
+
+# Marge autour de la boîte englobante de la région
+VIEW_MARGIN = 1.3
+# Fonds (couche statique) gardés par ProblemPlot : revenir à une géométrie récente évite un rendu complet
+BACKGROUND_CACHE = 8
+
+
+def _viewport(geometry):
+    """Limites (x1_max, x2_max) : boîte englobante des sommets, rayons prolongés de la taille de la région."""
+    V = np.asarray(geometry['vertices'], dtype=float).reshape(-1, 2)
+    span = max(1.0, float(np.abs(V).max()))
+    pts = [V] + [np.asarray(o) + span * np.asarray(d) for o, d, _ in geometry['rays']]
+    pts = np.vstack(pts)
+    x1_max = float(pts[:, 0].max()) * VIEW_MARGIN
+    x2_max = float(pts[:, 1].max()) * VIEW_MARGIN
+    return (x1_max if x1_max > 1e-9 else span), (x2_max if x2_max > 1e-9 else span)
+
+
+def _clip_to_view(polygon, x1_max, x2_max):
+    """Polygone convexe limité à x1 <= x1_max et x2 <= x2_max."""
+    return clip_polygon(clip_polygon(polygon, (1.0, 0.0), x1_max), (0.0, 1.0), x2_max)
+
+
+def _region_geometry(A, b, operators, solver_result):
+    """Géométrie du solveur (solver_result['geometry']) ; recalculée seulement si elle manque."""
+    if solver_result and solver_result.get('geometry') is not None:
+        return solver_result['geometry']
+    N, h, rows, _ = constraint_halfplanes(A, b, operators)
+    return intersect_halfplanes(N, h, rows.tolist()).to_dict()
+
+
+def _format_coef(val):
+    if abs(val) < 0.01:
+        return "0"
+    elif abs(val - round(val)) < 0.01:
+        return str(int(round(val)))
     else:
-        # CAS SANS RÉGION FAISABLE
-        colors_incompatible = ['#FFB3B3', '#B3E0FF', '#FFFFB3', '#D9FFB3', '#FFD9B3']
-        
+        return f"{val:.1f}"
+
+
+def _equation(row, bi, operator):
+    a1, a2 = row
+    sign = '+' if a2 >= 0 else '-'
+    op_display = {'<=': '≤', '>=': '≥', '=': '='}
+    return f"{_format_coef(a1)}x₁ {sign} {_format_coef(abs(a2))}x₂ {op_display.get(operator, operator)} {_format_coef(bi)}"
+
+
+def _is_position_free(x_pos, y_pos, used_positions, scale, min_dist_factor=0.12):
+    if not used_positions:
+        return True
+    used = np.asarray(used_positions, dtype=float)
+    return bool(np.hypot(used[:, 0] - x_pos, used[:, 1] - y_pos).min() >= scale * min_dist_factor)
+
+
+def _find_best_label_position(x_vals, y_vals, used_positions, x_max, y_max):
+    n_points = len(x_vals)
+    candidates = [
+        (n_points // 8, 'top', 25),
+        (n_points // 5, 'bottom', -25),
+        (n_points // 3, 'top', 25),
+        (n_points // 2, 'bottom', -25),
+        (2 * n_points // 3, 'top', 25),
+        (4 * n_points // 5, 'bottom', -25),
+        (7 * n_points // 8, 'top', 25),
+        (n_points // 10, 'top', 30),
+        (3 * n_points // 10, 'bottom', -30),
+        (7 * n_points // 10, 'top', 30),
+        (9 * n_points // 10, 'bottom', -30),
+    ]
+    for idx, va, offset_y in candidates:
+        if 0 <= idx < n_points:
+            x_pos, y_pos = x_vals[idx], y_vals[idx]
+            if not (-x_max*0.05 <= x_pos <= x_max * 1.05 and -y_max*0.05 <= y_pos <= y_max * 1.05):
+                continue
+            if _is_position_free(x_pos, y_pos, used_positions, x_max + y_max):
+                return va, offset_y, x_pos, y_pos
+    return None
+
+
+def _pooled(pool, i, factory):
+    while len(pool) <= i:
+        pool.append(factory())
+    return pool[i]
+
+
+def _hide(pool, start=0):
+    for artist in pool[start:]:
+        artist.set_visible(False)
+
+
+class ProblemPlot:
+    """Graphique persistant du problème : une Figure, un Axes, des artistes réutilisés.
+
+    update() modifie sur place la région, les droites des contraintes, les sommets,
+    l'optimum et les annotations (set_data / set_xy / set_text) ; draw() ne redessine
+    que la couche de l'optimum par blitting quand la région, les limites, le titre et
+    la légende n'ont pas changé. La Figure n'est pas enregistrée auprès de pyplot.
+    """
+
+    COLORS = ['#FF6B35', '#004E89', '#00A896', '#F77F00', '#9B59B6']
+    INCOMPATIBLE_COLORS = ['#FFB3B3', '#B3E0FF', '#FFFFB3', '#D9FFB3', '#FFD9B3']
+
+    def __init__(self, figsize=(10, 7), dpi=100):
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.figure.patch.set_facecolor('#f5f5f5')
+        self.ax = ax = self.figure.add_subplot(111)
+        ax.set_facecolor('#ffffff')
+        ax.set_xlabel('x₁', fontsize=14, fontweight='bold', color='#000000')
+        ax.set_ylabel('x₂', fontsize=14, fontweight='bold', color='#000000')
+        ax.grid(True, alpha=0.3, linestyle='--', color='#888888', linewidth=0.8)
+        ax.tick_params(colors='#000000', labelsize=10)
+        for spine in ax.spines.values():
+            spine.set_edgecolor('#0B3B36')
+            spine.set_linewidth(2.5)
+
+        self.region = ax.add_patch(Polygon(np.zeros((1, 2)), closed=True, linewidth=2.5, linestyle='--',
+                                           label='_nolegend_', zorder=1, visible=False))
+        self.vertex_markers, = ax.plot([], [], 'o', color='#004E89', markersize=12, zorder=4,
+                                       label='Sommets', markeredgecolor='black', markeredgewidth=2)
+        # Couche de l'optimum (seule redessinée par blitting) : contraintes actives, chemin, points, notes
+        self.active_lines = ax.add_collection(LineCollection([], linestyles='--', linewidths=3.5, zorder=3))
+        self.opt_path, = ax.plot([], [], color='#FFD700', solid_capstyle='round', visible=False)
+        self.opt_start, = ax.plot([], [], 'o', color='#FFD700', markersize=9, zorder=9, visible=False,
+                                  label='1er point de contact', markeredgecolor='#000000', markeredgewidth=1.6)
+        self.opt_points, = ax.plot([], [], 'o', color='#FFD700', visible=False,
+                                   markeredgecolor='#000000', markeredgewidth=1.5)
+        self.opt_note = self._annotation(arrow=True)
+        self.opt_coord = self._annotation()
+        self.region_note = self._annotation(arrow=True)
+        self.infeasible_note = self._annotation()
+
+        self._lines, self._parts, self._labels, self._marks = [], [], [], []
+        self._hexbin = None
+        self._dynamic = (self.active_lines, self.opt_path, self.opt_start, self.opt_points,
+                         self.opt_note, self.opt_coord)
+        self._static_key = self._layout_key = None
+        self._backgrounds = LRUCache(BACKGROUND_CACHE)
+
+    def _annotation(self, arrow=False):
+        return self.ax.annotate('', xy=(0, 0), xytext=(0, 0), textcoords='offset points', visible=False,
+                                arrowprops=dict(arrowstyle='->', lw=1.5) if arrow else None)
+
+    @staticmethod
+    def _note(ann, text, xy, offset, bbox, arrow=None, **props):
+        ann.set_text(text)
+        ann.xy = (float(xy[0]), float(xy[1]))
+        ann.set_position(offset)
+        ann.set_bbox(bbox)
+        ann.set(visible=True, fontweight='bold', **props)
+        if arrow is not None:
+            ann.arrowprops.update(arrow)
+            ann.arrow_patch.set_color(arrow['color'])
+            ann.arrow_patch.set_linewidth(arrow['lw'])
+
+    def update(self, A, b, solution, c, obj_type, operators=None, optimal_points=None,
+               region_bounded=True, status='optimal', solver_result=None, robustness=None, draft=False):
+        """Met à jour les artistes pour un nouveau résultat (mêmes arguments que create_plot).
+
+        draft : brouillon pour la saisie en direct, sans légende ni étiquettes des équations et
+        de la région (la moitié du temps de rendu) ; le rendu complet suit quand la saisie se pose.
+        """
+        if operators is None:
+            operators = ['<='] * len(A)
+
+        A = np.array(A, dtype=float).reshape(-1, 2)
+        b = np.array(b, dtype=float).reshape(-1)
+        ax = self.ax
+
+        # Récupérer la direction de récession et les contraintes actives depuis solver_result
+        recession_direction = None
+        active = set()
+        if solver_result:
+            recession_direction = solver_result.get('recession_direction')
+            active = set(solver_result.get('active_constraints') or [])
+
+        # Région exacte partagée avec le solveur : remplissage, limites, sommets et ancre de l'étiquette
+        geometry = _region_geometry(A, b, operators, solver_result)
+        vertices = np.asarray(geometry['vertices'], dtype=float).reshape(-1, 2)
+        has_feasible_region = not geometry['empty'] and len(vertices) > 0
+
+        # Limites du graphique : boîte englobante de la région (rayons prolongés), sinon intercepts des contraintes
+        if has_feasible_region:
+            x1_max, x2_max = _viewport(geometry)
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                intercepts = np.where(np.abs(A) > 0.001, np.abs(b[:, None] / A), 20.0)
+            intercepts = intercepts[np.isfinite(intercepts).all(axis=1)]
+            x1_max = max(float(intercepts[:, 0].max(initial=0.0)), 10.0) * 1.3
+            x2_max = max(float(intercepts[:, 1].max(initial=0.0)), 10.0) * 1.3
+
+        x1 = np.linspace(-x1_max*0.1, x1_max, 500)
+
+        # Tracer la région faisable
+        region_polygon = np.zeros((0, 2))
+        self.region.set_visible(False)
+        self.infeasible_note.set_visible(False)
+        n_parts = 0
+        if has_feasible_region:
+            region_polygon = _clip_to_view(geometry['polygon'], x1_max, x2_max)
+            if status != 'infeasible' and len(region_polygon) > 0:
+                self.region.set_xy(region_polygon)
+                if not region_bounded:
+                    # Région NON BORNÉE
+                    self.region.set(facecolor='#90EE90', alpha=0.5, edgecolor='#32CD32', hatch='///', visible=True)
+                else:
+                    # Région BORNÉE
+                    self.region.set(facecolor='#4A90E2', alpha=0.4, edgecolor='#FF6B35', hatch=None, visible=True)
+        else:
+            # CAS SANS RÉGION FAISABLE : demi-plan de chaque contrainte (limité au quadrant visible)
+            N, h, rows, _ = constraint_halfplanes(A, b, operators)
+            view = np.array([[0.0, 0.0], [x1_max, 0.0], [x1_max, x2_max], [0.0, x2_max]])
+            for i in range(len(A)):
+                part = view
+                for n_k, h_k in zip(N[rows == i], h[rows == i]):
+                    part = clip_polygon(part, n_k, h_k)
+                if len(part) > 0:
+                    color = self.INCOMPATIBLE_COLORS[i % len(self.INCOMPATIBLE_COLORS)]
+                    patch = _pooled(self._parts, n_parts, lambda: ax.add_patch(
+                        Polygon(np.zeros((1, 2)), closed=True, alpha=0.3, linewidth=2, zorder=1)))
+                    patch.set_xy(part)
+                    patch.set(facecolor=color, edgecolor=color, visible=True)
+                    n_parts += 1
+
+            self._note(self.infeasible_note, '❌ AUCUNE\nSOLUTION', (x1_max * 0.75, x2_max * 0.85), (0, 0),
+                       dict(boxstyle='round,pad=0.6', facecolor='#FFE6E6', edgecolor='#FF0000', linewidth=2, alpha=0.9),
+                       ha='center', va='center', fontsize=11, color='#8B0000', zorder=10)
+        _hide(self._parts, n_parts)
+
+        # Tracer les contraintes avec équations
+        used_positions = []
+        legend = []
+        active_segments, active_colors = [], []
+        n_labels = 0
         for i, (row, bi) in enumerate(zip(A, b)):
             a1, a2 = row
+            color = self.COLORS[i % len(self.COLORS)]
             operator = operators[i] if i < len(operators) else '<='
-            constraint_mask = check_constraint(a1, a2, bi, operator, X1, X2) & (X1 >= 0) & (X2 >= 0)
-            
-            if np.any(constraint_mask):
-                color = colors_incompatible[i % len(colors_incompatible)]
-                ax.contourf(X1, X2, constraint_mask.astype(float), levels=[0.5, 1.5], 
-                           colors=[color], alpha=0.3, zorder=1)
-                
-       
-        ax.text(x1_max * 0.75, x2_max * 0.85, 
-                '❌ AUCUNE\nSOLUTION', 
-                ha='center', va='center',
-                fontsize=11, color='#8B0000', fontweight='bold',
-                bbox=dict(boxstyle='round,pad=0.6', facecolor='#FFE6E6', 
-                         edgecolor='#FF0000', linewidth=2, alpha=0.9),
-                zorder=10)
-    
-    # Tracer les contraintes avec équations
-    colors = ['#FF6B35', '#004E89', '#00A896', '#F77F00', '#9B59B6']
-    used_positions = []
-    equation_labels = []
-    
-    def is_position_free(x_pos, y_pos, used_positions, min_dist_factor=0.12):
-        min_distance = (x1_max + x2_max) * min_dist_factor
-        for used_x, used_y in used_positions:
-            dist = np.sqrt((x_pos - used_x)**2 + (y_pos - used_y)**2)
-            if dist < min_distance:
-                return False
-        return True
-    
-    def find_best_label_position(x_vals, y_vals, used_positions, x_max, y_max, constraint_idx):
-        n_points = len(x_vals)
-        candidates = [
-            (n_points // 8, 'top', 25),
-            (n_points // 5, 'bottom', -25),
-            (n_points // 3, 'top', 25),
-            (n_points // 2, 'bottom', -25),
-            (2 * n_points // 3, 'top', 25),
-            (4 * n_points // 5, 'bottom', -25),
-            (7 * n_points // 8, 'top', 25),
-            (n_points // 10, 'top', 30),
-            (3 * n_points // 10, 'bottom', -30),
-            (7 * n_points // 10, 'top', 30),
-            (9 * n_points // 10, 'bottom', -30),
-        ]
-        
-        for idx, va, offset_y in candidates:
-            if 0 <= idx < len(x_vals) and 0 <= idx < len(y_vals):
-                x_pos, y_pos = x_vals[idx], y_vals[idx]
-                
-                if not (-x_max*0.05 <= x_pos <= x_max * 1.05 and -y_max*0.05 <= y_pos <= y_max * 1.05):
+            equation = _equation(row, bi, operator)
+            line = _pooled(self._lines, i, lambda: ax.plot([], [], linestyle='--', linewidth=2.5, zorder=3)[0])
+            line.set_visible(False)
+
+            if abs(a2) > 0.001:
+                x2 = (bi - a1 * x1) / a2
+                valid_mask = (x1 >= -x1_max*0.05) & (x2 >= -x2_max*0.1) & (x2 <= x2_max * 1.15)
+                x_line, y_line = x1[valid_mask], x2[valid_mask]
+                if len(x_line) == 0:
                     continue
-                
-                if is_position_free(x_pos, y_pos, used_positions):
-                    return idx, va, offset_y, x_pos, y_pos
-        
-        return None, None, None, None, None
-    
-    # Tracer toutes les contraintes
-    for i, (row, bi) in enumerate(zip(A, b)):
-        a1, a2 = row
-        color = colors[i % len(colors)]
-        operator = operators[i] if i < len(operators) else '<='
-        
-        def format_coef(val):
-            if abs(val) < 0.01:
-                return "0"
-            elif abs(val - round(val)) < 0.01:
-                return str(int(round(val)))
-            else:
-                return f"{val:.1f}"
-        
-        a1_str = format_coef(a1)
-        a2_str = format_coef(abs(a2))
-        sign = '+' if a2 >= 0 else '-'
-        bi_str = format_coef(bi)
-        
-        # Afficher l'opérateur correct
-        op_display = {'<=': '≤', '>=': '≥', '=': '='}
-        equation = f"{a1_str}x₁ {sign} {a2_str}x₂ {op_display.get(operator, operator)} {bi_str}"
-        
-        if abs(a2) > 0.001:
-            x2 = (bi - a1 * x1) / a2
-            valid_mask = (x1 >= -x1_max*0.05) & (x2 >= -x2_max*0.1) & (x2 <= x2_max * 1.15)
-            x1_valid = x1[valid_mask]
-            x2_valid = x2[valid_mask]
-            
-            if len(x1_valid) > 0:
-                ax.plot(x1_valid, x2_valid, linestyle='--', label=f'C{i+1}: {equation}', 
-                       linewidth=2.5, color=color, alpha=1.0, zorder=3)
-                
-                idx, va_pos, offset_y, x_pos, y_pos = find_best_label_position(
-                    x1_valid, x2_valid, used_positions, x1_max, x2_max, i)
-                
-                if idx is not None and x_pos is not None:
-                    equation_labels.append({
-                        'equation': equation,
-                        'x': x_pos,
-                        'y': y_pos,
-                        'offset_y': offset_y,
-                        'va': va_pos,
-                        'color': color
-                    })
+                best = None if draft else _find_best_label_position(x_line, y_line, used_positions, x1_max, x2_max)
+                if best is not None:
+                    va_pos, offset_y, x_pos, y_pos = best
+                    label = _pooled(self._labels, n_labels, self._annotation)
+                    self._note(label, equation, (x_pos, y_pos), (0, offset_y),
+                               dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor=color, linewidth=1.2, alpha=0.95),
+                               fontsize=8, color=color, ha='center', va=va_pos, rotation=0, zorder=5)
+                    n_labels += 1
                     used_positions.append((x_pos, y_pos))
-                
-        elif abs(a1) > 0.001:
-            x1_line = bi / a1
-            if -x1_max*0.05 <= x1_line <= x1_max * 1.05:
-                ax.axvline(x=x1_line, label=f'C{i+1}: {equation}',
-                          linewidth=2.5, color=color, linestyle='--', alpha=1.0, zorder=3)
-                
-                y_positions = [x2_max * 0.15, x2_max * 0.30, x2_max * 0.45, 
-                              x2_max * 0.60, x2_max * 0.75, x2_max * 0.90]
-                
-                for y_pos in y_positions:
-                    if is_position_free(x1_line, y_pos, used_positions, min_dist_factor=0.15):
-                        ax.text(x1_line + x1_max*0.02, y_pos, equation,
-                               fontsize=8, color=color, fontweight='bold',
-                               bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
-                                       edgecolor=color, linewidth=1.2, alpha=0.95),
-                               rotation=90, ha='left', va='center', zorder=5)
+            elif abs(a1) > 0.001:
+                x1_line = bi / a1
+                if not -x1_max*0.05 <= x1_line <= x1_max * 1.05:
+                    continue
+                x_line, y_line = np.array([x1_line, x1_line]), np.array([0.0, x2_max])
+                for y_pos in () if draft else (x2_max * 0.15, x2_max * 0.30, x2_max * 0.45,
+                              x2_max * 0.60, x2_max * 0.75, x2_max * 0.90):
+                    if _is_position_free(x1_line, y_pos, used_positions, x1_max + x2_max, min_dist_factor=0.15):
+                        label = _pooled(self._labels, n_labels, self._annotation)
+                        self._note(label, equation, (x1_line + x1_max*0.02, y_pos), (0, 0),
+                                   dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor=color, linewidth=1.2, alpha=0.95),
+                                   fontsize=8, color=color, ha='left', va='center', rotation=90, zorder=5)
+                        n_labels += 1
                         used_positions.append((x1_line, y_pos))
                         break
-    
-    # Afficher les équations sur le graphique
-    for label_info in equation_labels:
-        ax.annotate(label_info['equation'], 
-                   xy=(label_info['x'], label_info['y']),
-                   xytext=(0, label_info['offset_y']), textcoords='offset points',
-                   fontsize=8, color=label_info['color'], fontweight='bold',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                           edgecolor=label_info['color'], linewidth=1.2, alpha=0.95),
-                   ha='center', va=label_info['va'], zorder=5)
-    
-    # Annotation de la région
-    if region_annotation_added and has_feasible_region:
-        feasible_points = np.column_stack([X1[feasible], X2[feasible]])
-        if len(feasible_points) > 0:
-            center = feasible_points.mean(axis=0)
-            
+            else:
+                continue
+
+            line.set_data(x_line, y_line)
+            line.set(color=color, label=f'C{i+1}: {equation}', visible=True)
+            legend.append(line)
+            # Contraintes actives en x* (lues sur le résultat du solveur) : trait renforcé
+            if i in active:
+                active_segments.append(np.column_stack([x_line, y_line]))
+                active_colors.append(color)
+        _hide(self._lines, len(A))
+        self.active_lines.set_segments(active_segments)
+        self.active_lines.set_color(active_colors)
+
+        # Annotation de la région
+        self.region_note.set_visible(False)
+        if self.region.get_visible() and not draft:
+            center = polygon_centroid(region_polygon)
             if 0 <= center[0] <= x1_max and 0 <= center[1] <= x2_max:
                 region_positions = [
                     (center[0], center[1], 60, 60),
@@ -238,301 +306,262 @@ def create_plot(A, b, solution, c, obj_type, operators=None, optimal_points=None
                     (center[0] + x1_max*0.15, center[1], 40, 40),
                     (center[0] - x1_max*0.15, center[1], -40, 40),
                 ]
-                
                 for cx, cy, ox, oy in region_positions:
-                    if is_position_free(cx, cy, used_positions, min_dist_factor=0.15):
+                    if _is_position_free(cx, cy, used_positions, x1_max + x2_max, min_dist_factor=0.15):
                         if not region_bounded:
-                            ax.annotate('Région Non Bornée', 
-                                       xy=(cx, cy), 
-                                       xytext=(ox, oy), textcoords='offset points',
-                                       fontsize=10, color='#006400', fontweight='bold',
-                                       bbox=dict(boxstyle='round,pad=0.5', facecolor='#90EE90', 
-                                               edgecolor='#32CD32', linewidth=1.5, alpha=0.9),
-                                       arrowprops=dict(arrowstyle='->', color='#32CD32', lw=1.5),
-                                       ha='center', zorder=15)
+                            self._note(self.region_note, 'Région Non Bornée', (cx, cy), (ox, oy),
+                                       dict(boxstyle='round,pad=0.5', facecolor='#90EE90', edgecolor='#32CD32', linewidth=1.5, alpha=0.9),
+                                       arrow=dict(color='#32CD32', lw=1.5), fontsize=10, color='#006400', ha='center', zorder=15)
                         else:
-                            ax.annotate('Région\nAdmissible', 
-                                       xy=(cx, cy), 
-                                       xytext=(ox, oy), textcoords='offset points',
-                                       fontsize=10, color='#000000', fontweight='bold',
-                                       bbox=dict(boxstyle='round,pad=0.5', facecolor='#4A90E2', 
-                                               edgecolor='#000000', linewidth=1.5, alpha=0.85),
-                                       arrowprops=dict(arrowstyle='->', color='#000000', lw=1.5),
-                                       ha='center', zorder=15)
+                            self._note(self.region_note, 'Région\nAdmissible', (cx, cy), (ox, oy),
+                                       dict(boxstyle='round,pad=0.5', facecolor='#4A90E2', edgecolor='#000000', linewidth=1.5, alpha=0.85),
+                                       arrow=dict(color='#000000', lw=1.5), fontsize=10, color='#000000', ha='center', zorder=15)
                         used_positions.append((cx, cy))
                         break
-    
-    # Trouver et marquer les sommets
-    if has_feasible_region:
-        vertices = []
-        n = len(A)
-        
-        for i in range(n):
-            for j in range(i+1, n):
-                try:
-                    A_sys = np.array([A[i], A[j]])
-                    b_sys = np.array([b[i], b[j]])
-                    
-                    det = np.linalg.det(A_sys)
-                    if abs(det) < 1e-10:
-                        continue
-                    
-                    point = np.linalg.solve(A_sys, b_sys)
-                    
-                    if point[0] < -1e-6 or point[1] < -1e-6:
-                        continue
-                    
-                    if point[0] > x1_max * 1.1 or point[1] > x2_max * 1.1:
-                        continue
-                    
-                    valid = True
-                    for k in range(n):
-                        op = operators[k] if k < len(operators) else '<='
-                        lhs = np.dot(A[k], point)
-                        
-                        if op == '<=':
-                            if lhs > b[k] + 1e-6:
-                                valid = False
-                                break
-                        elif op == '>=':
-                            if lhs < b[k] - 1e-6:
-                                valid = False
-                                break
-                        elif op == '=':
-                            if abs(lhs - b[k]) > 1e-6:
-                                valid = False
-                                break
-                    
-                    if valid:
-                        vertices.append(point)
-                except:
-                    pass
-        
-        # Intersections avec les axes
-        for i in range(n):
-            if abs(A[i][1]) > 0.001:
-                x2_int = b[i] / A[i][1]
-                if 0 <= x2_int <= x2_max * 1.1:
-                    point = np.array([0, x2_int])
-                    valid = True
-                    for k in range(n):
-                        op_k = operators[k] if k < len(operators) else '<='
-                        lhs = np.dot(A[k], point)
-                        if op_k == '<=' and lhs > b[k] + 1e-6:
-                            valid = False
-                            break
-                        elif op_k == '>=' and lhs < b[k] - 1e-6:
-                            valid = False
-                            break
-                        elif op_k == '=' and abs(lhs - b[k]) > 1e-6:
-                            valid = False
-                            break
-                    if valid:
-                        vertices.append(point)
-            
-            if abs(A[i][0]) > 0.001:
-                x1_int = b[i] / A[i][0]
-                if 0 <= x1_int <= x1_max * 1.1:
-                    point = np.array([x1_int, 0])
-                    valid = True
-                    for k in range(n):
-                        op_k = operators[k] if k < len(operators) else '<='
-                        lhs = np.dot(A[k], point)
-                        if op_k == '<=' and lhs > b[k] + 1e-6:
-                            valid = False
-                            break
-                        elif op_k == '>=' and lhs < b[k] - 1e-6:
-                            valid = False
-                            break
-                        elif op_k == '=' and abs(lhs - b[k]) > 1e-6:
-                            valid = False
-                            break
-                    if valid:
-                        vertices.append(point)
-        
-        # Vérifier l'origine
-        origin = np.array([0, 0])
-        valid_origin = True
-        for k in range(n):
-            op_k = operators[k] if k < len(operators) else '<='
-            lhs = np.dot(A[k], origin)
-            if op_k == '<=' and lhs > b[k] + 1e-6:
-                valid_origin = False
-                break
-            elif op_k == '>=' and lhs < b[k] - 1e-6:
-                valid_origin = False
-                break
-            elif op_k == '=' and abs(lhs - b[k]) > 1e-6:
-                valid_origin = False
-                break
-        if valid_origin:
-            vertices.append(origin)
-        
-        if len(vertices) > 0:
-            vertices = np.array(vertices)
-            vertices = np.unique(vertices.round(decimals=6), axis=0)
-            
-            if len(vertices) > 0:
-                ax.plot(vertices[:, 0], vertices[:, 1], 'o', 
-                       color='#004E89', markersize=12, zorder=4,
-                       label='Sommets', markeredgecolor='black', markeredgewidth=2)
-    
-    #  TRACER LA SOLUTION OPTIMALE 
-    if solution is not None and len(solution) >= 2 and solution[0] is not None:
-
-        # CAS 1: région non bornée + direction de récession
-        if not region_bounded and recession_direction is not None:
- 
-            
-            # Point de départ du demi-droite 
-            start_point = np.array(solution)
-            direction = np.array(recession_direction)
-            
-            # Normaliser la direction
-            if np.linalg.norm(direction) > 1e-6:
-                direction = direction / np.linalg.norm(direction)
-                
-                # Calculer le point final du rayon (jusqu'aux limites du graphique)
-                # Trouver l'intersection avec les bords du graphique
-                t_max = float('inf')
-                
-                # Intersection avec x1 = x1_max
-                if direction[0] > 1e-6:
-                    t_x1 = (x1_max - start_point[0]) / direction[0]
-                    t_max = min(t_max, t_x1)
-                
-                # Intersection avec x2 = x2_max
-                if direction[1] > 1e-6:
-                    t_x2 = (x2_max - start_point[1]) / direction[1]
-                    t_max = min(t_max, t_x2)
-                
-                # Si pas d'intersection trouvée, utiliser une grande valeur
-                if t_max == float('inf'):
-                    t_max = min(x1_max, x2_max) * 1.2
-                
-                end_point = start_point + direction * t_max 
-                
-                # Tracer la demi droite  comme une GROSSE DEMI-DROITE JAUNE 
-                ax.plot([start_point[0], end_point[0]], 
-                       [start_point[1], end_point[1]], 
-                       color='#FFD700', linewidth=6, 
-                       solid_capstyle='round',
-                       zorder=8, alpha=0.95,
-                       label='La droite des solutions optimales')
-                
-                # Marquer le point de départ
-                ax.plot(start_point[0], start_point[1], 'o', color='#FFD700', 
-                       markersize=9, zorder=9,
-                       markeredgecolor='#000000', markeredgewidth=1.6,
-                       label='1er point de contact')
-                
-                # Annotation pour demi droite optimal
-                mid_ray = (start_point + end_point) / 2
-                ax.annotate('Demi-droite de\nsolutions opimales)',
-                           xy=(mid_ray[0], mid_ray[1]), 
-                           xytext=(50, -40), textcoords='offset points',
-                           fontsize=10, color='#000000', fontweight='bold',
-                           bbox=dict(boxstyle='round,pad=0.6', facecolor='#FFD700', 
-                                   edgecolor='#000000', linewidth=2, alpha=0.95),
-                           arrowprops=dict(arrowstyle='->', color='#000000', lw=2),
-                           ha='center', zorder=16)
-                
-                # Annotation au point de départ
-                ax.annotate(f'({start_point[0]:.2f}, {start_point[1]:.2f})', 
-                           xy=(start_point[0], start_point[1]), 
-                           xytext=(20, -30), textcoords='offset points',
-                           fontsize=9, color='#000000', fontweight='bold',
-                           bbox=dict(boxstyle='round,pad=0.4', facecolor='white', 
-                                   edgecolor='#FFD700', linewidth=2, alpha=0.95),
-                           ha='left', zorder=16)
-        
-        # CAS 2: ARÊTE OPTIMALE (plusieurs points optimaux)
+
+        # Marquer les sommets de la région (déjà calculés par le solveur)
+        self.vertex_markers.set_data(vertices[:, 0], vertices[:, 1])
+        self.vertex_markers.set_visible(has_feasible_region)
+        if has_feasible_region:
+            legend.append(self.vertex_markers)
+
+        #  TRACER LA SOLUTION OPTIMALE
+        for artist in self._dynamic[1:]:
+            artist.set_visible(False)
+        if solution is not None and len(solution) >= 2 and solution[0] is not None:
+
+            # CAS 1: région non bornée + direction de récession
+            if not region_bounded and recession_direction is not None:
+                start_point = np.array(solution, dtype=float)
+                direction = np.array(recession_direction, dtype=float)
+
+                # Normaliser la direction
+                if np.linalg.norm(direction) > 1e-6:
+                    direction = direction / np.linalg.norm(direction)
+
+                    # Intersection du rayon avec les bords du graphique
+                    t_max = float('inf')
+                    if direction[0] > 1e-6:
+                        t_max = min(t_max, (x1_max - start_point[0]) / direction[0])
+                    if direction[1] > 1e-6:
+                        t_max = min(t_max, (x2_max - start_point[1]) / direction[1])
+                    if t_max == float('inf'):
+                        t_max = min(x1_max, x2_max) * 1.2
+                    end_point = start_point + direction * t_max
+
+                    # Demi-droite des solutions optimales (grosse demi-droite jaune) et point de départ
+                    self.opt_path.set_data([start_point[0], end_point[0]], [start_point[1], end_point[1]])
+                    self.opt_path.set(linewidth=6, zorder=8, alpha=0.95, visible=True,
+                                      label='La droite des solutions optimales')
+                    self.opt_start.set_data([start_point[0]], [start_point[1]])
+                    self.opt_start.set_visible(True)
+                    legend += [self.opt_path, self.opt_start]
+
+                    mid_ray = (start_point + end_point) / 2
+                    self._note(self.opt_note, 'Demi-droite de\nsolutions opimales)', mid_ray, (50, -40),
+                               dict(boxstyle='round,pad=0.6', facecolor='#FFD700', edgecolor='#000000', linewidth=2, alpha=0.95),
+                               arrow=dict(color='#000000', lw=2), fontsize=10, color='#000000', ha='center', zorder=16)
+                    self._note(self.opt_coord, f'({start_point[0]:.2f}, {start_point[1]:.2f})', start_point, (20, -30),
+                               dict(boxstyle='round,pad=0.4', facecolor='white', edgecolor='#FFD700', linewidth=2, alpha=0.95),
+                               fontsize=9, color='#000000', ha='left', zorder=16)
+
+            # CAS 2: ARÊTE OPTIMALE (plusieurs points optimaux)
+            elif optimal_points is not None and len(optimal_points) >= 2:
+                optimal_points_array = np.array(optimal_points, dtype=float)
+
+                # Segments entre sommets optimaux (contour fermé dans l'ordre angulaire)
+                center = optimal_points_array.mean(axis=0)
+                angles = np.arctan2(optimal_points_array[:, 1] - center[1],
+                                    optimal_points_array[:, 0] - center[0])
+                sorted_points = optimal_points_array[np.argsort(angles)]
+                closed = np.vstack([sorted_points, sorted_points[:1]])
+                self.opt_path.set_data(closed[:, 0], closed[:, 1])
+                self.opt_path.set(linewidth=4, zorder=6, alpha=0.8, visible=True, label='Arête optimale')
+                self.opt_points.set_data(optimal_points_array[:, 0], optimal_points_array[:, 1])
+                self.opt_points.set(markersize=16, zorder=7, visible=True, label='_nolegend_')
+                legend.append(self.opt_path)
+
+                self._note(self.opt_note, 'Infinité de solutions\n(sur segment jaune)', center, (40, 40),
+                           dict(boxstyle='round,pad=0.5', facecolor='#FCCB79', edgecolor='#000000', linewidth=1.2, alpha=0.95),
+                           arrow=dict(color='#000000', lw=1.5), fontsize=9, color='#000000', ha='center', zorder=16)
+
+            # CAS 3: SOLUTION UNIQUE
+            else:
+                self.opt_points.set_data([solution[0]], [solution[1]])
+                self.opt_points.set(markersize=18, zorder=6, visible=True, label='Solution optimale')
+                legend.append(self.opt_points)
+
+                self._note(self.opt_note, f'Optimal\n({solution[0]:.2f}, {solution[1]:.2f})', solution, (40, 40),
+                           dict(boxstyle='round,pad=0.5', facecolor='#FCCB79', edgecolor='#000000', linewidth=1.2, alpha=0.95),
+                           arrow=dict(color='#000000', lw=1.5), fontsize=9, color='#000000', ha='center', zorder=16)
+
+        # Robustesse (Monte Carlo) : densité des x* perturbés et fréquence de chaque sommet optimal
+        if self._hexbin is not None:
+            self._hexbin.remove()
+            self._hexbin = None
+        n_marks = 0
+        if robustness and robustness.get('x_samples'):
+            pts = np.array(robustness['x_samples'], dtype=float)
+            self._hexbin = ax.hexbin(pts[:, 0], pts[:, 1], gridsize=40, cmap='YlOrRd', mincnt=1, alpha=0.55,
+                                     extent=(0, x1_max, 0, x2_max), zorder=4)
+            for vertex in robustness['vertices'][:5]:
+                mark = _pooled(self._marks, n_marks, self._annotation)
+                self._note(mark, f"{100 * vertex['frequency']:.1f}%", vertex['mean_x'], (-30, -25),
+                           dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='#8B0000', alpha=0.85),
+                           fontsize=9, color='#8B0000', ha='left', va='baseline', rotation=0, zorder=17)
+                n_marks += 1
+        _hide(self._marks, n_marks)
+        _hide(self._labels, n_labels)
+
+        ax.set_xlim(0, x1_max)
+        ax.set_ylim(0, x2_max)
+
+        if not has_feasible_region:
+            title_text = 'Contraintes Incompatibles'
+            title_color = '#8B0000'
+        elif status == 'unbounded':
+            title_text = 'Problème Non Borné (Optimum non finie)'
+            title_color = '#FF8C00'
+        elif not region_bounded and recession_direction is not None:
+            title_text = 'Région Non Bornée avec Demi Droite Optimal'
+            title_color = '#006400'
         elif optimal_points is not None and len(optimal_points) >= 2:
-            
-            optimal_points_array = np.array(optimal_points)
-            
-            # Tracer les segments entre sommets optimaux
-            center = optimal_points_array.mean(axis=0)
-            angles = np.arctan2(optimal_points_array[:, 1] - center[1], 
-                               optimal_points_array[:, 0] - center[0])
-            sorted_indices = np.argsort(angles)
-            sorted_points = optimal_points_array[sorted_indices]
-            
-            for i in range(len(sorted_points)):
-                p1 = sorted_points[i]
-                p2 = sorted_points[(i + 1) % len(sorted_points)]
-                
-                ax.plot([p1[0], p2[0]], [p1[1], p2[1]], 
-                       color='#FFD700', linewidth=4, solid_capstyle='round',
-                       label='Arête optimale' if i == 0 else '', zorder=6, alpha=0.8)
-            
-            # Marquer sommets optimaux
-            ax.plot(optimal_points_array[:, 0], optimal_points_array[:, 1], 'o', 
-                   color='#FFD700', markersize=16, zorder=7,
-                   markeredgecolor='#000000', markeredgewidth=1.5)
-            
-            # Annotation pour arête optimale
-            mid_point = optimal_points_array.mean(axis=0)
-            ax.annotate(f'Infinité de solutions\n(sur segment jaune)', 
-                       xy=(mid_point[0], mid_point[1]), 
-                       xytext=(40, 40), textcoords='offset points',
-                       fontsize=9, color='#000000', fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.5', facecolor='#FCCB79', 
-                               edgecolor='#000000', linewidth=1.2, alpha=0.95),
-                       arrowprops=dict(arrowstyle='->', color='#000000', lw=1.5),
-                       ha='center', zorder=16)
-        
-        # CAS 3: SOLUTION UNIQUE
+            title_text = 'Infinité de solutions sur une arête'
+            title_color = '#DAA520'
         else:
-            
-            ax.plot(solution[0], solution[1], 'o', color='#FFD700', 
-                   markersize=18, label='Solution optimale', zorder=6,
-                   markeredgecolor='#000000', markeredgewidth=1.5)
-            
-            ax.annotate(f'Optimal\n({solution[0]:.2f}, {solution[1]:.2f})', 
-                       xy=(solution[0], solution[1]), 
-                       xytext=(40, 40), textcoords='offset points',
-                       fontsize=9, color='#000000', fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.5', facecolor='#FCCB79', 
-                               edgecolor='#000000', linewidth=1.2, alpha=0.95),
-                       arrowprops=dict(arrowstyle='->', color='#000000', lw=1.5),
-                       ha='center', zorder=16)
-    
- 
-    ax.set_xlim(0, x1_max)
-    ax.set_ylim(0, x2_max)
-    ax.set_xlabel('x₁', fontsize=14, fontweight='bold', color='#000000')
-    ax.set_ylabel('x₂', fontsize=14, fontweight='bold', color='#000000')
-    
-    if not has_feasible_region:
-        title_text = 'Contraintes Incompatibles'
-        title_color = '#8B0000'
-    elif status == 'unbounded':
-        title_text = 'Problème Non Borné (Optimum non finie)'
-        title_color = '#FF8C00'
-    elif not region_bounded and recession_direction is not None:
-        title_text = 'Région Non Bornée avec Demi Droite Optimal'
-        title_color = '#006400'
-    elif optimal_points is not None and len(optimal_points) >= 2:
-        title_text = 'Infinité de solutions sur une arête'
-        title_color = '#DAA520'
-    else:
-        title_text = 'Région admissible et Solution Optimale'
-        title_color = '#0B3B36'
-    
-    ax.set_title(title_text, fontsize=15, fontweight='bold', pad=15, color=title_color)
-    
-    ax.grid(True, alpha=0.3, linestyle='--', color='#888888', linewidth=0.8)
-    ax.tick_params(colors='#000000', labelsize=10)
-
-    legend = ax.legend(loc='lower right', fontsize=8, facecolor='white', 
-                      edgecolor='#0B3B36', framealpha=0.95, shadow=True)
-    for text in legend.get_texts():
-        text.set_color('#000000')
-
-    for spine in ax.spines.values():
-        spine.set_edgecolor('#0B3B36')
-        spine.set_linewidth(2.5)
-    
+            title_text = 'Région admissible et Solution Optimale'
+            title_color = '#0B3B36'
+        ax.set_title(title_text, fontsize=15, fontweight='bold', pad=15, color=title_color)
+
+        if ax.get_legend() is not None:
+            ax.get_legend().remove()
+        if legend and not draft:
+            leg = ax.legend(handles=legend, loc='lower right', fontsize=8, facecolor='white',
+                            edgecolor='#0B3B36', framealpha=0.95, shadow=True)
+            for text in leg.get_texts():
+                text.set_color('#000000')
+
+        # Tout ce qui n'est pas la couche de l'optimum : si rien n'a changé, draw() peut blitter
+        self._static_key = (A.tobytes(), b.tobytes(), tuple(operators), status, bool(region_bounded),
+                            x1_max, x2_max, title_text, tuple(a.get_label() for a in legend),
+                            id(robustness) if robustness else None, bool(draft))
+        return self
+
+    def _background_key(self, canvas):
+        params = self.figure.subplotpars
+        return (self._static_key, tuple(self.figure.bbox.size), id(canvas),
+                (params.left, params.right, params.bottom, params.top))
+
+    def draw(self):
+        """Redessine le canevas ; par blitting de la couche de l'optimum quand le fond est connu."""
+        canvas = self.figure.canvas
+        if not getattr(canvas, 'supports_blit', False):
+            with instrument.phase('canvas.draw'):
+                canvas.draw()
+            return
+
+        # Un fond (tout sauf la couche de l'optimum) reste valable pour la même clé statique, la même
+        # taille et les mêmes marges, y compris après un redessin complet demandé par le canevas lui-même
+        background = self._backgrounds.get(self._background_key(canvas))
+        instrument.count('background_hits' if background is not None else 'background_misses')
+        if background is None:
+            layout_key = (tuple(self.figure.bbox.size),
+                          tuple(int(np.floor(np.log10(v)))
+                                for v in self.ax.get_xlim()[1:] + self.ax.get_ylim()[1:]))
+            if layout_key != self._layout_key:
+                # Marges recalculées seulement si la taille ou l'ordre de grandeur des graduations change
+                with instrument.phase('tight_layout'):
+                    self.figure.tight_layout()
+                self._layout_key = layout_key
+            for artist in self._dynamic:
+                artist.set_animated(True)
+            try:
+                with instrument.phase('canvas.draw'):
+                    canvas.draw()
+            finally:
+                for artist in self._dynamic:
+                    artist.set_animated(False)
+            self._backgrounds.put(self._background_key(canvas), canvas.copy_from_bbox(self.figure.bbox))
+        else:
+            canvas.restore_region(background)
+        for artist in self._dynamic:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+        canvas.blit(self.figure.bbox)
+
+
+def create_plot(A, b, solution, c, obj_type, operators=None, optimal_points=None, 
+                region_bounded=True, status='optimal', solver_result=None, robustness=None):
+    """Figure autonome (export PDF, cartes d'analyse) ; la fenêtre principale réutilise un ProblemPlot."""
+    plot = ProblemPlot().update(A, b, solution, c, obj_type, operators, optimal_points=optimal_points,
+                                region_bounded=region_bounded, status=status,
+                                solver_result=solver_result, robustness=robustness)
+    plot.figure.tight_layout()
+    return plot.figure
+
+def create_parametric_plot(analysis, obj_type='max'):
+    """Courbe z(θ) et x*(θ) d'une analyse paramétrique (segments exacts, sans échantillonnage)."""
+    name = f"b{analysis['index'] + 1}" if analysis['parameter'] == 'rhs' else f"c{analysis['index'] + 1}"
+
+    fig = Figure(figsize=(10, 7), dpi=100)
+    FigureCanvasAgg(fig)
+    ax_z = fig.add_subplot(211)
+    ax_x = fig.add_subplot(212, sharex=ax_z)
+    fig.patch.set_facecolor('#f5f5f5')
+
+    shades = {'infeasible': ('#FFE6E6', 'Problème vide'), 'unbounded': ('#FFF3D6', 'Non borné')}
+    shown = set()
+    for seg in analysis['segments']:
+        t0, t1 = seg['theta']
+        # Segment de longueur nulle (θ isolé) : tracé comme un point
+        marker = 'o' if t1 == t0 else None
+        if seg['status'] != 'optimal':
+            color, label = shades[seg['status']]
+            for ax in (ax_z, ax_x):
+                label_ax = label if ax is ax_z and seg['status'] not in shown else None
+                if marker:
+                    ax.axvline(t0, color=color, linewidth=3, zorder=0, label=label_ax)
+                else:
+                    ax.axvspan(t0, t1, color=color, alpha=0.9, zorder=0, label=label_ax)
+            shown.add(seg['status'])
+            continue
+        # z et x*(θ) sont affines sur chaque segment : deux points suffisent
+        ax_z.plot([t0, t1], seg['z'], color='#0B3B36', linewidth=2.5, marker=marker, zorder=3,
+                  label='z*(θ)' if 'z' not in shown else None)
+        (x0, x1) = seg['x']
+        ax_x.plot([t0, t1], [x0[0], x1[0]], color='#FF6B35', linewidth=2.2, marker=marker, zorder=3,
+                  label='x₁*(θ)' if 'z' not in shown else None)
+        ax_x.plot([t0, t1], [x0[1], x1[1]], color='#004E89', linewidth=2.2, marker=marker, zorder=3,
+                  label='x₂*(θ)' if 'z' not in shown else None)
+        shown.add('z')
+
+    for t in analysis['breakpoints']:
+        for ax in (ax_z, ax_x):
+            ax.axvline(t, color='#888888', linestyle=':', linewidth=1.2, zorder=2)
+
+    current = analysis.get('current')
+    lo, hi = analysis['theta_range']
+    if current is not None and lo <= current <= hi:
+        for ax in (ax_z, ax_x):
+            ax.axvline(current, color='#FCCB79', linewidth=2.5, zorder=1,
+                       label='Valeur actuelle' if ax is ax_z else None)
+
+    ax_z.set_title(f"{'Maximum' if obj_type == 'max' else 'Minimum'} de Z en fonction de {name} "
+                   f"({len(analysis['breakpoints'])} points de rupture)",
+                   fontsize=14, fontweight='bold', color='#0B3B36', pad=12)
+    ax_z.set_ylabel('Z*', fontsize=12, fontweight='bold', color='#000000')
+    ax_x.set_ylabel('x*', fontsize=12, fontweight='bold', color='#000000')
+    ax_x.set_xlabel(name, fontsize=12, fontweight='bold', color='#000000')
+    ax_z.set_xlim(lo, hi if hi > lo else lo + 1.0)
+    for ax in (ax_z, ax_x):
+        ax.set_facecolor('#ffffff')
+        ax.grid(True, alpha=0.3, linestyle='--', color='#888888', linewidth=0.8)
+        ax.tick_params(colors='#000000', labelsize=10)
+        if ax.get_legend_handles_labels()[0]:
+            ax.legend(loc='best', fontsize=8, facecolor='white', edgecolor='#0B3B36', framealpha=0.95)
+        for spine in ax.spines.values():
+            spine.set_edgecolor('#0B3B36')
+            spine.set_linewidth(2)
+
     fig.tight_layout()
-    return fig
\ No newline at end of file
+    return fig
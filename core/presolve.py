@@ -0,0 +1,177 @@
+from typing import Dict, List, Tuple, Any
+
+import numpy as np
+
+from core.halfplane import intersect_halfplanes
+
+# Décimales utilisées pour regrouper les normales parallèles
+DIRECTION_DECIMALS = 9
+
+
+def _direction_key(n) -> Tuple[float, float]:
+    return (round(float(n[0]), DIRECTION_DECIMALS) + 0.0, round(float(n[1]), DIRECTION_DECIMALS) + 0.0)
+
+
+def conflict_message(conflict) -> str:
+    """Message d'infaisabilité pour une paire détectée par la présolution."""
+    message = '❌ RÉGION ADMISSIBLE VIDE'
+    if conflict is not None:
+        i, j = conflict
+        if i == j:
+            message += f" (contrainte C{i + 1} impossible)"
+        else:
+            message += f" (contraintes C{i + 1} et C{j + 1} incompatibles)"
+    return message
+
+
+def presolve_problem(A, b, operators, eps: float = 1e-9, drop_redundant: bool = True) -> Dict[str, Any]:
+    """Réduit les contraintes avant l'optimisation.
+
+    - lignes nulles (0 <= b) retirées, ou conflit si impossibles
+    - doublons et lignes parallèles : seule la plus serrée est gardée
+    - a·x <= b et a·x >= b fusionnées en une égalité
+    - paires incompatibles (a·x <= b1, a·x >= b2 avec b2 > b1) détectées tôt
+    - lignes rendues redondantes par les autres (hors région admissible) retirées
+
+    Retourne un dict : A, b, operators (problème réduit), row_map (indice d'origine de
+    chaque ligne gardée), removed [(indice, raison)], infeasible, conflict (i, j) et
+    region (FeasibleRegion calculée pour le test de redondance, labels d'origine).
+    """
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    ops = list(operators)
+    m = len(b)
+
+    removed: List[Tuple[int, str]] = []
+    result = {'A': A[:0], 'b': b[:0], 'operators': [], 'row_map': [], 'removed': removed,
+              'infeasible': False, 'conflict': None, 'region': None}
+
+    def infeasible(i, j):
+        result['infeasible'] = True
+        result['conflict'] = (int(i), int(j))
+        return result
+
+    norms = np.hypot(A[:, 0], A[:, 1])
+    scale = max(1.0, float(np.max(np.abs(b) / np.where(norms > eps, norms, 1.0)))) if m else 1.0
+    tol = eps * scale
+
+    # Forme n·x <= h (n unitaire) pour les inégalités, n·x = h pour les égalités
+    ineq: Dict[Tuple[float, float], Tuple[float, int]] = {}
+    eq: Dict[Tuple[float, float], Tuple[float, int]] = {}
+    for i in range(m):
+        op = ops[i]
+        if norms[i] <= eps:
+            ok = (b[i] >= -tol) if op == '<=' else (b[i] <= tol) if op == '>=' else abs(b[i]) <= tol
+            if not ok:
+                return infeasible(i, i)
+            removed.append((i, 'zero'))
+            continue
+        s = -1.0 if op == '>=' else 1.0
+        n = s * A[i] / norms[i]
+        h = s * b[i] / norms[i]
+        if op == '=':
+            if n[0] < -eps or (abs(n[0]) <= eps and n[1] < 0):
+                n, h = -n, -h
+            key = _direction_key(n)
+            if key in eq:
+                h0, j = eq[key]
+                if abs(h - h0) > tol:
+                    return infeasible(j, i)
+                removed.append((i, 'duplicate'))
+                continue
+            eq[key] = (h, i)
+        else:
+            key = _direction_key(n)
+            if key in ineq:
+                h0, j = ineq[key]
+                if abs(h - h0) <= tol:
+                    removed.append((i, 'duplicate'))
+                elif h < h0:
+                    removed.append((j, 'parallel'))
+                    ineq[key] = (h, i)
+                else:
+                    removed.append((i, 'parallel'))
+                continue
+            ineq[key] = (h, i)
+
+    # Égalités : les inégalités parallèles sont impliquées ou incompatibles
+    for key, (he, ie) in eq.items():
+        for sign in (1.0, -1.0):
+            k = _direction_key((sign * key[0], sign * key[1]))
+            if k in ineq:
+                h, i = ineq[k]
+                if sign * he > h + tol:
+                    return infeasible(ie, i)
+                removed.append((i, 'parallel'))
+                del ineq[k]
+
+    # Paires opposées : vide, ou fusion en égalité
+    merged = set()
+    for key, (h1, i) in list(ineq.items()):
+        opp = _direction_key((-key[0], -key[1]))
+        if opp not in ineq or key not in ineq:
+            continue
+        h2, j = ineq[opp]
+        if h1 + h2 < -tol:
+            return infeasible(min(i, j), max(i, j))
+        if h1 + h2 <= tol:
+            keep, drop = (i, j) if i < j else (j, i)
+            merged.add(keep)
+            removed.append((drop, 'merged'))
+            del ineq[key], ineq[opp]
+            eq[key] = (h1, keep)
+
+    kept = sorted([i for _, i in ineq.values()] + [i for _, i in eq.values()])
+    out_ops = ['=' if i in merged else ops[i] for i in kept]
+
+    if drop_redundant and kept:
+        kept, out_ops, result['region'] = _drop_redundant(A, b, kept, out_ops, removed, tol)
+        if kept is None:
+            result['infeasible'] = True
+            return result
+
+    removed.sort()
+    result['A'] = A[kept] if kept else A[:0]
+    result['b'] = b[kept] if kept else b[:0]
+    result['operators'] = out_ops
+    result['row_map'] = list(kept)
+    return result
+
+
+def _drop_redundant(A, b, kept, out_ops, removed, tol):
+    """Retire les lignes qui ne portent aucune arête et ne touchent aucun sommet de la région."""
+    A_all, b_all, labels = [], [], []
+    for i, op in zip(kept, out_ops):
+        if op in ('<=', '='):
+            A_all.append(A[i])
+            b_all.append(b[i])
+            labels.append(i)
+        if op in ('>=', '='):
+            A_all.append(-A[i])
+            b_all.append(-b[i])
+            labels.append(i)
+    A_all.extend([[-1.0, 0.0], [0.0, -1.0]])
+    b_all.extend([0.0, 0.0])
+    labels.extend([-1, -2])
+
+    region = intersect_halfplanes(np.array(A_all, dtype=float), np.array(b_all, dtype=float), labels)
+    if region.empty:
+        return None, None, region
+
+    needed = set(region.active_constraints)
+    if region.vertices:
+        V = np.array(region.vertices)
+        rows = np.array(kept)
+        gap = np.abs(V @ A[rows].T - b[rows])
+        norms = np.maximum(np.hypot(A[rows, 0], A[rows, 1]), 1e-300)
+        tight = np.any(gap <= 1e-7 * np.maximum(1.0, np.abs(b[rows])) + tol * norms, axis=0)
+        needed.update(rows[tight].tolist())
+
+    new_kept, new_ops = [], []
+    for i, op in zip(kept, out_ops):
+        if op == '=' or i in needed:
+            new_kept.append(i)
+            new_ops.append(op)
+        else:
+            removed.append((i, 'redundant'))
+    return new_kept, new_ops, region
@@ -0,0 +1,154 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.batch import OBJ_CODES, OP_CODES, _as_codes, solve_many
+
+DISTRIBUTIONS = ('uniform', 'normal')
+# Quantiles de z renvoyés par défaut
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+# Nombre de tirages par bloc (tirés puis résolus ensemble, éventuellement dans un processus)
+MC_CHUNK = 20_000
+# Nombre maximal de points x* gardés pour l'affichage
+MAX_POINTS = 5_000
+
+
+def _widths(tolerance, c, A, b, relative: bool):
+    """Demi-largeurs (uniforme) ou écarts-types (normale) de chaque coefficient."""
+    if isinstance(tolerance, dict):
+        tol = {key: np.broadcast_to(np.asarray(tolerance.get(key, 0.0), dtype=float), ref.shape)
+               for key, ref in (('c', c), ('A', A), ('b', b))}
+    else:
+        tol = {key: np.full(ref.shape, float(tolerance)) for key, ref in (('c', c), ('A', A), ('b', b))}
+    if relative:
+        # Tolérance relative : un coefficient nul reste nul (structure du problème conservée)
+        return tol['c'] * np.abs(c), tol['A'] * np.abs(A), tol['b'] * np.abs(b)
+    return tol['c'], tol['A'], tol['b']
+
+
+def _sample(rng, center, width, n: int, distribution: str):
+    shape = (n,) + center.shape
+    if distribution == 'normal':
+        return center + width * rng.standard_normal(shape)
+    return center + width * rng.uniform(-1.0, 1.0, shape)
+
+
+def _run_chunk(args):
+    """Tire et résout un bloc de perturbations ; renvoie des tableaux compacts."""
+    seed, n, c, A, b, ops, obj, widths, distribution = args
+    rng = np.random.default_rng(seed)
+    w_c, w_A, w_b = widths
+    sol = solve_many({
+        'c': _sample(rng, c, w_c, n, distribution),
+        'A': _sample(rng, A, w_A, n, distribution),
+        'b': _sample(rng, b, w_b, n, distribution),
+        'operators': np.broadcast_to(ops, (n,) + ops.shape),
+        'objective_type': np.full(n, obj, dtype=np.int8),
+    })
+    return sol['status_code'], sol['z'], sol['x'], sol['basis']
+
+
+def _nominal_point(A, b, basis):
+    # Sommet du problème nominal à l'intersection des deux contraintes de la base
+    rows, rhs = [], []
+    for lab in basis:
+        if lab == -1:
+            rows.append([1.0, 0.0])
+            rhs.append(0.0)
+        elif lab == -2:
+            rows.append([0.0, 1.0])
+            rhs.append(0.0)
+        else:
+            rows.append(A[lab])
+            rhs.append(b[lab])
+    M = np.array(rows, dtype=float)
+    if abs(np.linalg.det(M)) <= 1e-12 * max(1.0, float(np.abs(M).max())):
+        return None
+    x = np.linalg.solve(M, np.array(rhs, dtype=float))
+    return (float(x[0]) + 0.0, float(x[1]) + 0.0)
+
+
+def monte_carlo(c: List[float], A: List[List[float]], b: List[float], operators: List[str],
+                objective_type: str = 'max', n_samples: int = 10_000, tolerance: Any = 0.05,
+                distribution: str = 'uniform', relative: bool = True, seed: Optional[int] = None,
+                workers: Optional[int] = None, quantiles=QUANTILES) -> Dict[str, Any]:
+    """Analyse de robustesse : N tirages de c, A et b perturbés, résolus par lots (solve_many).
+
+    tolerance    : scalaire, ou dict {'c', 'A', 'b'} de scalaires / tableaux (par coefficient)
+    distribution : 'uniform' (coef ± tol) ou 'normal' (écart-type tol)
+    relative     : tol relative à |coef| (un coefficient nul n'est pas perturbé)
+    workers      : nombre de processus pour les grands N (None ou 1 : dans ce processus)
+
+    Les blocs ont chacun leur graine (SeedSequence) : le résultat ne dépend pas de workers.
+    Retourne les probabilités (admissible, optimal, non borné), les quantiles de z, la
+    fréquence de chaque sommet optimal (identifié par sa base) et un échantillon de x*.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution inconnue: {distribution} (choix: {', '.join(DISTRIBUTIONS)})")
+    n_samples = int(n_samples)
+    if n_samples <= 0:
+        raise ValueError("n_samples doit être positif")
+    c = np.asarray(c, dtype=float).reshape(2)
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    ops = _as_codes(list(operators), OP_CODES, 'Opérateur').reshape(-1)
+    obj = OBJ_CODES[(objective_type or 'max').lower()]
+    widths = _widths(tolerance, c, A, b, relative)
+
+    sizes = [min(MC_CHUNK, n_samples - s) for s in range(0, n_samples, MC_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(sd, n, c, A, b, ops, obj, widths, distribution) for sd, n in zip(seeds, sizes)]
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_chunk, tasks))
+    else:
+        chunks = [_run_chunk(task) for task in tasks]
+
+    status = np.concatenate([ch[0] for ch in chunks])
+    z = np.concatenate([ch[1] for ch in chunks])
+    x = np.concatenate([ch[2] for ch in chunks])
+    basis = np.concatenate([ch[3] for ch in chunks])
+
+    optimal = status == 0
+    n_opt = int(optimal.sum())
+    z_opt = z[optimal]
+    result = {
+        'n_samples': n_samples,
+        'distribution': distribution,
+        'feasible_probability': float(np.mean(status != 1)),
+        'optimal_probability': n_opt / n_samples,
+        'unbounded_probability': float(np.mean(status == 2)),
+        'z_quantiles': {float(q): float(v) for q, v in zip(quantiles, np.quantile(z_opt, quantiles))}
+        if n_opt else {},
+        'z_mean': float(z_opt.mean()) if n_opt else None,
+        'z_std': float(z_opt.std()) if n_opt else None,
+        'vertices': [],
+        'x_samples': [],
+    }
+    if not n_opt:
+        return result
+
+    # Sommets optimaux : même base (paire de contraintes) = même sommet du problème nominal
+    pairs = np.sort(basis[optimal], axis=1)
+    keys, inverse, counts = np.unique(pairs, axis=0, return_inverse=True, return_counts=True)
+    inverse = np.asarray(inverse).reshape(-1)
+    x_opt = x[optimal]
+    mean_x = np.zeros((len(keys), 2))
+    np.add.at(mean_x, inverse, x_opt)
+    mean_x /= counts[:, None]
+    for k in np.argsort(-counts, kind='stable'):
+        pair = (int(keys[k][0]), int(keys[k][1]))
+        result['vertices'].append({
+            'basis': pair,
+            'point': _nominal_point(A, b, pair),
+            'mean_x': (float(mean_x[k][0]), float(mean_x[k][1])),
+            'count': int(counts[k]),
+            'frequency': float(counts[k]) / n_samples,
+        })
+
+    keep = x_opt
+    if len(keep) > MAX_POINTS:
+        keep = keep[np.random.default_rng(0).choice(len(keep), MAX_POINTS, replace=False)]
+    result['x_samples'] = [tuple(p) for p in keep.tolist()]
+    return result
@@ -0,0 +1,124 @@
+from typing import Optional
+
+import numpy as np
+
+# Boîte englobante relative à l'échelle du problème : l'algorithme de Seidel
+# suppose un problème borné, la boîte le garantit et sert à détecter les
+# objectifs non bornés.
+BOX_FACTOR = 1e6
+
+STATUS_MESSAGES = {
+    0: 'Optimisation terminée (Seidel).',
+    2: 'Le problème est infaisable (Seidel).',
+    3: 'Le problème est non borné (Seidel).',
+}
+
+
+class LPResult:
+    """Résultat minimal, mêmes champs que scipy.optimize.linprog (status 0/2/3, x, fun, message)."""
+
+    def __init__(self, status: int, x=None, fun: Optional[float] = None):
+        self.status = status
+        self.x = None if x is None else np.asarray(x, dtype=float)
+        self.fun = fun
+        self.message = STATUS_MESSAGES.get(status, '')
+        self.success = status == 0
+
+    def __repr__(self):
+        return f"LPResult(status={self.status}, x={self.x}, fun={self.fun})"
+
+
+def _solve_1d(c, n, h, N, H, eps, tol):
+    """max c·x sur la droite n·x = h sous N·x <= H ; None si vide."""
+    p0 = n * h
+    d = np.array([-n[1], n[0]])
+    slope = N @ d
+    rhs = H - N @ p0
+    flat = np.abs(slope) <= eps
+    if np.any(rhs[flat] < -tol):
+        return None
+    up = slope > eps
+    down = slope < -eps
+    t_hi = float(np.min(rhs[up] / slope[up])) if np.any(up) else np.inf
+    t_lo = float(np.max(rhs[down] / slope[down])) if np.any(down) else -np.inf
+    if t_lo > t_hi + tol:
+        return None
+    if t_lo > t_hi:
+        t_lo = t_hi = 0.5 * (t_lo + t_hi)
+
+    cd = float(c @ d)
+    if cd > eps:
+        t = t_hi
+    elif cd < -eps:
+        t = t_lo
+    else:
+        t = t_lo if abs(t_lo) <= abs(t_hi) else t_hi  # objectif constant : l'extrémité la plus proche
+    return p0 + t * d
+
+
+def _seidel(c, N, H, M, rng, eps, tol):
+    box_N = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+    order = rng.permutation(len(H))
+    N_perm = np.vstack([box_N, N[order]])
+    H_perm = np.concatenate([np.full(4, M), H[order]])
+
+    v = M * np.sign(c)
+    k = 4
+    while k < len(H_perm):
+        # Prochaine contrainte violée par l'optimum courant (test vectorisé)
+        violated = np.flatnonzero(N_perm[k:] @ v > H_perm[k:] + tol)
+        if len(violated) == 0:
+            break
+        k += int(violated[0])
+        # Le nouvel optimum est sur la droite de la contrainte violée : LP 1D
+        v = _solve_1d(c, N_perm[k], H_perm[k], N_perm[:k], H_perm[:k], eps, tol)
+        if v is None:
+            return None
+        k += 1
+    return v
+
+
+def seidel_lp(c, A, b, seed: Optional[int] = 0, eps: float = 1e-9) -> LPResult:
+    """max c·x sous A·x <= b en 2D, algorithme incrémental randomisé de Seidel (O(m) en moyenne).
+
+    Retourne un LPResult avec status 0 (optimal), 2 (infaisable) ou 3 (non borné)
+    et fun = c·x (convention maximisation).
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1)
+
+    norms = np.hypot(A[:, 0], A[:, 1])
+    zero = norms <= eps
+    if np.any(b[zero] < -eps):
+        return LPResult(2)
+    N = A[~zero] / norms[~zero, None]
+    H = b[~zero] / norms[~zero]
+
+    scale = max(1.0, float(np.max(np.abs(H)))) if len(H) else 1.0
+    tol = eps * scale
+    M = BOX_FACTOR * scale
+    rng = np.random.default_rng(seed)
+
+    v = _seidel(c, N, H, M, rng, eps, tol)
+    if v is None:
+        return LPResult(2)
+
+    if np.any(np.abs(v) >= M * (1 - 1e-9)):
+        # Optimum posé sur la boîte : non borné si l'objectif grandit avec la boîte
+        z = float(c @ v)
+        v2 = _seidel(c, N, H, 4 * M, rng, eps, tol)
+        if v2 is not None and float(c @ v2) > z + 1e-6 * max(1.0, abs(z)):
+            return LPResult(3)
+        # Sinon rayon optimal (c·d = 0) : point optimal le plus proche de l'origine
+        c_norm = float(np.linalg.norm(c))
+        if c_norm > 0:
+            N_face = np.vstack([N, -c / c_norm])
+            H_face = np.concatenate([H, [-(z / c_norm) + tol]])
+        else:
+            N_face, H_face = N, H
+        v3 = _seidel(-np.ones(2), N_face, H_face, M, rng, eps, tol)
+        if v3 is not None:
+            v = v3
+
+    return LPResult(0, v, float(c @ v))
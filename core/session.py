@@ -0,0 +1,274 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core import instrument
+from core.halfplane import FeasibleRegion, clip_region, intersect_halfplanes
+from core.optimizer import LinearProgrammingOptimizer
+
+# Décimales utilisées pour comparer les sommets avant/après une modification
+VERTEX_DECIMALS = 9
+
+
+def _vertex_set(region: Optional[FeasibleRegion]):
+    if region is None or region.empty:
+        return set()
+    return {(round(x, VERTEX_DECIMALS) + 0.0, round(y, VERTEX_DECIMALS) + 0.0) for x, y in region.vertices}
+
+
+class SolverSession:
+    """Session de résolution avec état : région admissible et optimum mis à jour incrémentalement.
+
+    - add_constraint    : la région est coupée par le nouveau demi-plan en O(k)
+    - remove_constraint : seul le voisinage de l'arête retirée est recalculé
+    - update_constraint : retrait puis ajout de la même ligne
+    - set_objective     : objectif seul, argmax sur les sommets déjà connus en O(k)
+    - sync              : compare les entrées de l'interface à l'état courant et choisit la mise à jour
+
+    Après chaque opération, `changes` décrit ce qui a changé (sommets, optimum, statut),
+    pour que l'interface et le graphique ne rafraîchissent que le nécessaire.
+    Les cas dégénérés (égalités, région vide, segment, point) repassent par un calcul complet.
+    """
+
+    def __init__(self, c=None, A=None, b=None, operators=None, objective_type: str = 'max',
+                 backend: str = 'highs', cache=None):
+        self.backend = backend
+        self.cache = cache
+        self.c = np.zeros(2)
+        self.A = np.zeros((0, 2))
+        self.b = np.zeros(0)
+        self.operators: List[str] = []
+        self.objective_type = 'max'
+        self.region: Optional[FeasibleRegion] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.changes: Dict[str, Any] = {}
+        self._optimizer: Optional[LinearProgrammingOptimizer] = None
+        self._scale = 1.0
+        if c is not None:
+            self.load(c, A, b, operators, objective_type)
+
+    # ------------------------------------------------------------------ état
+
+    def _halfplanes(self, rows=None):
+        """Demi-plans a·x <= b des lignes (toutes par défaut) et de x >= 0, avec leurs labels."""
+        idx = np.arange(len(self.b)) if rows is None else np.asarray(rows, dtype=int)
+        ops = [self.operators[i] for i in idx]
+        sign = np.array([-1.0 if op == '>=' else 1.0 for op in ops]).reshape(-1)
+        N = [self.A[idx] * sign[:, None]]
+        h = [self.b[idx] * sign]
+        labels = [idx]
+        eq = np.array([op == '=' for op in ops], dtype=bool).reshape(-1)
+        if np.any(eq):
+            N.append(-self.A[idx[eq]])
+            h.append(-self.b[idx[eq]])
+            labels.append(idx[eq])
+        N.append(np.array([[-1.0, 0.0], [0.0, -1.0]]))
+        h.append(np.zeros(2))
+        labels.append(np.array([-1, -2]))
+        return np.vstack(N), np.concatenate(h), np.concatenate(labels).tolist()
+
+    def _row_scale(self, a, b) -> float:
+        norm = float(np.hypot(a[0], a[1]))
+        return abs(b) / norm if norm > 0 else 0.0
+
+    def _update_scale(self):
+        # Même échelle que intersect_halfplanes (max |b|/|a|) : boîte englobante et tolérances
+        norms = np.hypot(self.A[:, 0], self.A[:, 1])
+        ok = norms > 1e-9
+        self._scale = max(1.0, float(np.max(np.abs(self.b[ok]) / norms[ok]))) if np.any(ok) else 1.0
+
+    def _optimize(self):
+        self._optimizer = LinearProgrammingOptimizer(self.c, self.A, self.b, self.operators,
+                                                     self.objective_type, backend='region', region=self.region)
+        return self._optimizer.optimize()
+
+    def _reoptimize(self):
+        # Objectif seul : sommets triés et cône de récession de l'optimiseur courant réutilisés
+        self._optimizer.set_objective(self.c, self.objective_type)
+        return self._optimizer.optimize()
+
+    def _full_solve(self):
+        if self.cache is not None:
+            result = self.cache.solve(self.c, self.A, self.b, self.operators, self.objective_type,
+                                      backend=self.backend)
+            with instrument.phase('region'):
+                N, h, labels = self._halfplanes()
+                self.region = intersect_halfplanes(N, h, labels)
+        else:
+            optimizer = LinearProgrammingOptimizer(self.c, self.A, self.b, self.operators,
+                                                   self.objective_type, backend=self.backend)
+            result = optimizer.optimize()
+            self.region = optimizer.compute_feasible_region()
+        self._optimizer = LinearProgrammingOptimizer(self.c, self.A, self.b, self.operators,
+                                                     self.objective_type, backend='region', region=self.region)
+        self._update_scale()
+        return result
+
+    def _finish(self, kind: str, rows: List[int], old_region, old_result, incremental: bool):
+        """Calcule le nouvel optimum et le rapport des changements."""
+        if kind in ('objective', 'none'):
+            self.result = self._reoptimize()
+        else:
+            self.result = self._optimize() if incremental else self._full_solve()
+        if self.region is old_region:
+            before = after = set()  # même région : pas de comparaison des sommets
+        else:
+            before, after = _vertex_set(old_region), _vertex_set(self.region)
+        old = old_result or {}
+        new = self.result
+        self.changes = {
+            'kind': kind,
+            'rows': rows,
+            'incremental': incremental,
+            'region_changed': self.region is not old_region and (
+                before != after or old_region is None or old_region.empty != self.region.empty),
+            'added_vertices': sorted(after - before),
+            'removed_vertices': sorted(before - after),
+            'status_changed': old.get('status') != new.get('status'),
+            'optimum_changed': (old.get('status') != new.get('status') or old.get('z') != new.get('z')
+                                or old.get('optimal_points') != new.get('optimal_points')),
+        }
+        return self.changes
+
+    # -------------------------------------------------------------- opérations
+
+    def load(self, c, A, b, operators, objective_type: str = 'max') -> Dict[str, Any]:
+        """Charge un problème complet (calcul complet)."""
+        old_region, old_result = self.region, self.result
+        self.c = np.asarray(c, dtype=float).reshape(2)
+        self.A = np.asarray(A, dtype=float).reshape(-1, 2)
+        self.b = np.asarray(b, dtype=float).reshape(-1)
+        self.operators = list(operators)
+        self.objective_type = (objective_type or 'max').lower()
+        return self._finish('load', list(range(len(self.b))), old_region, old_result, incremental=False)
+
+    def _clip(self, region, i) -> Optional[FeasibleRegion]:
+        """Coupe la région par la ligne i ; None si un calcul complet est nécessaire."""
+        op = self.operators[i]
+        if op == '=' or region is None or region.cycle is None:
+            return None
+        if self._row_scale(self.A[i], self.b[i]) > self._scale:
+            return None  # la boîte englobante ne couvre plus le problème
+        sign = -1.0 if op == '>=' else 1.0
+        return clip_region(region, sign * self.A[i], sign * self.b[i], label=i)
+
+    def _without(self, region, i) -> Optional[FeasibleRegion]:
+        """Région sans la ligne i (labels inchangés) ; None si un calcul complet est nécessaire."""
+        if self.operators[i] == '=' or region is None or region.cycle is None:
+            return None
+        N_cyc, h_cyc, labels_cyc, is_box = region.cycle
+        if i not in labels_cyc:
+            return region  # ligne redondante : la région ne change pas
+
+        # Bord sans la ligne i : sur-ensemble de la nouvelle région
+        keep = [k for k, lab in enumerate(labels_cyc) if lab != i and not is_box[k]]
+        local = intersect_halfplanes(N_cyc[keep], h_cyc[keep], [labels_cyc[k] for k in keep],
+                                     scale=self._scale)
+        if local.cycle is None:
+            return None
+
+        # Seules les lignes violées par un sommet du nouveau bord le coupent
+        N, h, labels = self._halfplanes()
+        on_boundary = set(labels_cyc)
+        others = np.array([lab != i and lab not in on_boundary for lab in labels], dtype=bool)
+        norms = np.maximum(np.hypot(N[:, 0], N[:, 1]), 1e-300)
+        gap = local.polygon @ N[others].T - h[others]
+        violated = np.flatnonzero(others)[np.any(gap > local.tol * norms[others], axis=0)]
+        for k in violated:
+            local = clip_region(local, N[k], h[k], label=labels[k])
+            if local is None:
+                return None
+        return local
+
+    def add_constraint(self, a, b, op: str = '<=') -> Dict[str, Any]:
+        """Ajoute la ligne a·x op b à la fin (coupe de la région en O(k))."""
+        old_region, old_result = self.region, self.result
+        self.A = np.vstack([self.A, np.asarray(a, dtype=float).reshape(1, 2)])
+        self.b = np.append(self.b, float(b))
+        self.operators.append(op)
+        i = len(self.b) - 1
+        with instrument.phase('region_update'):
+            self.region = self._clip(old_region, i)
+        return self._finish('add', [i], old_region, old_result, incremental=self.region is not None)
+
+    def remove_constraint(self, index: int) -> Dict[str, Any]:
+        """Retire la ligne index (les lignes suivantes sont renumérotées)."""
+        old_region, old_result = self.region, self.result
+        with instrument.phase('region_update'):
+            region = self._without(old_region, index)
+        self.A = np.delete(self.A, index, axis=0)
+        self.b = np.delete(self.b, index)
+        del self.operators[index]
+        if region is not None:
+            region = region.relabel({lab: lab - 1 for lab in region.cycle[2]
+                                     if lab is not None and lab > index})
+        self.region = region
+        return self._finish('remove', [index], old_region, old_result, incremental=region is not None)
+
+    def update_constraint(self, index: int, a, b, op: str = '<=') -> Dict[str, Any]:
+        """Remplace la ligne index par a·x op b."""
+        old_region, old_result = self.region, self.result
+        with instrument.phase('region_update'):
+            region = self._without(old_region, index)
+            self.A[index] = np.asarray(a, dtype=float).reshape(2)
+            self.b[index] = float(b)
+            self.operators[index] = op
+            self.region = self._clip(region, index) if region is not None else None
+        return self._finish('update', [index], old_region, old_result, incremental=self.region is not None)
+
+    def set_objective(self, c, objective_type: str = 'max') -> Dict[str, Any]:
+        """Change l'objectif seul : argmax sur les sommets déjà connus, sans recalcul de la région."""
+        c = np.asarray(c, dtype=float).reshape(2)
+        objective_type = (objective_type or 'max').lower()
+        kind = 'none' if np.array_equal(c, self.c) and objective_type == self.objective_type else 'objective'
+        self.c, self.objective_type = c, objective_type
+        if self._optimizer is None:
+            return self._finish('load', [], self.region, self.result, incremental=False)
+        return self._finish(kind, [], self.region, self.result, incremental=True)
+
+    def parametric(self, parameter: str, index: int, theta_min: float, theta_max: float) -> Dict[str, Any]:
+        """Analyse paramétrique exacte sur le problème courant (région et demi-plans déjà construits)."""
+        if self._optimizer is None:
+            raise ValueError("Aucun problème chargé")
+        return self._optimizer.parametric_analysis(parameter, index, theta_min, theta_max)
+
+    def sync(self, c, A, b, operators, objective_type: str = 'max') -> Dict[str, Any]:
+        """Aligne la session sur un problème complet et renvoie le résultat.
+
+        Une seule ligne ajoutée (à la fin), retirée ou modifiée passe par la mise à jour
+        incrémentale ; toute autre différence provoque un calcul complet.
+        """
+        A = np.asarray(A, dtype=float).reshape(-1, 2)
+        b = np.asarray(b, dtype=float).reshape(-1)
+        operators = list(operators)
+        c = np.asarray(c, dtype=float).reshape(2)
+        objective_type = (objective_type or 'max').lower()
+        if self.result is None:
+            self.load(c, A, b, operators, objective_type)
+            return self.result
+
+        if (A.shape == self.A.shape and operators == self.operators
+                and np.array_equal(A, self.A) and np.array_equal(b, self.b)):
+            self.set_objective(c, objective_type)
+            return self.result
+
+        m_old, m_new = len(self.b), len(b)
+        n = min(m_old, m_new)
+        same = (np.all(self.A[:n] == A[:n], axis=1) & (self.b[:n] == b[:n])
+                & np.array([p == q for p, q in zip(self.operators[:n], operators[:n])], dtype=bool).reshape(-1))
+        diff = np.flatnonzero(~same)
+        j = int(diff[0]) if len(diff) else n
+
+        self.c, self.objective_type = c, objective_type
+
+        if m_new == m_old and len(diff) == 1:
+            self.update_constraint(j, A[j], b[j], operators[j])
+        elif m_new == m_old + 1 and j == m_old:
+            self.add_constraint(A[j], b[j], operators[j])
+        elif (m_new == m_old - 1 and np.array_equal(np.delete(self.A, j, axis=0), A)
+              and np.array_equal(np.delete(self.b, j), b)
+              and self.operators[:j] + self.operators[j + 1:] == operators):
+            self.remove_constraint(j)
+        else:
+            self.load(c, A, b, operators, objective_type)
+        return self.result
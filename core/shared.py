@@ -0,0 +1,161 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from core.batch import OBJ_CODES, OP_CODES, SOLUTION_TYPES, STATUS_NAMES, _as_codes, solve_many
+from core.optimizer import LinearProgrammingOptimizer
+
+KERNELS = ('batch', 'optimizer')
+# Tranches par processus : équilibre la charge sans multiplier les tâches
+SLICES_PER_WORKER = 4
+
+OPERATOR_NAMES = {code: op for op, code in OP_CODES.items()}
+OBJECTIVE_NAMES = {code: obj for obj, code in OBJ_CODES.items()}
+
+# Tableaux partagés du processus de calcul, attachés une fois par l'initialiseur du pool
+_worker_blocks = []
+_worker_arrays: Dict[str, np.ndarray] = {}
+
+
+class SharedArrays:
+    """Tableaux numpy placés dans des blocs shared_memory.
+
+    Seule la description (nom du bloc, forme, dtype) traverse les processus : les données
+    ne sont jamais sérialisées. À utiliser comme gestionnaire de contexte (libère les blocs).
+    """
+
+    def __init__(self):
+        self.blocks = []
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.specs: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+
+    def add(self, key: str, shape, dtype, data=None) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        self.blocks.append(block)
+        arr = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        if data is not None:
+            arr[...] = data
+        self.arrays[key] = arr
+        self.specs[key] = (block.name, tuple(shape), dtype.str)
+        return arr
+
+    def close(self):
+        self.arrays.clear()
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _attach(specs):
+    global _worker_blocks, _worker_arrays
+    _worker_blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs.values()]
+    _worker_arrays = {key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+                      for (key, (_, shape, dtype)), block in zip(specs.items(), _worker_blocks)}
+
+
+def _solve_optimizer(arrays, start: int, stop: int):
+    # Un LinearProgrammingOptimizer par problème (lent, mais la logique exacte de l'application)
+    status_codes = {name: k for k, name in enumerate(STATUS_NAMES)}
+    type_codes = {name: k for k, name in enumerate(SOLUTION_TYPES)}
+    for k in range(start, stop):
+        rows = arrays['mask'][k]
+        ops = [OPERATOR_NAMES[int(op)] for op in arrays['operators'][k][rows]]
+        result = LinearProgrammingOptimizer(arrays['c'][k].tolist(), arrays['A'][k][rows].tolist(),
+                                            arrays['b'][k][rows].tolist(), ops,
+                                            OBJECTIVE_NAMES[int(arrays['objective_type'][k])]).optimize()
+        # Échec du solveur : code 'error', jamais confondu avec un problème infaisable
+        arrays['status'][k] = status_codes[result['status']]
+        arrays['solution_type'][k] = type_codes[result['solution_type']]
+        if result['success']:
+            arrays['x'][k] = result['x']
+            arrays['z'][k] = result['z']
+        else:
+            arrays['x'][k] = np.nan
+            arrays['z'][k] = np.nan
+
+
+def _solve_slice(args, arrays=None):
+    """Résout [start, stop) en lisant et écrivant directement les tableaux partagés."""
+    start, stop, kernel = args
+    arrays = _worker_arrays if arrays is None else arrays
+    if kernel == 'optimizer':
+        _solve_optimizer(arrays, start, stop)
+        return stop - start
+    sl = slice(start, stop)
+    sol = solve_many({key: arrays[key][sl] for key in ('c', 'A', 'b', 'operators', 'objective_type', 'mask')})
+    arrays['status'][sl] = sol['status_code']
+    arrays['solution_type'][sl] = sol['solution_type_code']
+    arrays['x'][sl] = sol['x']
+    arrays['z'][sl] = sol['z']
+    return stop - start
+
+
+def solve_shared(problems: Dict[str, Any], workers: Optional[int] = None, kernel: str = 'batch',
+                 slices: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Résout un lot sur plusieurs cœurs sans sérialiser les problèmes.
+
+    problems : tableaux empilés comme pour solve_many (voir stack_problems).
+    Les entrées (c, A, b, codes des opérateurs et de l'objectif, masque) sont copiées une fois
+    en mémoire partagée ; chaque processus résout des tranches contiguës et écrit status, x, z
+    et solution_type dans des tableaux de sortie partagés. Seules les bornes des tranches sont
+    envoyées aux processus.
+    kernel : 'batch' (noyau vectorisé solve_many) ou 'optimizer' (LinearProgrammingOptimizer
+    problème par problème). workers None ou 1 : dans ce processus.
+    """
+    if kernel not in KERNELS:
+        raise ValueError(f"Noyau inconnu: {kernel} (choix: {', '.join(KERNELS)})")
+    c = np.asarray(problems['c'], dtype=float).reshape(-1, 2)
+    N = len(c)
+    A = np.asarray(problems['A'], dtype=float).reshape(N, -1, 2)
+    m = A.shape[1]
+    ops = _as_codes(problems['operators'], OP_CODES, 'Opérateur').reshape(N, m)
+    obj = _as_codes(problems.get('objective_type', np.zeros(N, dtype=np.int8)), OBJ_CODES,
+                    'objective_type').reshape(-1)
+    mask = problems.get('mask')
+
+    with SharedArrays() as shared:
+        shared.add('c', (N, 2), np.float64, c)
+        shared.add('A', (N, m, 2), np.float64, A)
+        shared.add('b', (N, m), np.float64, np.asarray(problems['b'], dtype=float).reshape(N, m))
+        shared.add('operators', (N, m), np.int8, ops)
+        shared.add('objective_type', (N,), np.int8, np.broadcast_to(obj, (N,)))
+        shared.add('mask', (N, m), np.bool_, True if mask is None else np.asarray(mask, dtype=bool).reshape(N, m))
+        shared.add('status', (N,), np.int8)
+        shared.add('solution_type', (N,), np.int8)
+        shared.add('x', (N, 2), np.float64)
+        shared.add('z', (N,), np.float64)
+
+        workers = workers or 1
+        slices = slices or workers * SLICES_PER_WORKER
+        bounds = np.linspace(0, N, min(slices, N) + 1).astype(int) if N else np.zeros(1, dtype=int)
+        tasks = [(int(s), int(e), kernel) for s, e in zip(bounds[:-1], bounds[1:]) if e > s]
+
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                     initargs=(shared.specs,)) as pool:
+                for _ in pool.map(_solve_slice, tasks):
+                    pass
+        else:
+            for task in tasks:
+                _solve_slice(task, shared.arrays)
+
+        out = shared.arrays
+        status = out['status'].copy()
+        return {
+            'status': STATUS_NAMES[status],
+            'status_code': status,
+            'x': out['x'].copy(),
+            'z': out['z'].copy(),
+            'solution_type': SOLUTION_TYPES[out['solution_type']],
+            'solution_type_code': out['solution_type'].copy(),
+        }
@@ -2,6 +2,49 @@ from fpdf import FPDF
 import os
 from datetime import datetime
 
+def _fmt_bound(v):
+    if v == float('inf'):
+        return "+inf"
+    if v == float('-inf'):
+        return "-inf"
+    return f"{v:.4f}"
+
+
+def add_sensitivity_section(pdf, sensitivity):
+    # Section Sensibilité : duals, écarts et intervalles de b, puis intervalles de c1 et c2
+    pdf.set_fill_color(252, 203, 121)
+    pdf.set_font("Arial", "B", 14)
+    pdf.set_text_color(11, 59, 54)
+    pdf.cell(0, 10, " ANALYSE DE SENSIBILITE", ln=True, fill=True)
+    pdf.ln(5)
+    
+    pdf.set_font("Arial", "B", 11)
+    pdf.set_text_color(73, 115, 113)
+    widths = (30, 40, 40, 70)
+    for w, title in zip(widths, ("Contrainte", "Prix dual", "Ecart", "Intervalle de b")):
+        pdf.cell(w, 8, title, border='B')
+    pdf.ln()
+    
+    pdf.set_font("Arial", "", 10)
+    pdf.set_text_color(0, 0, 0)
+    rows = zip(sensitivity['duals'], sensitivity['slacks'], sensitivity['rhs_ranges'])
+    for i, (dual, slack, (lo, hi)) in enumerate(rows):
+        pdf.cell(widths[0], 7, f"  ({i+1})")
+        pdf.cell(widths[1], 7, f"{dual:.4f}")
+        pdf.cell(widths[2], 7, f"{slack:.4f}")
+        pdf.cell(widths[3], 7, f"[{_fmt_bound(lo)} ; {_fmt_bound(hi)}]", ln=True)
+    pdf.ln(5)
+    
+    pdf.set_font("Arial", "B", 12)
+    pdf.set_text_color(73, 115, 113)
+    pdf.cell(0, 8, "Coefficients de l'objectif (base inchangee):", ln=True)
+    pdf.set_font("Arial", "", 11)
+    pdf.set_text_color(0, 0, 0)
+    for j, (lo, hi) in enumerate(sensitivity['objective_ranges']):
+        pdf.cell(0, 8, f"  c{j+1} dans [{_fmt_bound(lo)} ; {_fmt_bound(hi)}]", ln=True)
+    pdf.ln(10)
+
+
 def generate_pdf(result, c, A, b, operators, obj_type, fig):
     
     pdf = FPDF()
@@ -90,6 +133,9 @@ def generate_pdf(result, c, A, b, operators, obj_type, fig):
         
         pdf.ln(15)
         
+        if result.get('sensitivity'):
+            add_sensitivity_section(pdf, result['sensitivity'])
+        
     else:
         pdf.set_font("Arial", "B", 12)
         pdf.set_text_color(255, 100, 100)
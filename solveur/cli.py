@@ -0,0 +1,116 @@
+"""Résolution par lots sans interface graphique : python -m solveur problemes.jsonl -o resultats.ndjson
+
+N'importe ni Qt, ni matplotlib, ni fpdf, ni google-generativeai.
+"""
+import argparse
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, TextIO, Tuple
+
+from core.optimizer import BACKENDS
+from solveur.records import read_csv, read_jsonl, solve_chunk
+
+# Problèmes par bloc envoyé à un processus
+CHUNK_SIZE = 64
+# Blocs en vol par processus : borne la mémoire quelle que soit la taille du fichier
+PENDING_PER_WORKER = 2
+
+
+def read_problems(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Any]]:
+    return read_csv(stream) if fmt == 'csv' else read_jsonl(stream)
+
+
+def chunked(problems: Iterable[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, int, Any]]]:
+    """Blocs [(index, ligne, problème)] numérotés dans l'ordre d'entrée."""
+    numbered = ((index, lineno, problem) for index, (lineno, problem) in enumerate(problems))
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(problems: Iterable[Tuple[int, Any]], out: TextIO, workers: int = 1, chunk_size: int = CHUNK_SIZE,
+        full: bool = False, backend: str = 'highs') -> Counter:
+    """Résout le flux et écrit une ligne NDJSON par problème, dans l'ordre d'entrée.
+
+    Avec workers > 1, au plus PENDING_PER_WORKER blocs par processus sont en vol : la lecture
+    attend l'écriture du plus ancien bloc, la mémoire reste bornée par workers x chunk_size.
+    Renvoie le nombre d'enregistrements par statut.
+    """
+    counts = Counter()
+
+    def write(lines):
+        for status, line in lines:
+            counts[status] += 1
+            out.write(line + '\n')
+
+    tasks = ((chunk, full, backend) for chunk in chunked(problems, chunk_size))
+    if workers <= 1:
+        for task in tasks:
+            write(solve_chunk(task))
+        return counts
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(solve_chunk, task))
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    return counts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m solveur',
+        description="Résout des programmes linéaires à deux variables (format de LLMExtractor) "
+                    "depuis un fichier JSONL ou CSV et écrit les résultats en NDJSON.")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="fichier d'entrée (.jsonl ou .csv, '-' pour l'entrée standard)")
+    parser.add_argument('-o', '--output', default='-', help="fichier NDJSON de sortie ('-' : sortie standard)")
+    parser.add_argument('-f', '--format', choices=('jsonl', 'csv'),
+                        help="format d'entrée (par défaut d'après l'extension, sinon jsonl)")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus (1 : dans ce processus)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="problèmes par bloc")
+    parser.add_argument('--backend', choices=BACKENDS, default='highs', help="solveur utilisé")
+    parser.add_argument('--full', action='store_true',
+                        help="résultat complet (géométrie, sommets évalués...) au lieu du résumé")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers et --chunk-size doivent être >= 1")
+    if args.format is None:
+        args.format = 'csv' if args.input.lower().endswith('.csv') else 'jsonl'
+    return args
+
+
+def main(argv=None) -> int:
+    """Code de sortie : 0 si tout est résolu, 1 si des problèmes sont invalides ou en erreur."""
+    args = parse_args(argv)
+    src = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8', newline='')
+    dst = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        counts = run(read_problems(src, args.format), dst, workers=args.workers,
+                     chunk_size=args.chunk_size, full=args.full, backend=args.backend)
+    except BrokenPipeError:
+        # Sortie fermée par le lecteur (| head...) : on s'arrête sans trace
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"❌ Erreur: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+    total = sum(counts.values())
+    summary = ', '.join(f"{status}: {n}" for status, n in sorted(counts.items()))
+    print(f"{total} problème(s) — {summary or 'aucun'}", file=sys.stderr)
+    return 1 if counts['invalid'] or counts['error'] else 0
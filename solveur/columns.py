@@ -0,0 +1,51 @@
+"""Lots au format colonne (core.columnar) en ligne de commande.
+
+python -m solveur.columns import problemes.jsonl lot/      JSONL -> format colonne
+python -m solveur.columns export lot/ problemes.jsonl      format colonne -> JSONL
+python -m solveur.columns solve lot/ resultats/            résolution bloc par bloc
+"""
+import argparse
+import os
+import sys
+
+from core.columnar import CHUNK_SIZE, from_jsonl, solve_columns, to_jsonl
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m solveur.columns', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    imp = commands.add_parser('import', help="convertit un JSONL au format colonne")
+    imp.add_argument('input')
+    imp.add_argument('output')
+    imp.add_argument('--max-rows', type=int, help="largeur des contraintes (défaut : lue dans le fichier)")
+
+    exp = commands.add_parser('export', help="réécrit un lot au format colonne en JSONL")
+    exp.add_argument('input')
+    exp.add_argument('output')
+
+    solve = commands.add_parser('solve', help="résout un lot et écrit les résultats au format colonne")
+    solve.add_argument('input')
+    solve.add_argument('output')
+    solve.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1, help="nombre de processus")
+
+    for sub in (imp, exp, solve):
+        sub.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="problèmes par bloc")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'import':
+            count = from_jsonl(args.input, args.output, max_rows=args.max_rows, chunk_size=args.chunk_size)
+        elif args.command == 'export':
+            count = to_jsonl(args.input, args.output, chunk_size=args.chunk_size)
+        else:
+            count = solve_columns(args.input, args.output, chunk_size=args.chunk_size, workers=args.workers)
+    except (OSError, ValueError) as e:
+        print(f"❌ Erreur: {e}", file=sys.stderr)
+        return 1
+    print(f"{count} problème(s) → {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Générateur de charge pour le service : python -m solveur.loadgen --concurrency 32 --requests 2000
+
+Envoie des problèmes aléatoires (graine fixe) ou lus dans un fichier JSONL sur des connexions
+keep-alive concurrentes et rapporte le débit et les latences p50/p90/p99.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+
+def random_problem(rng: random.Random, m: int) -> Dict[str, Any]:
+    """Problème borné par construction (contraintes <= à second membre positif, plus x1 + x2 <= 100)."""
+    constraints = [{'a': round(rng.uniform(0.1, 5), 3), 'b': round(rng.uniform(0.1, 5), 3), 'op': '<=',
+                    'c': round(rng.uniform(1, 50), 3)} for _ in range(m - 1)]
+    constraints.append({'a': 1, 'b': 1, 'op': '<=', 'c': 100})
+    return {'objective_type': rng.choice(['max', 'min']),
+            'c': [round(rng.uniform(-5, 5), 3), round(rng.uniform(-5, 5), 3)], 'constraints': constraints}
+
+
+def load_problems(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def post(reader, writer, host: str, path: str, payload: bytes) -> Tuple[int, bytes]:
+    writer.write((f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                  f"Content-Length: {len(payload)}\r\n\r\n").encode('latin-1') + payload)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connexion fermée par le service")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def client(url, path, payloads, latencies, statuses):
+    """Une connexion keep-alive qui envoie les requêtes de la file partagée l'une après l'autre."""
+    reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+    try:
+        while payloads:
+            payload = payloads.pop()
+            start = time.perf_counter()
+            status, _ = await post(reader, writer, url.netloc, path, payload)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def run(url: str, problems: List[Dict[str, Any]], requests: int, concurrency: int,
+              batch: int = 0, query: str = '') -> Dict[str, Any]:
+    """Envoie `requests` requêtes (/solve, ou /solve_batch de `batch` problèmes) avec `concurrency` clients."""
+    parts = urlsplit(url)
+    path = ('/solve_batch' if batch else '/solve') + (f'?{query}' if query else '')
+    payloads = []
+    for k in range(requests):
+        if batch:
+            body = {'problems': [problems[(k * batch + i) % len(problems)] for i in range(batch)]}
+        else:
+            body = problems[k % len(problems)]
+        payloads.append(json.dumps(body).encode('utf-8'))
+    payloads.reverse()
+
+    latencies, statuses = [], Counter()
+    start = time.perf_counter()
+    await asyncio.gather(*(client(parts, path, payloads, latencies, statuses) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'problems': len(latencies) * (batch or 1),
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'throughput_pps': round(len(latencies) * (batch or 1) / elapsed, 1),
+        'p50_ms': round(float(np.percentile(ms, 50)), 2),
+        'p90_ms': round(float(np.percentile(ms, 90)), 2),
+        'p99_ms': round(float(np.percentile(ms, 99)), 2),
+        'max_ms': round(float(ms.max()), 2),
+        'status': {str(k): v for k, v in sorted(statuses.items())},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m solveur.loadgen', description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8765')
+    parser.add_argument('-n', '--requests', type=int, default=2000, help="nombre de requêtes")
+    parser.add_argument('-c', '--concurrency', type=int, default=32, help="clients simultanés")
+    parser.add_argument('--batch', type=int, default=0, help="problèmes par requête /solve_batch (0 : /solve)")
+    parser.add_argument('-m', '--constraints', type=int, default=6, help="contraintes des problèmes aléatoires")
+    parser.add_argument('--input', help="fichier JSONL de problèmes à la place des problèmes aléatoires")
+    parser.add_argument('--png', action='store_true', help="demande aussi le graphique PNG")
+    parser.add_argument('--warmup', type=int, default=50, help="requêtes de chauffe non comptées")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    problems = load_problems(args.input) if args.input else [random_problem(rng, args.constraints)
+                                                              for _ in range(1000)]
+    query = 'png=1' if args.png else ''
+    concurrency = max(1, min(args.concurrency, args.requests))
+    try:
+        if args.warmup:
+            asyncio.run(run(args.url, problems, args.warmup, concurrency, args.batch, query))
+        report = asyncio.run(run(args.url, problems, args.requests, concurrency, args.batch, query))
+    except OSError as e:
+        print(f"❌ Service injoignable ({args.url}): {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import base64
+import csv
+import io
+import json
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.optimizer import solve_linear_program
+from utils.validators import validate_problem
+
+# Champs du résultat du solveur gardés par défaut (geometry, all_evaluations... avec --full)
+SUMMARY_KEYS = ('success', 'status', 'x', 'z', 'message', 'solution_type', 'region_bounded',
+                'optimal_points', 'recession_direction', 'active_constraints', 'sensitivity')
+# Colonnes CSV : une contrainte par ligne, les lignes consécutives de même id forment un problème
+CSV_FIELDS = ('id', 'objective_type', 'c1', 'c2', 'a', 'b', 'op', 'c')
+
+
+def read_jsonl(stream: Iterable[str]) -> Iterator[Tuple[int, Any]]:
+    """(numéro de ligne, problème) pour chaque ligne non vide.
+
+    Une ligne illisible donne une ValueError à la place du problème : elle sortira en erreur
+    à sa place dans le flux de résultats au lieu d'interrompre la lecture.
+    """
+    for lineno, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield lineno, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield lineno, ValueError(f"JSON invalide: {e.msg} (colonne {e.colno})")
+
+
+def read_csv(stream: Iterable[str]) -> Iterator[Tuple[int, Any]]:
+    """(numéro de ligne, problème) au format de LLMExtractor, regroupé depuis un CSV.
+
+    objective_type, c1 et c2 sont lus sur la première ligne de chaque problème.
+    """
+    reader = csv.DictReader(stream)
+    missing = [key for key in CSV_FIELDS if key != 'objective_type' and key not in (reader.fieldnames or ())]
+    if missing:
+        raise ValueError(f"Colonnes CSV manquantes: {', '.join(missing)}")
+
+    current, lineno = None, 0
+    for row in reader:
+        if current is None or row['id'] != current['id']:
+            if current is not None:
+                yield lineno, current
+            lineno = reader.line_num
+            current = {'id': row['id'], 'objective_type': (row.get('objective_type') or 'max').strip().lower(),
+                       'c': [row['c1'], row['c2']], 'constraints': []}
+        current['constraints'].append({'a': row['a'], 'b': row['b'], 'op': (row['op'] or '').strip(),
+                                       'c': row['c']})
+    if current is not None:
+        yield lineno, current
+
+
+def json_safe(value: Any) -> Any:
+    """Convertit un résultat du solveur en JSON strict.
+
+    Tuples et tableaux numpy deviennent des listes, les scalaires numpy des nombres Python ;
+    ±inf (bornes de sensibilité, rayons) devient "inf"/"-inf", relisible par float(), et NaN null.
+    """
+    if isinstance(value, dict):
+        return {str(k): json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return json_safe(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None if math.isnan(value) else ('inf' if value > 0 else '-inf')
+    return value
+
+
+def problem_arrays(problem: Dict[str, Any]):
+    """(c, A, b, operators, objective_type) d'un problème déjà validé."""
+    constraints = problem['constraints']
+    c = [float(v) for v in problem['c']]
+    A = [[float(cons['a']), float(cons['b'])] for cons in constraints]
+    b = [float(cons['c']) for cons in constraints]
+    operators = [cons['op'] for cons in constraints]
+    return c, A, b, operators, problem.get('objective_type', 'max')
+
+
+def render_png(c, A, b, operators, objective_type, result: Dict[str, Any]) -> str:
+    """Graphique du résultat (create_plot) en PNG encodé base64.
+
+    matplotlib n'est importé qu'ici : le chemin sans rendu reste sans dépendance graphique.
+    """
+    from core.plotting import create_plot
+
+    fig = create_plot(A, b, result.get('x') if result.get('success') else None, c, objective_type, operators,
+                      optimal_points=result.get('optimal_points', []),
+                      region_bounded=bool(result.get('region_bounded', True)),
+                      status=result.get('status', 'optimal'), solver_result=result)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return base64.b64encode(buf.getvalue()).decode('ascii')
+
+
+def solve_record(index: int, lineno: Optional[int], problem: Any, full: bool = False,
+                 backend: str = 'highs', png: bool = False) -> Dict[str, Any]:
+    """Valide et résout un problème ; les erreurs deviennent un enregistrement 'invalid'/'error'.
+
+    png : ajoute le graphique du résultat (champ 'png', base64).
+    """
+    record = {'index': index} if lineno is None else {'index': index, 'line': lineno}
+    if isinstance(problem, dict) and 'id' in problem:
+        record['id'] = problem['id']
+    if isinstance(problem, Exception):
+        return {**record, 'status': 'invalid', 'message': str(problem)}
+    error = validate_problem(problem)
+    if error:
+        return {**record, 'status': 'invalid', 'message': error}
+    arrays = problem_arrays(problem)
+    try:
+        result = solve_linear_program(*arrays, backend=backend)
+        image = render_png(*arrays, result) if png else None
+    except Exception as e:
+        return {**record, 'status': 'error', 'message': f"{type(e).__name__}: {e}"}
+    record.update(json_safe(result if full else {key: result[key] for key in SUMMARY_KEYS if key in result}))
+    if image is not None:
+        record['png'] = image
+    return record
+
+
+def dump_record(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, allow_nan=False)
+
+
+def solve_chunk(args) -> List[Tuple[str, str]]:
+    """Résout un bloc [(index, ligne, problème)] ; renvoie (statut, ligne NDJSON) dans l'ordre."""
+    items, full, backend = args
+    out = []
+    for index, lineno, problem in items:
+        record = solve_record(index, lineno, problem, full=full, backend=backend)
+        out.append((record['status'], dump_record(record)))
+    return out
@@ -0,0 +1,354 @@
+"""Service HTTP local de résolution : python -m solveur.service --port 8765
+
+POST /solve        un problème (format de LLMExtractor) -> son résultat
+POST /solve_batch  {"problems": [...]} ou une liste -> {"results": [...]} dans l'ordre
+GET  /health       état de la file et compteurs
+
+Par défaut la réponse se limite à success, status, x, z, solution_type et region_bounded ; les
+petits problèmes d'un lot sont alors résolus ensemble par solve_many (core.batch). Paramètres de
+requête : png=1 (graphique create_plot en base64), full=1 (résultat complet du solveur, problème par
+problème), timeout=<secondes>. File pleine : 503 + Retry-After ; délai dépassé : 504.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from core.batch import solve_many, stack_problems
+from solveur.records import json_safe, solve_record
+from utils.validators import validate_problem
+
+# Problèmes en attente au plus ; au-delà les requêtes sont refusées (503)
+QUEUE_SIZE = 1024
+# Problèmes regroupés au plus par lot envoyé à un processus
+MAX_BATCH = 64
+# Attente (s) pour laisser des requêtes concurrentes rejoindre un lot incomplet
+BATCH_WINDOW = 0.002
+# Délai par défaut d'une requête (s), file d'attente comprise
+REQUEST_TIMEOUT = 10.0
+# Taille maximale d'un corps de requête (octets)
+MAX_BODY = 8 * 1024 * 1024
+# Champs de la réponse par défaut (sans png ni full)
+SUMMARY_FIELDS = ('success', 'status', 'x', 'z', 'solution_type', 'region_bounded')
+# Contraintes au plus pour la résolution vectorisée : solve_many énumère les sommets en O(m³) par problème
+VECTOR_MAX_ROWS = 64
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+           504: 'Gateway Timeout'}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _vectorizable(problem: Any, png: bool, full: bool) -> bool:
+    return (not png and not full and isinstance(problem, dict) and validate_problem(problem) is None
+            and len(problem['constraints']) <= VECTOR_MAX_ROWS)
+
+
+def _summary(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Réponse par défaut tirée d'un enregistrement de solve_record (message gardé pour les erreurs)."""
+    keep = ('index', 'id', 'message') if record['status'] in ('invalid', 'error') else ('index', 'id')
+    return {key: value for key, value in record.items() if key in keep or key in SUMMARY_FIELDS}
+
+
+def solve_batch(items) -> List[Dict[str, Any]]:
+    """Résout un lot [(index, problème, png, full)] dans un processus du pool.
+
+    Les problèmes valides sans png ni full, d'au plus VECTOR_MAX_ROWS contraintes, sont résolus
+    en un seul appel à solve_many ; les autres, et ceux que solve_many n'a pas su résoudre,
+    passent un à un par solve_record.
+    """
+    records: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    vector = [k for k, (_, problem, png, full) in enumerate(items) if _vectorizable(problem, png, full)]
+    if vector:
+        try:
+            sol = solve_many(stack_problems(items[k][1] for k in vector))
+        except Exception:
+            vector = []
+        for j, k in enumerate(vector):
+            status = str(sol['status'][j])
+            if status == 'error':
+                continue
+            index, problem = items[k][:2]
+            record = {'index': index}
+            if 'id' in problem:
+                record['id'] = problem['id']
+            record.update(json_safe({'success': status == 'optimal', 'status': status, 'x': sol['x'][j],
+                                     'z': sol['z'][j], 'solution_type': str(sol['solution_type'][j]),
+                                     'region_bounded': bool(sol['bounded'][j])}))
+            records[k] = record
+    for k, (index, problem, png, full) in enumerate(items):
+        if records[k] is None:
+            record = solve_record(index, None, problem, full=full, png=png)
+            records[k] = record if png or full else _summary(record)
+    return records
+
+
+def _flag(query: Dict[str, List[str]], name: str) -> bool:
+    return query.get(name, ['0'])[-1].lower() in ('1', 'true', 'yes', 'oui')
+
+
+class SolveService:
+    """File bornée regroupant les requêtes concurrentes en lots résolus par un pool de processus.
+
+    Au plus un lot par processus est en vol : tant que les processus sont occupés, les requêtes
+    s'accumulent dans la file (les lots suivants sont plus gros), puis sont refusées quand elle est pleine.
+    """
+
+    def __init__(self, workers: Optional[int] = None, queue_size: int = QUEUE_SIZE, max_batch: int = MAX_BATCH,
+                 batch_window: float = BATCH_WINDOW, timeout: float = REQUEST_TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.timeout = timeout
+        self.stats = Counter()
+        self.queue = None
+        self.pool = None
+        self.server = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765):
+        self.queue = asyncio.Queue(self.queue_size)
+        self.slots = asyncio.Semaphore(self.workers)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.batcher = asyncio.create_task(self.run_batches())
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.batcher.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    # --- File et lots ---
+
+    def enqueue(self, problems: List[Any], png: bool, full: bool) -> List[asyncio.Future]:
+        """Place les problèmes en file (tous ou aucun) ; 503 si la place manque."""
+        if len(problems) > self.queue_size:
+            raise HttpError(413, f"Lot trop grand ({len(problems)} problèmes, maximum {self.queue_size})")
+        if self.queue.maxsize - self.queue.qsize() < len(problems):
+            self.stats['rejected'] += len(problems)
+            raise HttpError(503, "File d'attente pleine, réessayez plus tard")
+        loop = asyncio.get_running_loop()
+        futures = []
+        for index, problem in enumerate(problems):
+            future = loop.create_future()
+            self.queue.put_nowait(((index, problem, png, full), future))
+            futures.append(future)
+        return futures
+
+    async def run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.slots.acquire()
+            batch = [await self.queue.get()]
+            if self.queue.qsize() < self.max_batch - 1 and self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # Requêtes expirées ou abandonnées pendant l'attente : rien à calculer
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                self.slots.release()
+                continue
+            self.stats['batches'] += 1
+            self.stats['batched'] += len(batch)
+            pool = self.pool
+            try:
+                task = loop.run_in_executor(pool, solve_batch, [item for item, _ in batch])
+            except Exception as e:
+                # Soumission refusée (pool cassé, arrêté) : le lot échoue, le batcher continue
+                self.slots.release()
+                self.fail(batch, e)
+                if isinstance(e, BrokenProcessPool):
+                    self.restart_pool(pool)
+                continue
+            task.add_done_callback(partial(self.deliver, batch, pool))
+
+    def restart_pool(self, broken: ProcessPoolExecutor):
+        """Remplace un pool cassé (processus tué...) ; sans effet s'il a déjà été remplacé."""
+        if broken is not self.pool:
+            return
+        self.stats['pool_restarts'] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    @staticmethod
+    def fail(batch: List[Tuple[Any, asyncio.Future]], error: BaseException):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def deliver(self, batch: List[Tuple[Any, asyncio.Future]], pool: ProcessPoolExecutor, task: asyncio.Future):
+        self.slots.release()
+        error = task.exception() if not task.cancelled() else asyncio.CancelledError()
+        if isinstance(error, BrokenProcessPool):
+            self.restart_pool(pool)
+        records = [None] * len(batch) if error else task.result()
+        for (_, future), record in zip(batch, records):
+            if future.done():
+                continue
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(record)
+
+    # --- HTTP ---
+
+    async def solve(self, problems: List[Any], query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        try:
+            timeout = float(query.get('timeout', [self.timeout])[-1])
+        except ValueError:
+            raise HttpError(400, "timeout invalide")
+        if timeout <= 0:
+            raise HttpError(400, "timeout doit être > 0")
+        futures = self.enqueue(problems, _flag(query, 'png'), _flag(query, 'full'))
+        try:
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout)
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
+            raise HttpError(504, f"Délai dépassé ({timeout:g} s)")
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if url.path == '/health':
+            return 200, {'status': 'ok', 'queue': self.queue.qsize(), 'queue_size': self.queue_size,
+                         'workers': self.workers, 'stats': dict(self.stats)}
+        if url.path not in ('/solve', '/solve_batch'):
+            raise HttpError(404, f"Chemin inconnu: {url.path}")
+        if method != 'POST':
+            raise HttpError(405, "Méthode non autorisée (POST attendu)")
+        try:
+            data = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise HttpError(400, f"JSON invalide: {e}")
+
+        if url.path == '/solve':
+            error = validate_problem(data)
+            if error:
+                return 400, {'status': 'invalid', 'message': error}
+            record = (await self.solve([data], query))[0]
+            return (500 if record['status'] == 'error' else 200), record
+
+        problems = data.get('problems') if isinstance(data, dict) else data
+        if not isinstance(problems, list) or not problems:
+            raise HttpError(400, "'problems' doit être une liste non vide")
+        return 200, {'results': await self.solve(problems, query)}
+
+    async def read_request(self, reader: asyncio.StreamReader):
+        """(méthode, cible, keep_alive, corps) ou None si le client a fermé la connexion."""
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise HttpError(400, "Ligne de requête invalide")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HttpError(400, "Content-Length invalide")
+        if length < 0:
+            raise HttpError(400, "Content-Length invalide")
+        if length > MAX_BODY:
+            raise HttpError(413, f"Corps trop grand (maximum {MAX_BODY} octets)")
+        body = await reader.readexactly(length) if length else b''
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+        return method, target, keep_alive, body
+
+    def write_response(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool):
+        self.stats[status] += 1
+        body = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode('utf-8')
+        head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                "Content-Type: application/json; charset=utf-8",
+                f"Content-Length: {len(body)}",
+                f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if status == 503:
+            head.append("Retry-After: 1")
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except HttpError as e:
+                    # Requête illisible : on répond puis on ferme, le flux n'est plus synchronisé
+                    self.write_response(writer, e.status, {'status': 'error', 'message': str(e)}, False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, keep_alive, body = request
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {'status': 'error', 'message': str(e)}
+                except Exception as e:
+                    status, payload = 500, {'status': 'error', 'message': f"{type(e).__name__}: {e}"}
+                self.write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(service: SolveService, host: str, port: int):
+    server = await service.start(host, port)
+    print(f"Service de résolution sur http://{host}:{port} ({service.workers} processus)", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m solveur.service',
+                                     description="Service HTTP local de résolution avec regroupement en lots.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1, help="nombre de processus")
+    parser.add_argument('--queue-size', type=int, default=QUEUE_SIZE, help="problèmes en attente au plus")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH, help="problèmes par lot au plus")
+    parser.add_argument('--batch-window', type=float, default=BATCH_WINDOW * 1000,
+                        help="attente de regroupement (ms)")
+    parser.add_argument('--timeout', type=float, default=REQUEST_TIMEOUT, help="délai par défaut (s)")
+    args = parser.parse_args(argv)
+
+    service = SolveService(workers=args.workers, queue_size=args.queue_size, max_batch=args.max_batch,
+                           batch_window=args.batch_window / 1000, timeout=args.timeout)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
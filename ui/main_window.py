@@ -1,22 +1,32 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                                QPushButton, QLabel, QLineEdit, QComboBox, QMessageBox, 
                                QScrollArea, QFrame, QSizePolicy, QTextEdit, QDialog, QDialogButtonBox)  
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QFont, QImage, QPixmap
 import matplotlib
 matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 from utils.validators import validate_inputs
-from core.optimizer import solve_linear_program
-from core.plotting import create_plot
+from core import instrument
+from core.cache import configure_cache
+from core.optimizer import LinearProgrammingOptimizer
+from core.session import SolverSession
+from core.plotting import ProblemPlot, create_plot, create_parametric_plot
+from core.robustness import monte_carlo
 from pdf_export import generate_pdf
 from LLM_GEMINI.llm_extractor import LLMExtractor
 import os
+import threading
+import time
 from dotenv import load_dotenv
 load_dotenv() 
 
+# Mode direct : attente après la dernière frappe avant de résoudre, puis avant de reconstruire les cartes
+LIVE_DEBOUNCE_MS = 150
+LIVE_SETTLE_MS = 600
+
 #===========================LLM Worker Thread=================================
 class LLMWorker(QThread):
     """Thread pour extraction LLM sans bloquer l'interface"""
@@ -38,6 +48,185 @@ class LLMWorker(QThread):
             self.error.emit(str(e))
 
 
+#===========================Render Worker Thread==============================
+class RenderWorker(QThread):
+    """Thread de résolution et de rendu : la session est mise à jour puis la figure est
+    dessinée (Agg, API objet Figure) dans un QImage remis à l'interface.
+
+    Une seule demande en attente : submit() remplace la précédente et cancel() périme
+    celle en cours. Un rendu périmé est abandonné entre deux étapes et n'est jamais émis.
+    Session et figure n'appartiennent qu'à ce thread : l'interface lit l'instantané du
+    problème joint à chaque rendu (c, A, b, opérateurs, objectif, région).
+    """
+    rendered = Signal(int, object)
+    error = Signal(int, str)
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.plot = ProblemPlot()
+        self._cond = threading.Condition()
+        self._job = None
+        self._generation = 0
+        self._stopped = False
+
+    def submit(self, job):
+        with self._cond:
+            self._generation += 1
+            self._job = (self._generation, job)
+            self._cond.notify()
+            return self._generation
+
+    def cancel(self):
+        with self._cond:
+            self._generation += 1
+            self._job = None
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._job = None
+            self._cond.notify()
+        self.wait()
+
+    def is_current(self, generation):
+        return generation == self._generation
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._job is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                generation, job = self._job
+                self._job = None
+            try:
+                payload = self.render(generation, job)
+            except Exception as e:
+                if self.is_current(generation):
+                    self.error.emit(generation, str(e))
+                continue
+            if payload is not None and self.is_current(generation):
+                self.rendered.emit(generation, payload)
+
+    def render(self, generation, job):
+        # Profil détaillé (SOLVEUR_PROFILE=1) : phases de la résolution et du rendu dans un seul enregistrement
+        with instrument.recording() as rec:
+            payload = self._render(generation, job)
+        if payload is not None:
+            payload['profile'] = instrument.attach(rec, payload['result']).get('timings') if rec else None
+        return payload
+
+    def _render(self, generation, job):
+        session = self.session
+        t0 = time.perf_counter()
+        if job.get('objective_only'):
+            session.set_objective(job['c'], job['objective_type'])
+        else:
+            session.sync(job['c'], job['A'], job['b'], job['operators'], job['objective_type'])
+        result = session.result
+        t1 = time.perf_counter()
+        if not self.is_current(generation):
+            return None
+
+        width, height = job['size']
+        figure = self.plot.figure
+        figure.set_size_inches(width / figure.dpi, height / figure.dpi)
+        with instrument.phase('plot'):
+            self.plot.update(session.A, session.b, result.get('x') if result.get('success') else None,
+                             session.c, session.objective_type, list(session.operators),
+                             optimal_points=result.get('optimal_points', []),
+                             region_bounded=bool(result.get('region_bounded', True)),
+                             status=result.get('status', 'optimal'), solver_result=result,
+                             draft=bool(job.get('live')))
+        t2 = time.perf_counter()
+        if not self.is_current(generation):
+            return None
+        with instrument.phase('draw'):
+            self.plot.draw()
+        t3 = time.perf_counter()
+
+        # Copie du tampon RGBA : le QImage ne doit pas dépendre de la mémoire du rendu suivant
+        with instrument.phase('image'):
+            w, h = figure.canvas.get_width_height()
+            image = QImage(bytes(figure.canvas.buffer_rgba()), w, h, 4 * w, QImage.Format_RGBA8888).copy()
+        t4 = time.perf_counter()
+        # Latence de chaque étape (ms) : résolution, mise à jour des artistes, rendu Agg, copie de l'image
+        timings = {'solve': 1000 * (t1 - t0), 'plot': 1000 * (t2 - t1),
+                   'draw': 1000 * (t3 - t2), 'image': 1000 * (t4 - t3)}
+        return {'result': result, 'changes': dict(session.changes), 'image': image,
+                'timings': timings, 'live': bool(job.get('live')), 'settle': bool(job.get('settle')),
+                'c': session.c.tolist(), 'A': session.A.tolist(), 'b': session.b.tolist(),
+                'operators': list(session.operators), 'objective_type': session.objective_type,
+                # Région non modifiée en place (chaque mise à jour en crée une nouvelle) : partageable
+                'region': session.region}
+
+
+class RobustnessWorker(QThread):
+    """Thread d'analyse de robustesse : tirages Monte Carlo résolus par lots, puis figure
+    (région et nuage des optima) rendue dans un QImage remis à l'interface."""
+    analysed = Signal(int, object)
+    error = Signal(int, str)
+
+    def __init__(self, generation, problem, result, options, size, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.problem = problem
+        self.result = result
+        self.options = options
+        self.size = size
+
+    def run(self):
+        try:
+            p, result = self.problem, self.result
+            robustness = monte_carlo(p['c'], p['A'], p['b'], p['operators'], p['objective_type'],
+                                     seed=0, **self.options)
+            fig = create_plot(p['A'], p['b'], result.get('x') if result.get('success') else None,
+                              p['c'], p['objective_type'], p['operators'],
+                              optimal_points=result.get('optimal_points', []),
+                              region_bounded=bool(result.get('region_bounded', True)),
+                              status=result.get('status', 'optimal'), solver_result=result,
+                              robustness=robustness)
+            width, height = self.size
+            fig.set_size_inches(width / fig.dpi, height / fig.dpi)
+            fig.tight_layout()
+            fig.canvas.draw()
+            w, h = fig.canvas.get_width_height()
+            image = QImage(bytes(fig.canvas.buffer_rgba()), w, h, 4 * w, QImage.Format_RGBA8888).copy()
+        except Exception as e:
+            self.error.emit(self.generation, str(e))
+            return
+        self.analysed.emit(self.generation, {'robustness': robustness, 'image': image})
+
+
+class PlotView(QLabel):
+    """Affiche la dernière image rendue, remise à l'échelle quand le widget change de taille."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._image = None
+        self.setAlignment(Qt.AlignCenter)
+        self.setMinimumSize(450, 350)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def set_image(self, image):
+        self._image = image
+        self._refresh()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._refresh()
+
+    def _refresh(self):
+        if self._image is None:
+            return
+        pixmap = QPixmap.fromImage(self._image)
+        if pixmap.width() > self.width() or pixmap.height() > self.height():
+            pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.setPixmap(pixmap)
+
+
 class APIKeyDialog(QDialog):
     """Dialog pour entrer l'API Key"""
     def __init__(self, parent=None, current_key=""):
@@ -141,10 +330,42 @@ class MainWindow(QMainWindow):
         
         self.constraints = []
         self.result = None
-        self.current_fig = None
+        # Instantané du problème du dernier rendu affiché, lu par les analyses et l'export PDF
+        self.problem = None
+        self.graph_card = None
         self.input_mode = 'standard'  # 'standard' ou 'ai'
         self.llm_extractor = LLMExtractor()
         self.llm_worker = None
+        # Analyse de robustesse en cours ; un résultat d'une génération antérieure (carte reconstruite) est ignoré
+        self.mc_worker = None
+        self.mc_generation = 0
+        # Cache des résolutions (taille et persistance configurables via .env)
+        self.solve_cache = configure_cache(
+            maxsize=int(os.getenv('SOLVEUR_CACHE_SIZE', '256')),
+            path=os.getenv('SOLVEUR_CACHE_PATH') or None
+        )
+        # Session incrémentale : ajout/retrait/modification d'une seule contrainte sans tout recalculer
+        self.session = SolverSession(cache=self.solve_cache)
+        # Résolution et rendu hors du thread de l'interface : une seule figure persistante (Agg)
+        self.render_worker = RenderWorker(self.session)
+        self.render_worker.rendered.connect(self.on_render_finished)
+        self.render_worker.error.connect(self.on_render_error)
+        self.render_worker.start()
+        self.render_generation = 0
+        # Mode direct : résolution différée à chaque frappe, cartes reconstruites une fois la saisie posée
+        self.live_mode = False
+        self.live_edit_time = None
+        self.live_payload = None
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self.live_timer.timeout.connect(self.live_solve)
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(LIVE_SETTLE_MS)
+        self.settle_timer.timeout.connect(self.settle_live_results)
+        # Chronométrage détaillé par phase et compteurs, affichés dans la barre d'état
+        instrument.enable(os.getenv('SOLVEUR_PROFILE', '0').lower() in ('1', 'true', 'yes', 'on'))
         
         self.init_ui()
     
@@ -160,6 +381,14 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(left_panel, 50)
         main_layout.addWidget(right_panel, 50)
+
+        # Barre d'état : latence du dernier rendu, et profil par phase si SOLVEUR_PROFILE est actif
+        self.profile_label = QLabel()
+        self.profile_label.setFont(QFont("Consolas", 9))
+        self.profile_label.setStyleSheet("color: rgba(252,203,121,0.7); padding: 0 8px;")
+        self.statusBar().setStyleSheet("QStatusBar { background: rgba(11,59,54,0.9); }"
+                                       "QStatusBar::item { border: none; }")
+        self.statusBar().addWidget(self.profile_label, 1)
     
     def create_input_panel(self):
         panel = QFrame()
@@ -343,6 +572,10 @@ class MainWindow(QMainWindow):
         self.c2_input.setFixedSize(90, 50)
         self.c2_input.setAlignment(Qt.AlignCenter)
         self.c2_input.setFont(QFont("Arial", 14, QFont.Bold))
+        self.c1_input.editingFinished.connect(self.on_objective_changed)
+        self.c2_input.editingFinished.connect(self.on_objective_changed)
+        self.c1_input.textEdited.connect(self.on_input_edited)
+        self.c2_input.textEdited.connect(self.on_input_edited)
         
         label_x1 = QLabel("x₁  +")
         label_x1.setFont(QFont("Arial", 14))
@@ -431,6 +664,28 @@ class MainWindow(QMainWindow):
         """)
         btn_solve.clicked.connect(self.solve_problem)
         input_layout.addWidget(btn_solve)
+
+        self.btn_live = QPushButton("⚡ MODE DIRECT")
+        self.btn_live.setCheckable(True)
+        self.btn_live.setMinimumHeight(45)
+        self.btn_live.setFont(QFont("Arial", 13, QFont.Bold))
+        self.btn_live.setCursor(Qt.PointingHandCursor)
+        self.btn_live.setToolTip("Résoudre et tracer automatiquement pendant la saisie")
+        self.btn_live.setStyleSheet("""
+            QPushButton {
+                background: rgba(73, 115, 113, 0.5);
+                color: rgba(252, 203, 121, 0.8);
+                border: 2px solid rgba(73, 115, 113, 0.8);
+                border-radius: 15px;
+            }
+            QPushButton:checked {
+                background: rgba(252, 203, 121, 0.25);
+                color: #FCCB79;
+                border: 2px solid #FCCB79;
+            }
+        """)
+        self.btn_live.toggled.connect(self.set_live_mode)
+        input_layout.addWidget(self.btn_live)
         
         return container
     
@@ -621,7 +876,7 @@ class MainWindow(QMainWindow):
         
         # Remplir l'interface standard avec les données extraites
         self.objective_type = result['objective_type']
-        self.set_objective_type(result['objective_type'])
+        self.set_objective_type(result['objective_type'], refresh=False)
         
         self.c1_input.setText(str(result['c'][0]))
         self.c2_input.setText(str(result['c'][1]))
@@ -740,7 +995,7 @@ class MainWindow(QMainWindow):
         
         return panel
     
-    def set_objective_type(self, obj_type):
+    def set_objective_type(self, obj_type, refresh=True):
         self.objective_type = obj_type
         if obj_type == 'max':
             self.btn_max.setStyleSheet("""
@@ -790,6 +1045,20 @@ class MainWindow(QMainWindow):
                     color: #FCCB79;
                 }
             """)
+        if refresh:
+            self.on_objective_changed()
+
+    def on_objective_changed(self):
+        # Objectif seul modifié : argmax sur les sommets déjà calculés, la région n'est pas reconstruite
+        if self.result is None:
+            return
+        try:
+            c = [float(self.c1_input.text()), float(self.c2_input.text())]
+        except ValueError:
+            return
+        self.render_generation = self.render_worker.submit({
+            'c': c, 'objective_type': self.objective_type, 'objective_only': True,
+            'size': self.plot_size()})
     
     def add_constraint(self, a="", b="", op="<=", c=""):
         constraint_widget = QFrame()
@@ -850,6 +1119,9 @@ class MainWindow(QMainWindow):
             }
         """)
         btn_remove.clicked.connect(lambda: self.remove_constraint(constraint_widget))
+        for line_edit in (a_input, b_input, c_input):
+            line_edit.textEdited.connect(self.on_input_edited)
+        op_combo.activated.connect(self.on_input_edited)
         
         constraint_layout.addWidget(a_input)
         constraint_layout.addWidget(label1)
@@ -872,41 +1144,141 @@ class MainWindow(QMainWindow):
         if len(self.constraints) > 1:
             self.constraints = [c for c in self.constraints if c['widget'] != widget]
             widget.deleteLater()
+            self.on_input_edited()
     
+    def read_inputs(self):
+        # Problème saisi (c, A, b, operators) ; ValueError si un champ n'est pas un nombre
+        c = [float(self.c1_input.text()), float(self.c2_input.text())]
+        A = []
+        b = []
+        operators = []
+        
+        reverse_map = {"≤": "<=", "≥": ">=", "=": "="}
+        
+        for constraint in self.constraints:
+            A.append([float(constraint['a'].text()), float(constraint['b'].text())])
+            b.append(float(constraint['c'].text()))
+            symbol = constraint['op'].currentText()
+            operators.append(reverse_map.get(symbol, "<="))
+        return c, A, b, operators
+
     def solve_problem(self):
         try:
-            c = [float(self.c1_input.text()), float(self.c2_input.text())]
-            A = []
-            b = []
-            operators = []
-            
-            reverse_map = {"≤": "<=", "≥": ">=", "=": "="}
-            
-            for constraint in self.constraints:
-                A.append([float(constraint['a'].text()), float(constraint['b'].text())])
-                b.append(float(constraint['c'].text()))
-                symbol = constraint['op'].currentText()
-                operators.append(reverse_map.get(symbol, "<="))
+            c, A, b, operators = self.read_inputs()
             
             if not validate_inputs(c, A, b):
                 QMessageBox.warning(self, "Erreur", "Vérifiez vos entrées")
                 return
  
-            self.result = solve_linear_program(c, A, b, operators, self.objective_type) 
-            print("DEBUG solve_linear_program_result=",self.result)
-            self.display_results(self.result, c, A, b, operators)
+            # Résolution et graphique dans le thread de rendu ; le résultat revient par on_render_finished
+            self.render_generation = self.render_worker.submit({
+                'c': c, 'A': A, 'b': b, 'operators': operators,
+                'objective_type': self.objective_type, 'size': self.plot_size()})
              
         except ValueError:
             QMessageBox.critical(self, "Erreur", "Entrez des nombres valides")
         except Exception as e:
             QMessageBox.critical(self, "Erreur", f"Erreur: {str(e)}")
-    
-  
 
-    def display_results(self, result, c, A, b, operators):
+    def plot_size(self):
+        # Taille du rendu en pixels : celle de la vue si elle existe, sinon la largeur du panneau de résultats
+        if self.graph_card is not None and self.plot_view.width() > 0:
+            width = self.plot_view.width()
+        else:
+            width = max(450, self.result_layout.parentWidget().width() - 80)
+        return width, max(350, int(width * 0.7))
+
+    def on_render_finished(self, generation, payload):
+        if generation != self.render_generation:
+            return
+        self.result = payload['result']
+        self.problem = {key: payload[key] for key in ('c', 'A', 'b', 'operators', 'objective_type', 'region')}
+        shown = time.perf_counter()
+        if payload['live'] and self.graph_card is not None:
+            # Mode direct : brouillon affiché tout de suite, rendu complet et cartes quand la saisie se pose
+            self.plot_view.set_image(payload['image'])
+            self.live_payload = payload
+            self.settle_timer.start()
+        elif payload['changes'].get('kind') == 'none' and self.graph_card is not None and not payload['settle']:
+            # Rien n'a changé dans le problème : seule l'image (taille) est rafraîchie
+            self.plot_view.set_image(payload['image'])
+        else:
+            self.live_payload = None
+            self.display_results(self.result, payload['c'], payload['A'], payload['b'],
+                                 payload['operators'], image=payload['image'])
+        self.show_latency(payload, 1000 * (time.perf_counter() - shown))
+
+    def show_latency(self, payload, display_ms):
+        # Latence par étape du dernier rendu (ms), et depuis la dernière frappe en mode direct
+        timings = payload['timings']
+        parts = [f"résolution {timings['solve']:.1f}", f"tracé {timings['plot']:.1f}",
+                 f"rendu {timings['draw']:.1f}", f"image {timings['image']:.1f}",
+                 f"affichage {display_ms:.1f}"]
+        text = "⏱ " + " · ".join(parts) + " ms"
+        if payload['live'] and self.live_edit_time is not None:
+            text += f"  —  {1000 * (time.perf_counter() - self.live_edit_time):.0f} ms depuis la frappe"
+        self.latency_label.setText(text)
+        self.latency_label.setVisible(self.live_mode)
+        self.show_profile(payload, display_ms)
+
+    def show_profile(self, payload, display_ms):
+        # Barre d'état : statut et latence totale ; phases (temps propre) et compteurs si le profil est actif
+        result, timings = payload['result'], payload['timings']
+        text = f"{result.get('status', '?')} · {sum(timings.values()) + display_ms:.1f} ms"
+        profile = payload.get('profile')
+        if profile:
+            phases = sorted(profile['phases'].items(), key=lambda kv: -kv[1])
+            text += "  —  " + " · ".join(f"{name} {ms:.1f}" for name, ms in phases if ms >= 0.05) + " ms"
+            if profile['counters']:
+                text += "  —  " + " · ".join(f"{name}={n}" for name, n in sorted(profile['counters'].items()))
+        self.profile_label.setText(text)
+
+    def set_live_mode(self, enabled):
+        self.live_mode = enabled
+        if self.graph_card is not None:
+            self.latency_label.setVisible(enabled)
+        if enabled:
+            self.live_solve()
+        else:
+            self.live_timer.stop()
+
+    def on_input_edited(self, *_):
+        # Entrée modifiée : le rendu en cours décrit un problème périmé
+        self.render_worker.cancel()
+        if self.live_mode:
+            self.live_edit_time = time.perf_counter()
+            self.settle_timer.stop()
+            self.live_timer.start()
+
+    def live_solve(self):
+        # Saisie incomplète ou invalide (champ vide, "-", ...) : on attend la frappe suivante, sans message
+        try:
+            c, A, b, operators = self.read_inputs()
+        except ValueError:
+            return
+        if not validate_inputs(c, A, b):
+            return
+        self.render_generation = self.render_worker.submit({
+            'c': c, 'A': A, 'b': b, 'operators': operators, 'objective_type': self.objective_type,
+            'size': self.plot_size(), 'live': self.graph_card is not None})
+
+    def settle_live_results(self):
+        # Saisie posée : même problème (la session n'a rien à recalculer), rendu complet et cartes
+        payload, self.live_payload = self.live_payload, None
+        if payload is None or payload['result'] is not self.result:
+            return
+        self.render_generation = self.render_worker.submit({
+            'c': payload['c'], 'A': payload['A'], 'b': payload['b'], 'operators': payload['operators'],
+            'objective_type': payload['result']['objective_type'], 'size': self.plot_size(), 'settle': True})
+
+    def on_render_error(self, generation, error_msg):
+        if generation == self.render_generation:
+            QMessageBox.critical(self, "Erreur", f"Erreur: {error_msg}")
+
+    def display_results(self, result, c, A, b, operators, image=None):
         while self.result_layout.count():
             item = self.result_layout.takeAt(0)
-            if item.widget():
+            if item.widget() and item.widget() is not self.graph_card:
                 item.widget().deleteLater()
 
         status = result.get('status', 'optimal')
@@ -1069,99 +1441,330 @@ class MainWindow(QMainWindow):
 
         self.result_layout.addWidget(solution_card)
 
+        if has_valid_solution and result.get('sensitivity'):
+            self.result_layout.addWidget(self.create_sensitivity_card(result['sensitivity']))
+
         # ========= Graph =========
-        graph_card = QFrame()
-        graph_card.setStyleSheet("""
-            QFrame {
-                background: rgba(11, 59, 54, 0.5);
-                border: 2px solid rgba(252, 203, 121, 0.3);
-                border-radius: 20px;
-                padding: 20px;
-            }
-        """)
-        graph_layout = QVBoxLayout(graph_card)
+        # Carte créée une fois : la vue garde sa taille d'une résolution à l'autre, le fond
+        # de la figure (hors optimum) reste réutilisable par blitting
+        if self.graph_card is None:
+            self.create_graph_card()
+        graph_title = self.graph_title
 
         # Titre du graphique adapté
         if status == 'infeasible':
-            graph_title = QLabel("📈 Contraintes Incompatibles (Région vide)")
+            graph_title.setText("📈 Contraintes Incompatibles (Région vide)")
             graph_title.setStyleSheet("color: #ff6b6b;")
         elif status == 'unbounded':
-            graph_title = QLabel("📈 Région Non Bornée - Pas de Solution Finie")
+            graph_title.setText("📈 Région Non Bornée - Pas de Solution Finie")
             graph_title.setStyleSheet("color: #FFA500;")
         elif not region_bounded and recession_direction is not None:
-            graph_title = QLabel("📈 Solutions Infinies - Région Non Bornée")
+            graph_title.setText("📈 Solutions Infinies - Région Non Bornée")
             graph_title.setStyleSheet("color: #32CD32;")
         elif solution_type == 'infinite_edge' and optimal_points and len(optimal_points) >= 2:
-            graph_title = QLabel("📈 Solutions Infinies - Région Bornée")
+            graph_title.setText("📈 Solutions Infinies - Région Bornée")
             graph_title.setStyleSheet("color: #FFD700;")
         elif not region_bounded:
-            graph_title = QLabel("📈 Solution Optimale - Région Non Bornée")
+            graph_title.setText("📈 Solution Optimale - Région Non Bornée")
             graph_title.setStyleSheet("color: #4CAF50;")
         else:
-            graph_title = QLabel("📈 Région Bornée - Zone Faisable")
+            graph_title.setText("📈 Région Bornée - Zone Faisable")
             graph_title.setStyleSheet("color: #4CAF50;")
 
-        graph_title.setFont(QFont("Arial", 16, QFont.Bold)) 
+        # Image rendue par le thread de rendu (figure Agg persistante)
+        if image is not None:
+            self.graph_error.hide()
+            self.plot_view.show()
+            self.plot_view.set_image(image)
+        else:
+            self.plot_view.hide()
+            self.graph_error.setText("⚠️ Erreur graphique:\naucun rendu disponible")
+            self.graph_error.show()
+
+        self.result_layout.addWidget(self.graph_card)
+        if status in ('optimal', 'infeasible', 'unbounded'):
+            self.result_layout.addWidget(self.create_parametric_card(len(b)))
+            self.result_layout.addWidget(self.create_robustness_card())
+        self.result_layout.addStretch()
+
+        self.btn_export.setEnabled(has_valid_solution)
+    
+    def create_graph_card(self):
+        # Carte du graphique principal : titre, image rendue par RenderWorker et message d'erreur éventuel
+        self.graph_card = QFrame()
+        self.graph_card.setStyleSheet("""
+            QFrame {
+                background: rgba(11, 59, 54, 0.5);
+                border: 2px solid rgba(252, 203, 121, 0.3);
+                border-radius: 20px;
+                padding: 20px;
+            }
+        """)
+        graph_layout = QVBoxLayout(self.graph_card)
+
+        self.graph_title = QLabel()
+        self.graph_title.setFont(QFont("Arial", 16, QFont.Bold)) 
         title_layout = QHBoxLayout()
         title_layout.addStretch(1)
-        title_layout.addWidget(graph_title)
+        title_layout.addWidget(self.graph_title)
         title_layout.addStretch(1) 
         graph_layout.addLayout(title_layout)
 
-        try:
-            operators_for_plot = operators
-            optimal_point = x_sol if has_valid_solution else None
-
-            fig = create_plot(
-                A, b, optimal_point, c, objective_type,
-                operators_for_plot,
-                optimal_points=optimal_points,
-                region_bounded=region_bounded,
-                status=status,
-                solver_result=result
-            )
+        self.latency_label = QLabel()
+        self.latency_label.setAlignment(Qt.AlignCenter)
+        self.latency_label.setFont(QFont("Consolas", 10))
+        self.latency_label.setStyleSheet("color: rgba(252,203,121,0.7); border: none; padding: 0;")
+        self.latency_label.setVisible(self.live_mode)
+        graph_layout.addWidget(self.latency_label)
+
+        self.plot_view = PlotView()
+        graph_layout.addWidget(self.plot_view)
+
+        self.graph_error = QLabel()
+        self.graph_error.setAlignment(Qt.AlignCenter)
+        self.graph_error.setFont(QFont("Arial", 12))
+        self.graph_error.setStyleSheet("color: #ff6b6b; padding: 20px;")
+        self.graph_error.setWordWrap(True)
+        self.graph_error.hide()
+        graph_layout.addWidget(self.graph_error)
+
+    def create_analysis_card(self, title_text):
+        # Cadre commun des cartes d'analyse (sensibilité, balayage, robustesse)
+        card = QFrame()
+        card.setStyleSheet("""
+            QFrame {
+                background: rgba(11, 59, 54, 0.7);
+                border: 2px solid rgba(252, 203, 121, 0.5);
+                border-radius: 20px;
+                padding: 20px;
+            }
+        """)
+        layout = QVBoxLayout(card)
+        title = QLabel(title_text)
+        title.setFont(QFont("Arial", 14, QFont.Bold))
+        title.setStyleSheet("color: #FCCB79; border: none; padding: 0;")
+        layout.addWidget(title)
+        return card, layout
+
+    def create_analysis_button(self, text, slot):
+        button = QPushButton(text)
+        button.setCursor(Qt.PointingHandCursor)
+        button.setFont(QFont("Arial", 12, QFont.Bold))
+        button.setStyleSheet("""
+            QPushButton {
+                background: #497371;
+                color: #FCCB79;
+                border: 2px solid #FCCB79;
+                border-radius: 10px;
+                padding: 10px 18px;
+            }
+            QPushButton:hover { background: #5a8785; }
+        """)
+        button.clicked.connect(slot)
+        return button
+
+    def create_sensitivity_card(self, sensitivity, max_rows=50):
+        # Carte Sensibilité : prix dual, écart et intervalle de b par contrainte, intervalles de c1 / c2
+        card, layout = self.create_analysis_card("📈 ANALYSE DE SENSIBILITÉ")
+
+        def fmt(v):
+            return "+∞" if v == float('inf') else "-∞" if v == float('-inf') else f"{v:.4f}"
+
+
+        rows = list(zip(sensitivity['duals'], sensitivity['slacks'], sensitivity['rhs_ranges']))
+        lines = [f"C{i + 1} : dual = {dual:.4f}   écart = {slack:.4f}   b ∈ [{fmt(lo)} ; {fmt(hi)}]"
+                 for i, (dual, slack, (lo, hi)) in enumerate(rows[:max_rows])]
+        if len(rows) > max_rows:
+            lines.append(f"… {len(rows) - max_rows} autres contraintes (voir le PDF)")
+        lines.append("")
+        lines.extend(f"c{j + 1} ∈ [{fmt(lo)} ; {fmt(hi)}]"
+                     for j, (lo, hi) in enumerate(sensitivity['objective_ranges']))
+
+        body = QLabel("\n".join(lines))
+        body.setFont(QFont("Consolas", 11))
+        body.setWordWrap(True)
+        body.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        body.setStyleSheet("color: rgba(252,203,121,0.9); border: none; padding: 0;")
+        layout.addWidget(body)
+        return card
+
+    def create_parametric_card(self, n_constraints):
+        # Carte Balayage : un paramètre (b_i ou c_j) varie sur [θ min, θ max], courbe z(θ) exacte
+        card, layout = self.create_analysis_card("📉 BALAYAGE PARAMÉTRIQUE")
+
+        controls = QHBoxLayout()
+        self.param_combo = QComboBox()
+        for i in range(n_constraints):
+            self.param_combo.addItem(f"b{i + 1}", ('rhs', i))
+        for j in range(2):
+            self.param_combo.addItem(f"c{j + 1}", ('objective', j))
+        self.param_min_input = QLineEdit()
+        self.param_min_input.setPlaceholderText("θ min")
+        self.param_max_input = QLineEdit()
+        self.param_max_input.setPlaceholderText("θ max")
+        btn_sweep = self.create_analysis_button("TRACER", self.run_parametric)
+        self.param_combo.currentIndexChanged.connect(self.on_parametric_param_changed)
+        for widget in (self.param_combo, self.param_min_input, self.param_max_input, btn_sweep):
+            controls.addWidget(widget)
+        layout.addLayout(controls)
+
+        self.param_plot_layout = QVBoxLayout()
+        layout.addLayout(self.param_plot_layout)
+        self.on_parametric_param_changed()
+        return card
+
+    def on_parametric_param_changed(self):
+        # Intervalle proposé autour de la valeur actuelle du paramètre
+        parameter, index = self.param_combo.currentData()
+        values = self.problem['b'] if parameter == 'rhs' else self.problem['c']
+        if index >= len(values):
+            return
+        value = float(values[index])
+        span = max(abs(value), 1.0)
+        self.param_min_input.setText(f"{value - span:g}")
+        self.param_max_input.setText(f"{value + span:g}")
 
-            canvas = FigureCanvas(fig)
-            canvas.setMinimumSize(450, 350)
-            canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            graph_layout.addWidget(canvas)
-            canvas.draw()
-            canvas.updateGeometry()
-            self.current_fig = fig
+    def run_parametric(self):
+        try:
+            theta_min = float(self.param_min_input.text())
+            theta_max = float(self.param_max_input.text())
+            parameter, index = self.param_combo.currentData()
+            # Optimiseur propre à l'interface, sur la région déjà construite par le thread de rendu
+            p = self.problem
+            optimizer = LinearProgrammingOptimizer(p['c'], p['A'], p['b'], p['operators'], p['objective_type'],
+                                                   backend='region', region=p['region'])
+            analysis = optimizer.parametric_analysis(parameter, index, theta_min, theta_max)
+        except ValueError as e:
+            QMessageBox.warning(self, "Erreur", f"Balayage impossible:\n{str(e)}")
+            return
         except Exception as e:
-            error_label = QLabel(f"⚠️ Erreur graphique:\n{str(e)}")
-            error_label.setAlignment(Qt.AlignCenter)
-            error_label.setFont(QFont("Arial", 12))
-            error_label.setStyleSheet("color: #ff6b6b; padding: 20px;")
-            error_label.setWordWrap(True)
-            graph_layout.addWidget(error_label) 
-
-        self.result_layout.addWidget(graph_card)
-        self.result_layout.addStretch()
+            QMessageBox.critical(self, "Erreur", f"Erreur: {str(e)}")
+            return
+
+        while self.param_plot_layout.count():
+            item = self.param_plot_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        fig = create_parametric_plot(analysis, p['objective_type'])
+        canvas = FigureCanvas(fig)
+        canvas.setMinimumSize(450, 350)
+        canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.param_plot_layout.addWidget(canvas)
+        canvas.draw()
+
+    def create_robustness_card(self):
+        # Carte Robustesse : N tirages de c, A, b perturbés (tolérance relative), résolus par lots
+        card, layout = self.create_analysis_card("🎲 ROBUSTESSE (MONTE CARLO)")
+
+        controls = QHBoxLayout()
+        self.mc_samples_input = QLineEdit("10000")
+        self.mc_samples_input.setPlaceholderText("N tirages")
+        self.mc_tolerance_input = QLineEdit("5")
+        self.mc_tolerance_input.setPlaceholderText("Tolérance (%)")
+        self.mc_distribution_combo = QComboBox()
+        self.mc_distribution_combo.addItem("Uniforme", 'uniform')
+        self.mc_distribution_combo.addItem("Normale", 'normal')
+        btn_run = self.create_analysis_button("ANALYSER", self.run_robustness)
+        for widget in (self.mc_samples_input, self.mc_tolerance_input, self.mc_distribution_combo, btn_run):
+            controls.addWidget(widget)
+        layout.addLayout(controls)
+
+        self.mc_result_layout = QVBoxLayout()
+        layout.addLayout(self.mc_result_layout)
+        self.mc_generation += 1
+        return card
+
+    def clear_robustness_results(self):
+        while self.mc_result_layout.count():
+            item = self.mc_result_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+
+    def run_robustness(self):
+        if self.mc_worker is not None and self.mc_worker.isRunning() and self.mc_worker.generation == self.mc_generation:
+            return  # analyse déjà en cours pour cette carte
+        try:
+            options = {'n_samples': int(self.mc_samples_input.text()),
+                       'tolerance': float(self.mc_tolerance_input.text().replace('%', '')) / 100.0,
+                       'distribution': self.mc_distribution_combo.currentData()}
+        except ValueError as e:
+            QMessageBox.warning(self, "Erreur", f"Analyse impossible:\n{str(e)}")
+            return
+
+        # Tirages, résolution par lots et rendu dans un thread ; instantané du dernier rendu affiché
+        self.clear_robustness_results()
+        pending = QLabel("⏳ Analyse en cours…")
+        pending.setFont(QFont("Consolas", 11))
+        pending.setStyleSheet("color: rgba(252,203,121,0.9); border: none; padding: 0;")
+        self.mc_result_layout.addWidget(pending)
+        if self.mc_worker is not None and not self.mc_worker.isRunning():
+            self.mc_worker.deleteLater()
+        self.mc_worker = RobustnessWorker(self.mc_generation, self.problem, self.result or {}, options,
+                                          self.plot_size(), parent=self)
+        self.mc_worker.analysed.connect(self.on_robustness_finished)
+        self.mc_worker.error.connect(self.on_robustness_error)
+        self.mc_worker.start()
+
+    def on_robustness_error(self, generation, message):
+        if generation != self.mc_generation:
+            return
+        self.clear_robustness_results()
+        QMessageBox.warning(self, "Erreur", f"Analyse impossible:\n{message}")
+
+    def on_robustness_finished(self, generation, payload):
+        if generation != self.mc_generation:
+            return
+        self.clear_robustness_results()
+        robustness = payload['robustness']
+        lines = [f"P(admissible) = {100 * robustness['feasible_probability']:.1f}%   "
+                 f"P(optimum fini) = {100 * robustness['optimal_probability']:.1f}%"]
+        if robustness['z_quantiles']:
+            lines.append("Z : " + "   ".join(f"q{int(round(100 * q))} = {v:.4f}"
+                                             for q, v in robustness['z_quantiles'].items()))
+        names = {-1: "x₁=0", -2: "x₂=0"}
+        for vertex in robustness['vertices'][:5]:
+            basis = " ∩ ".join(names.get(lab, f"C{lab + 1}") for lab in vertex['basis'])
+            lines.append(f"Sommet {basis} ≈ ({vertex['mean_x'][0]:.3f}, {vertex['mean_x'][1]:.3f}) : "
+                         f"optimal dans {100 * vertex['frequency']:.1f}% des tirages")
+        body = QLabel("\n".join(lines))
+        body.setFont(QFont("Consolas", 11))
+        body.setWordWrap(True)
+        body.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        body.setStyleSheet("color: rgba(252,203,121,0.9); border: none; padding: 0;")
+        self.mc_result_layout.addWidget(body)
+
+        view = PlotView()
+        view.set_image(payload['image'])
+        self.mc_result_layout.addWidget(view)
 
-        self.btn_export.setEnabled(has_valid_solution)
-    
     def export_pdf(self):
-        if self.result and self.current_fig:
+        if self.result and self.problem:
             try:
-                c = [float(self.c1_input.text()), float(self.c2_input.text())]
-                A = []
-                b = []
-                operators = []
-                
-                reverse_map = {"≤": "<=", "≥": ">=", "=": "="}
-                
-                for constraint in self.constraints:
-                    A.append([float(constraint['a'].text()), float(constraint['b'].text())])
-                    b.append(float(constraint['c'].text()))
-                    operators.append(reverse_map.get(constraint['op'].currentText(), "<="))
+                # Problème du résultat affiché, et une figure à part : la figure du thread de rendu
+                # peut être redessinée pendant l'export
+                p, result = self.problem, self.result
+                fig = create_plot(p['A'], p['b'], result.get('x') if result.get('success') else None,
+                                  p['c'], p['objective_type'], p['operators'],
+                                  optimal_points=result.get('optimal_points', []),
+                                  region_bounded=bool(result.get('region_bounded', True)),
+                                  status=result.get('status', 'optimal'), solver_result=result)
                 
                 # Générer le PDF avec le module pdf_export
-                pdf_path = generate_pdf(self.result, c, A, b, operators, 
-                                       self.objective_type, self.current_fig)
+                pdf_path = generate_pdf(result, p['c'], p['A'], p['b'], p['operators'],
+                                        p['objective_type'], fig)
                 
                 if os.path.exists(pdf_path):
                     os.startfile(pdf_path)
                     
             except Exception as e:
-                QMessageBox.critical(self, "Erreur", f"Erreur PDF: {str(e)}")
\ No newline at end of file
+                QMessageBox.critical(self, "Erreur", f"Erreur PDF: {str(e)}")
+
+    def closeEvent(self, event):
+        self.render_worker.stop()
+        if self.mc_worker is not None:
+            self.mc_worker.wait()
+        try:
+            self.solve_cache.save()
+        except OSError:
+            pass
+        super().closeEvent(event)
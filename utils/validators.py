@@ -1,3 +1,6 @@
+import math
+
+
 def validate_inputs(c, A, b):
     """
     Valide les entrées
@@ -18,3 +21,36 @@ def validate_inputs(c, A, b):
     except:
         return False
 
+
+
+def validate_problem(problem):
+    """
+    Valide un problème au format de LLMExtractor
+    ({'objective_type', 'c': [c1, c2], 'constraints': [{'a', 'b', 'op', 'c'}]}).
+    Retourne None s'il est valide, sinon le message d'erreur
+    """
+    if not isinstance(problem, dict):
+        return "Le problème doit être un objet JSON"
+    if problem.get("objective_type", "max") not in ("max", "min"):
+        return "objective_type invalide"
+    c = problem.get("c")
+    if not isinstance(c, (list, tuple)) or len(c) != 2:
+        return "'c' doit contenir 2 coefficients"
+    constraints = problem.get("constraints")
+    if not isinstance(constraints, list) or len(constraints) == 0:
+        return "'constraints' doit être une liste non vide"
+    for i, cons in enumerate(constraints, start=1):
+        if not isinstance(cons, dict):
+            return f"Contrainte {i} invalide"
+        for key in ("a", "b", "op", "c"):
+            if key not in cons:
+                return f"Contrainte {i} invalide, clé manquante: {key}"
+        if cons["op"] not in ("<=", ">=", "="):
+            return f"Opérateur invalide: {cons['op']}"
+    A = [[cons["a"], cons["b"]] for cons in constraints]
+    b = [cons["c"] for cons in constraints]
+    if not validate_inputs(c, A, b):
+        return "Coefficients non numériques"
+    if not all(math.isfinite(float(v)) for v in [*c, *b, *(v for row in A for v in row)]):
+        return "Coefficients non finis"
+    return None